@@ -11,6 +11,7 @@ from decimal import Decimal
 from typing import Dict, List, Optional
 
 import ccxt.async_support as ccxt
+import msgspec
 from exchanges.binance import BinanceConnector
 from exchanges.coinbase import CoinbaseConnector
 from exchanges.kraken import KrakenConnector
@@ -19,8 +20,10 @@ from processors.orderbook_processor import OrderBookProcessor
 from processors.trade_processor import TradeProcessor
 from storage.timescale_writer import TimescaleWriter
 
+from backend.shared_libs.python.crypto_trading_shared.constants import (
+    RABBITMQ_CONFIRM_BATCH_SIZE, RABBITMQ_PERSISTENCE, RABBITMQ_QUEUES)
 from backend.shared_libs.python.crypto_trading_shared.types import (
-    OHLCVData, OrderBookData)
+    MarketDataUpdate, OHLCVData, OHLCVMsg, OrderBookData)
 
 
 class MarketDataCollector:
@@ -59,6 +62,10 @@ class MarketDataCollector:
         self.orderbook_buffer: List[OrderBookData] = []
         self.trade_buffer: List = []
 
+        # Queue encoding: one msgspec encoder and a reused output buffer
+        self._encoder = msgspec.json.Encoder()
+        self._encode_buffer = bytearray()
+
         self.logger.info("MarketDataCollector initialized")
 
     async def setup(self):
@@ -93,6 +100,8 @@ class MarketDataCollector:
             if not self.exchanges:
                 raise ValueError("No exchanges enabled in configuration")
 
+            await self.writer.setup()
+
             self.logger.info(
                 f"Exchange connectors setup complete ({len(self.exchanges)} exchanges)"
             )
@@ -389,20 +398,31 @@ class MarketDataCollector:
             )
 
             routing_key = f"market.{data_type}.update"
+            timestamp = datetime.now().isoformat()
+            buffer = self._encode_buffer
 
-            # Publish each record
+            # Encode each record as a compact msgspec struct
+            bodies = []
             for record in data:
-                message = {
-                    "type": data_type,
-                    "data": (
-                        record.model_dump() if hasattr(record, "model_dump") else record
-                    ),
-                    "timestamp": datetime.now().isoformat(),
-                }
-
-                await self.mq_client.publish(
-                    exchange=exchange, routing_key=routing_key, message=message
+                payload = (
+                    OHLCVMsg.from_model(record)
+                    if isinstance(record, OHLCVData)
+                    else record
                 )
+                self._encoder.encode_into(
+                    MarketDataUpdate(data_type, payload, timestamp), buffer
+                )
+                bodies.append(bytes(buffer))
+
+            # Market data is replayable: transient unless the queue says otherwise
+            queue = RABBITMQ_QUEUES.get(data_type, "")
+            await self.mq_client.publish_raw_batch(
+                bodies,
+                exchange=exchange,
+                routing_key=routing_key,
+                persistent=RABBITMQ_PERSISTENCE.get(queue, False),
+                confirm_batch=RABBITMQ_CONFIRM_BATCH_SIZE,
+            )
 
         except Exception as e:
             self.logger.error(f"Queue publish error: {e}")
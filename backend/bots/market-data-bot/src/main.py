@@ -218,7 +218,7 @@ class MarketDataBot(BaseBot):
                 # Log health status
                 self.logger.info(
                     f"Health: {health.health_score}/100 | "
-                    f"Status: {health.status.value} | "
+                    f"Status: {health.status} | "
                     f"Processed: {health.messages_processed} | "
                     f"Failed: {health.messages_failed}"
                 )
@@ -291,10 +291,6 @@ class MarketDataBot(BaseBot):
 
     async def get_health(self) -> BotHealthMetrics:
         """Get current health metrics"""
-        uptime = (
-            (datetime.now() - self.started_at).total_seconds() if self.started_at else 0
-        )
-
         # Get collector metrics
         collector_metrics = await self.collector.get_metrics() if self.collector else {}
 
@@ -304,10 +300,8 @@ class MarketDataBot(BaseBot):
             status=self.status,
             started_at=self.started_at or datetime.now(),
             last_heartbeat=datetime.now(),
-            uptime_seconds=int(uptime),
             messages_processed=collector_metrics.get("total_collected", 0),
             messages_failed=collector_metrics.get("total_errors", 0),
-            success_rate=collector_metrics.get("success_rate", 100.0),
             avg_processing_time_ms=collector_metrics.get("avg_latency_ms", 0.0),
             error_count=collector_metrics.get("total_errors", 0),
             health_score=self._calculate_health_score(collector_metrics),
@@ -5,12 +5,14 @@
 # Deception: BOHLCV Data Processor: Validates and processes OHLCV (candlestick) data
 # ============================================
 from datetime import datetime
-from decimal import Decimal
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from backend.shared_libs.python.crypto_trading_shared.constants import \
     VALIDATION_RULES
-from backend.shared_libs.python.crypto_trading_shared.types import OHLCVData
+from backend.shared_libs.python.crypto_trading_shared.types import (
+    OHLCVData, ohlcv_batch_from_models)
 
 
 class OHLCVProcessor:
@@ -95,8 +97,8 @@ class OHLCVProcessor:
 
         # Check price values
         price_rules = VALIDATION_RULES.get("price", {})
-        min_price = Decimal(str(price_rules.get("min_value", 0.000001)))
-        max_price = Decimal(str(price_rules.get("max_value", 1000000)))
+        min_price = float(price_rules.get("min_value", 0.000001))
+        max_price = float(price_rules.get("max_value", 1000000))
 
         for price in [ohlcv.open, ohlcv.high, ohlcv.low, ohlcv.close]:
             if price < min_price or price > max_price:
@@ -196,27 +198,28 @@ class OHLCVProcessor:
             return gaps
 
         try:
-            # Sort by timestamp
-            sorted_data = sorted(ohlcv_list, key=lambda x: x.timestamp)
-
-            for i in range(1, len(sorted_data)):
-                prev = sorted_data[i - 1]
-                curr = sorted_data[i]
-
-                # Calculate expected time difference based on timeframe
-                # This is simplified - should use timeframe-specific logic
-                time_diff = (curr.timestamp - prev.timestamp).total_seconds()
-
-                # If gap is detected (this logic depends on timeframe)
-                if time_diff > 3600:  # More than 1 hour gap (example)
-                    gaps.append(
-                        {
-                            "symbol": curr.symbol,
-                            "start": prev.timestamp,
-                            "end": curr.timestamp,
-                            "duration_seconds": time_diff,
-                        }
-                    )
+            # Sort by timestamp on the packed batch, not the model objects
+            ts = ohlcv_batch_from_models(ohlcv_list)["ts"]
+            order = np.argsort(ts, kind="stable")
+
+            # Calculate expected time difference based on timeframe
+            # This is simplified - should use timeframe-specific logic
+            time_diffs = np.diff(ts[order]) / 1000.0
+
+            # If gap is detected (this logic depends on timeframe)
+            # More than 1 hour gap (example)
+            for i in np.flatnonzero(time_diffs > 3600):
+                prev = ohlcv_list[order[i]]
+                curr = ohlcv_list[order[i + 1]]
+                time_diff = float(time_diffs[i])
+                gaps.append(
+                    {
+                        "symbol": curr.symbol,
+                        "start": prev.timestamp,
+                        "end": curr.timestamp,
+                        "duration_seconds": time_diff,
+                    }
+                )
 
             if gaps:
                 self.logger.info(f"Detected {len(gaps)} gaps in OHLCV data")
@@ -5,26 +5,165 @@
 # Deception: TimescaleDB Writer: Writes market data to TimescaleDB hypertables
 # ============================================
 
+import asyncio
 from datetime import datetime
-from decimal import Decimal
+from operator import itemgetter
 from typing import Dict, List
 
+from backend.shared_libs.python.crypto_trading_shared.constants import (
+    TIMESCALE_HYPERTABLE_CONFIG, TIMESCALE_INDEXES, TIMESCALE_TABLES,
+    TIMESCALE_WRITE_CONFIG, symbol_shard)
 from backend.shared_libs.python.crypto_trading_shared.types import (
     OHLCVData, OrderBookData)
 
+OHLCV_COLUMNS = (
+    "symbol",
+    "timeframe",
+    "timestamp",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "exchange",
+)
+OHLCV_KEY = ("symbol", "timeframe", "timestamp")
+OHLCV_UPDATE_COLUMNS = ("open", "high", "low", "close", "volume")
+
 
 class TimescaleWriter:
     """
     Writes time-series market data to TimescaleDB
     """
 
-    def __init__(self, db_client, logger):
+    def __init__(self, db_client, logger, write_config: Dict = None):
         """Initialize writer"""
         self.db = db_client
         self.logger = logger
+        self.write_config = {**TIMESCALE_WRITE_CONFIG, **(write_config or {})}
+
+        # COPY needs a dedicated connection for the staging table
+        self.use_copy = self.write_config["use_copy"] and hasattr(
+            self.db, "acquire"
+        )
+        # Concurrent COPY streams over disjoint symbol sets (pool connections)
+        self.parallel_writers = (
+            max(1, self.write_config["parallel_writers"]) if self.use_copy else 1
+        )
 
         self.logger.info("TimescaleWriter initialized")
 
+    async def setup(self):
+        """Apply hypertable storage settings and indexes; safe on every start"""
+        await self.configure_hypertables()
+        await self.create_indexes()
+
+    async def configure_hypertables(self):
+        """
+        Apply chunk sizing and compression policies from
+        TIMESCALE_HYPERTABLE_CONFIG. A table that fails is logged and
+        skipped, so collection still starts.
+        """
+        for table, spec in TIMESCALE_HYPERTABLE_CONFIG.items():
+            try:
+                compression_enabled = await self.db.fetchval(
+                    "SELECT compression_enabled "
+                    "FROM timescaledb_information.hypertables "
+                    "WHERE hypertable_name = $1",
+                    table,
+                )
+                if compression_enabled is None:
+                    self.logger.warning(f"{table} is not a hypertable, skipped")
+                    continue
+
+                await self.db.execute(
+                    "SELECT set_chunk_time_interval($1::text::regclass, "
+                    "$2::text::interval)",
+                    table,
+                    spec["chunk_time_interval"],
+                )
+                # Compression settings can't be altered once chunks are
+                # compressed, so they are only set the first time
+                if not compression_enabled:
+                    await self.db.execute(
+                        f"""
+                        ALTER TABLE {table} SET (
+                            timescaledb.compress,
+                            timescaledb.compress_segmentby = '{spec["segment_by"]}',
+                            timescaledb.compress_orderby = '{spec["order_by"]}'
+                        )
+                        """
+                    )
+                await self.db.execute(
+                    "SELECT add_compression_policy($1::text::regclass, "
+                    "$2::text::interval, if_not_exists => TRUE)",
+                    table,
+                    spec["compress_after"],
+                )
+                self.logger.info(f"Configured hypertable {table}")
+
+            except Exception as e:
+                self.logger.warning(f"Could not configure hypertable {table}: {e}")
+
+    async def create_indexes(self):
+        """
+        Create the composite indexes in TIMESCALE_INDEXES (IF NOT EXISTS).
+        An index that fails is logged and skipped.
+        """
+        for name, ddl in TIMESCALE_INDEXES.items():
+            try:
+                await self.db.execute(ddl)
+                self.logger.info(f"Ensured index {name}")
+            except Exception as e:
+                self.logger.warning(f"Could not create index {name}: {e}")
+
+    async def _copy_upsert(
+        self,
+        table: str,
+        columns: tuple,
+        key: tuple,
+        update_columns: tuple,
+        records: List[tuple],
+    ):
+        """
+        Upsert records with COPY into a session temp table, then one
+        INSERT ... SELECT ... ON CONFLICT into the hypertable.
+        """
+        staging = f"{table}_staging"
+        column_list = ", ".join(columns)
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in update_columns)
+
+        async with self.db.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+                    f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+                )
+                await conn.copy_records_to_table(
+                    staging, records=records, columns=columns
+                )
+                await conn.execute(
+                    f"INSERT INTO {table} ({column_list}) "
+                    f"SELECT {column_list} FROM {staging} "
+                    f"ON CONFLICT ({', '.join(key)}) DO UPDATE SET {updates}"
+                )
+
+    async def _write_ohlcv_records(self, query: str, records: List[tuple]):
+        """Write OHLCV rows in batches of batch_size (COPY or executemany)"""
+        batch_size = self.write_config["batch_size"]
+        for start in range(0, len(records), batch_size):
+            batch = records[start : start + batch_size]
+            if self.use_copy:
+                await self._copy_upsert(
+                    TIMESCALE_TABLES["ohlcv"],
+                    OHLCV_COLUMNS,
+                    OHLCV_KEY,
+                    OHLCV_UPDATE_COLUMNS,
+                    batch,
+                )
+            else:
+                await self.db.executemany(query, batch)
+
     async def write_ohlcv_batch(self, data: List[OHLCVData]):
         """
         Write batch of OHLCV data to TimescaleDB
@@ -49,24 +188,40 @@ class TimescaleWriter:
                     volume = EXCLUDED.volume
             """
 
-            # Prepare batch data
-            records = [
-                (
+            # Prepare batch data, keeping the last row per key: one
+            # INSERT ... ON CONFLICT can't update the same row twice
+            records = {
+                (ohlcv.symbol, ohlcv.timeframe.value, ohlcv.timestamp): (
                     ohlcv.symbol,
                     ohlcv.timeframe.value,
                     ohlcv.timestamp,
-                    float(ohlcv.open),
-                    float(ohlcv.high),
-                    float(ohlcv.low),
-                    float(ohlcv.close),
-                    float(ohlcv.volume),
+                    ohlcv.open,
+                    ohlcv.high,
+                    ohlcv.low,
+                    ohlcv.close,
+                    ohlcv.volume,
                     ohlcv.exchange,
                 )
                 for ohlcv in data
-            ]
-
-            # Execute batch insert
-            await self.db.executemany(query, records)
+            }
+            records = list(records.values())
+
+            # Time-ordered rows land in the newest chunk only
+            if self.write_config["sort_by_time"]:
+                records.sort(key=itemgetter(2))
+
+            n = self.parallel_writers
+            if n > 1:
+                # Disjoint symbols per stream, so streams never touch the
+                # same rows; each shard keeps the time order from above
+                shards = [[] for _ in range(n)]
+                for record in records:
+                    shards[symbol_shard(record[0], n)].append(record)
+                await asyncio.gather(
+                    *(self._write_ohlcv_records(query, s) for s in shards if s)
+                )
+            else:
+                await self._write_ohlcv_records(query, records)
 
             self.logger.debug(f"Wrote {len(data)} OHLCV records to TimescaleDB")
 
@@ -183,11 +338,11 @@ class TimescaleWriter:
                     symbol=row["symbol"],
                     timeframe=row["timeframe"],
                     timestamp=row["timestamp"],
-                    open=Decimal(str(row["open"])),
-                    high=Decimal(str(row["high"])),
-                    low=Decimal(str(row["low"])),
-                    close=Decimal(str(row["close"])),
-                    volume=Decimal(str(row["volume"])),
+                    open=float(row["open"]),
+                    high=float(row["high"]),
+                    low=float(row["low"]),
+                    close=float(row["close"]),
+                    volume=float(row["volume"]),
                     exchange=row["exchange"],
                 )
                 for row in rows
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional
 import aiohttp
 from ratelimit import limits, sleep_and_retry
 
+from .topics import tag_article
+
 
 class CryptoPanicSource:
     """
@@ -174,6 +176,7 @@ class CryptoPanicSource:
                 "published_at": self._parse_date(post.get("published_at")),
                 "domain": post.get("domain", ""),
                 "currencies": currencies,
+                **tag_article(post.get("title", "")),
                 "kind": post.get("kind", "news"),  # news, media
                 "sentiment": sentiment,
                 "sentiment_score": sentiment_score,
@@ -12,6 +12,8 @@ from typing import Dict, List, Optional
 
 from newsapi import NewsApiClient
 
+from .topics import tag_article
+
 
 class NewsAPISource:
     """
@@ -257,6 +259,11 @@ class NewsAPISource:
                 "source_name": source_name,
                 "source_id": source_id,
                 "currencies": currencies,
+                **tag_article(
+                    article.get("title"),
+                    article.get("description"),
+                    article.get("content"),
+                ),
                 "impact": impact,
                 "metadata": {"raw_source": source},
             }
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional
 
 import praw
 
+from .topics import tag_article
+
 
 class RedditScraperSource:
     """
@@ -284,6 +286,7 @@ class RedditScraperSource:
                     "total": engagement,
                 },
                 "currencies": currencies,
+                **tag_article(post.title, post.selftext),
                 "impact": impact,
                 "sentiment": sentiment,
                 "is_discussion": post.is_self,
@@ -12,6 +12,11 @@ from typing import Dict, List, Optional
 
 import feedparser
 
+from backend.shared_libs.python.crypto_trading_shared.keywords import \
+    KeywordMatcher
+
+from .topics import tag_article
+
 
 class RSSFeedSource:
     """
@@ -34,6 +39,103 @@ class RSSFeedSource:
         "beincrypto": "https://beincrypto.com/feed/",
     }
 
+    # Keyword sets compiled once into matchers (see KeywordMatcher)
+    CURRENCY_KEYWORDS = {
+        "BITCOIN": "BTC",
+        "BTC": "BTC",
+        "ETHEREUM": "ETH",
+        "ETH": "ETH",
+        "BINANCE COIN": "BNB",
+        "BNB": "BNB",
+        "CARDANO": "ADA",
+        "ADA": "ADA",
+        "SOLANA": "SOL",
+        "SOL": "SOL",
+        "XRP": "XRP",
+        "RIPPLE": "XRP",
+        "DOGECOIN": "DOGE",
+        "DOGE": "DOGE",
+        "POLKADOT": "DOT",
+        "DOT": "DOT",
+        "POLYGON": "MATIC",
+        "MATIC": "MATIC",
+        "AVALANCHE": "AVAX",
+        "AVAX": "AVAX",
+        "CHAINLINK": "LINK",
+        "LINK": "LINK",
+        "UNISWAP": "UNI",
+        "UNI": "UNI",
+    }
+
+    # Keywords that boost article impact
+    HIGH_IMPACT_KEYWORDS = (
+        "breaking",
+        "sec",
+        "regulation",
+        "ban",
+        "approval",
+        "crash",
+        "surge",
+        "record",
+        "all-time high",
+        "ath",
+        "hack",
+        "exploit",
+        "emergency",
+        "critical",
+    )
+
+    # Bullish keywords
+    BULLISH_KEYWORDS = (
+        "surge",
+        "rally",
+        "gain",
+        "rise",
+        "up",
+        "growth",
+        "bullish",
+        "positive",
+        "optimistic",
+        "adoption",
+        "breakthrough",
+        "success",
+        "milestone",
+        "record high",
+        "approval",
+        "green",
+        "pump",
+    )
+
+    # Bearish keywords
+    BEARISH_KEYWORDS = (
+        "crash",
+        "fall",
+        "drop",
+        "decline",
+        "down",
+        "loss",
+        "bearish",
+        "negative",
+        "pessimistic",
+        "warning",
+        "concern",
+        "risk",
+        "threat",
+        "ban",
+        "regulation",
+        "hack",
+        "exploit",
+        "red",
+        "dump",
+    )
+
+    CURRENCY_MATCHER = KeywordMatcher(
+        list(CURRENCY_KEYWORDS), list(CURRENCY_KEYWORDS.values())
+    )
+    HIGH_IMPACT_MATCHER = KeywordMatcher(HIGH_IMPACT_KEYWORDS)
+    BULLISH_MATCHER = KeywordMatcher(BULLISH_KEYWORDS)
+    BEARISH_MATCHER = KeywordMatcher(BEARISH_KEYWORDS)
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         """
         Initialize RSS feed source
@@ -187,6 +289,7 @@ class RSSFeedSource:
                 "author": author,
                 "tags": tags,
                 "currencies": currencies,
+                **tag_article(title, description, content),
                 "impact": impact,
                 "sentiment": sentiment,
                 "metadata": {
@@ -200,42 +303,7 @@ class RSSFeedSource:
 
     def _extract_currencies(self, text: str) -> List[str]:
         """Extract cryptocurrency mentions from text"""
-        currencies = []
-        text_upper = text.upper()
-
-        crypto_map = {
-            "BITCOIN": "BTC",
-            "BTC": "BTC",
-            "ETHEREUM": "ETH",
-            "ETH": "ETH",
-            "BINANCE COIN": "BNB",
-            "BNB": "BNB",
-            "CARDANO": "ADA",
-            "ADA": "ADA",
-            "SOLANA": "SOL",
-            "SOL": "SOL",
-            "XRP": "XRP",
-            "RIPPLE": "XRP",
-            "DOGECOIN": "DOGE",
-            "DOGE": "DOGE",
-            "POLKADOT": "DOT",
-            "DOT": "DOT",
-            "POLYGON": "MATIC",
-            "MATIC": "MATIC",
-            "AVALANCHE": "AVAX",
-            "AVAX": "AVAX",
-            "CHAINLINK": "LINK",
-            "LINK": "LINK",
-            "UNISWAP": "UNI",
-            "UNI": "UNI",
-        }
-
-        for keyword, code in crypto_map.items():
-            if keyword in text_upper:
-                if code not in currencies:
-                    currencies.append(code)
-
-        return currencies
+        return self.CURRENCY_MATCHER.find(text)
 
     def _calculate_impact(self, feed_name: str, title: str) -> int:
         """
@@ -260,25 +328,7 @@ class RSSFeedSource:
             impact = 5
 
         # Boost impact for breaking news or important keywords
-        title_lower = title.lower()
-        high_impact_keywords = [
-            "breaking",
-            "sec",
-            "regulation",
-            "ban",
-            "approval",
-            "crash",
-            "surge",
-            "record",
-            "all-time high",
-            "ath",
-            "hack",
-            "exploit",
-            "emergency",
-            "critical",
-        ]
-
-        if any(keyword in title_lower for keyword in high_impact_keywords):
+        if self.HIGH_IMPACT_MATCHER.any(title):
             impact = min(10, impact + 2)
 
         return impact
@@ -294,54 +344,10 @@ class RSSFeedSource:
         Returns:
             Sentiment: bullish, bearish, or neutral
         """
-        text = f"{title} {description}".lower()
-
-        # Bullish keywords
-        bullish_keywords = [
-            "surge",
-            "rally",
-            "gain",
-            "rise",
-            "up",
-            "growth",
-            "bullish",
-            "positive",
-            "optimistic",
-            "adoption",
-            "breakthrough",
-            "success",
-            "milestone",
-            "record high",
-            "approval",
-            "green",
-            "pump",
-        ]
-
-        # Bearish keywords
-        bearish_keywords = [
-            "crash",
-            "fall",
-            "drop",
-            "decline",
-            "down",
-            "loss",
-            "bearish",
-            "negative",
-            "pessimistic",
-            "warning",
-            "concern",
-            "risk",
-            "threat",
-            "ban",
-            "regulation",
-            "hack",
-            "exploit",
-            "red",
-            "dump",
-        ]
-
-        bullish_count = sum(1 for keyword in bullish_keywords if keyword in text)
-        bearish_count = sum(1 for keyword in bearish_keywords if keyword in text)
+        text = f"{title} {description}"
+
+        bullish_count = self.BULLISH_MATCHER.count(text)
+        bearish_count = self.BEARISH_MATCHER.count(text)
 
         if bullish_count > bearish_count:
             return "bullish"
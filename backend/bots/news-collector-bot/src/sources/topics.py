@@ -0,0 +1,41 @@
+# ============================================
+# Crypto Trading Signal System
+# backed/bots/news-collector-bot/src/sources/topics.py
+# Deception: Topic Tagging: Shared news keyword and topic matchers for all sources
+# ============================================
+
+from typing import Dict, List
+
+from backend.shared_libs.python.crypto_trading_shared.constants import (
+    NEWS_KEYWORDS, TOPIC_KEYWORDS)
+from backend.shared_libs.python.crypto_trading_shared.keywords import \
+    KeywordMatcher
+
+# Compiled once when the news collector loads its sources.
+# Whole words only: short keywords like "sec" and "hack" would otherwise hit
+# "second" and "hackathon"
+NEWS_KEYWORD_MATCHER = KeywordMatcher(NEWS_KEYWORDS, whole_words=True)
+
+# All topic keywords in one matcher whose values are the topic names
+TOPIC_KEYWORD_MATCHER = KeywordMatcher(
+    [word for words in TOPIC_KEYWORDS.values() for word in words],
+    [topic.value for topic, words in TOPIC_KEYWORDS.items() for _ in words],
+    whole_words=True,
+)
+
+
+def tag_article(*texts: str) -> Dict[str, List[str]]:
+    """
+    Classify an article by topic and tracked keywords
+
+    Args:
+        texts: Title, description, body, ... (None/empty parts are skipped)
+
+    Returns:
+        {"topics": [NewsTopic value, ...], "keywords": [keyword, ...]}
+    """
+    text = " ".join(part for part in texts if part)
+    return {
+        "topics": TOPIC_KEYWORD_MATCHER.find(text),
+        "keywords": NEWS_KEYWORD_MATCHER.find(text),
+    }
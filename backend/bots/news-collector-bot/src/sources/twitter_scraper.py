@@ -25,6 +25,8 @@ try:
 except ImportError:
     TWEEPY_AVAILABLE = False
 
+from .topics import tag_article
+
 
 class TwitterScraperSource:
     """
@@ -316,6 +318,7 @@ class TwitterScraperSource:
                     "total": total_engagement,
                 },
                 "currencies": currencies,
+                **tag_article(tweet.content),
                 "impact": impact,
                 "hashtags": tweet.hashtags or [],
                 "cashtags": self._extract_cashtags(tweet.content),
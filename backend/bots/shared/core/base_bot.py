@@ -49,6 +49,7 @@ class BaseBot(ABC):
             name=bot_name,
             log_file=f"logs/{bot_name}.log",
             level=self.config.get("LOG_LEVEL", "INFO"),
+            renderer=self.config.get("LOG_RENDERER"),
         )
 
         # Bot state
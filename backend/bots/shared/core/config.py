@@ -26,6 +26,7 @@ class Config:
         # General
         "NODE_ENV": "development",
         "LOG_LEVEL": "INFO",
+        "LOG_RENDERER": "json",  # "json" or "console"; empty keeps colored text
         "DEBUG": False,
         # Database
         "MYSQL_HOST": "localhost",
@@ -54,6 +55,7 @@ class Config:
         "RABBITMQ_USER": "rabbitmq_user",
         "RABBITMQ_PASSWORD": "",
         "RABBITMQ_VHOST": "/",
+        "RABBITMQ_PREFETCH": 10,  # Unless RABBITMQ_PREFETCH lists the queue
         # Bot Settings
         "MAX_CONSECUTIVE_ERRORS": 5,
         "HEARTBEAT_INTERVAL": 60,
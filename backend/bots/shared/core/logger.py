@@ -11,6 +11,11 @@ from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
+from backend.shared_libs.python.crypto_trading_shared.log_config import (
+    STRUCTLOG_AVAILABLE, configure_logging)
+
+# Set once setup_logger() routes console output through configure_logging
+_structured = False
 
 # ANSI color codes for console output
 class LogColors:
@@ -89,10 +94,15 @@ def setup_logger(
     backup_count: int = 5,
     console: bool = True,
     use_colors: bool = True,
+    renderer: Optional[str] = None,
 ) -> logging.Logger:
     """
     Setup and configure a logger.
 
+    With a renderer ("json" or "console") and structlog installed, console
+    output goes through the structured root handler from configure_logging()
+    instead of this logger's own colored handler.
+
     Args:
         name: Logger name
         log_file: Optional path to log file
@@ -101,10 +111,13 @@ def setup_logger(
         backup_count: Number of backup files to keep
         console: Whether to log to console
         use_colors: Whether to use colors in console output
+        renderer: Structured renderer for console output (LOG_RENDERER)
 
     Returns:
         Configured logger instance
     """
+    global _structured
+
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
@@ -112,8 +125,15 @@ def setup_logger(
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
 
+    # Without structlog, configure_logging() only offers plain text; keep
+    # the colored handler instead
+    structured = bool(console and renderer and STRUCTLOG_AVAILABLE)
+    if structured:
+        configure_logging(level, renderer=renderer)
+        _structured = True
+
     # Console handler
-    if console:
+    if console and not structured:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.DEBUG)
 
@@ -144,8 +164,8 @@ def setup_logger(
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
 
-    # Prevent propagation to root logger
-    logger.propagate = False
+    # Only propagate to the root logger when it holds the structured handler
+    logger.propagate = structured
 
     return logger
 
@@ -226,6 +246,10 @@ def get_logger(name: str) -> logging.Logger:
     """
     logger = logging.getLogger(name)
 
+    if _structured:
+        # Records reach the structured root handler by propagation
+        return logger
+
     if not logger.handlers:
         # Setup basic logger if not configured
         logger = setup_logger(name)
@@ -258,3 +282,33 @@ def log_trade_signal(logger: logging.Logger, signal: dict):
 ════════════════════════════════════════════
 """
     )
+
+
+def log_error_with_context(
+    logger: logging.Logger, error: Exception, context: Optional[dict] = None
+):
+    """
+    Log an exception with the context it occurred in.
+
+    Args:
+        logger: Logger instance
+        error: Exception to log
+        context: Extra key/value details (symbol, operation, ...)
+    """
+    details = ", ".join(f"{k}={v}" for k, v in (context or {}).items())
+    logger.error(
+        f"{type(error).__name__}: {error}" + (f" | {details}" if details else ""),
+        exc_info=error,
+    )
+
+
+def log_performance_metrics(logger: logging.Logger, metrics: dict):
+    """
+    Log performance metrics, one per line.
+
+    Args:
+        logger: Logger instance
+        metrics: Metric name -> value
+    """
+    lines = "\n".join(f"  {name:<16} {value}" for name, value in metrics.items())
+    logger.info(f"Performance metrics:\n{lines}")
@@ -21,6 +21,9 @@ from aio_pika import (
 )
 from aio_pika.abc import AbstractIncomingMessage
 
+from backend.shared_libs.python.crypto_trading_shared.constants import \
+    RABBITMQ_PREFETCH
+
 from ..core.config import Config
 from ..core.logger import get_logger
 from ..core.exceptions import BotConnectionError, BotError, retry_on_error
@@ -77,7 +80,9 @@ class RabbitMQClient:
 
             # Create channel
             self.channel = await self.connection.channel()
-            await self.channel.set_qos(prefetch_count=10)
+            await self.channel.set_qos(
+                prefetch_count=self.config.get("RABBITMQ_PREFETCH", 10)
+            )
 
             # Declare exchanges
             await self._declare_exchanges()
@@ -180,6 +185,97 @@ class RabbitMQClient:
             self.logger.error(f"Failed to publish message: {e}")
             raise BotError(f"Message publishing failed: {str(e)}")
 
+    async def publish_raw(
+        self,
+        body: bytes,
+        exchange: str,
+        routing_key: str,
+        priority: MessagePriority = MessagePriority.NORMAL,
+        content_type: str = "application/json",
+        persistent: bool = True,
+    ):
+        """
+        Publish a pre-encoded body to exchange.
+
+        Used by high-rate publishers (e.g. market data) that encode with
+        msgspec and skip the BaseMessage/to_json round trip.
+
+        Args:
+            body: Encoded message body
+            exchange: Exchange name
+            routing_key: Routing key
+            priority: Message priority
+            content_type: MIME type of body
+            persistent: Persist on the broker (e.g. RABBITMQ_PERSISTENCE[queue]);
+                transient messages skip the broker fsync
+        """
+        await self.publish_raw_batch(
+            [body],
+            exchange,
+            routing_key,
+            priority=priority,
+            content_type=content_type,
+            persistent=persistent,
+        )
+
+    async def publish_raw_batch(
+        self,
+        bodies: List[bytes],
+        exchange: str,
+        routing_key: str,
+        priority: MessagePriority = MessagePriority.NORMAL,
+        content_type: str = "application/json",
+        persistent: bool = True,
+        confirm_batch: int = 1000,
+    ):
+        """
+        Publish pre-encoded bodies, awaiting publisher confirms per batch.
+
+        Up to confirm_batch messages are in flight before their confirms are
+        awaited together, instead of one broker round trip per message.
+
+        Args:
+            bodies: Encoded message bodies
+            exchange: Exchange name
+            routing_key: Routing key
+            priority: Message priority
+            content_type: MIME type of bodies
+            persistent: Persist on the broker (see publish_raw)
+            confirm_batch: Messages published per confirm wait
+                (e.g. RABBITMQ_CONFIRM_BATCH_SIZE)
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        exch = self.exchanges.get(exchange)
+        if not exch:
+            raise BotError(f"Exchange not found: {exchange}")
+
+        delivery_mode = (
+            DeliveryMode.PERSISTENT if persistent else DeliveryMode.NOT_PERSISTENT
+        )
+
+        try:
+            for start in range(0, len(bodies), confirm_batch):
+                await asyncio.gather(
+                    *(
+                        exch.publish(
+                            Message(
+                                body=body,
+                                delivery_mode=delivery_mode,
+                                priority=priority.value,
+                                content_type=content_type,
+                            ),
+                            routing_key=routing_key,
+                        )
+                        for body in bodies[start : start + confirm_batch]
+                    )
+                )
+
+        except Exception as e:
+            self.logger.error(f"Failed to publish raw message: {e}")
+            raise BotError(f"Message publishing failed: {str(e)}")
+
     async def declare_queue(
         self,
         queue_name: str,
@@ -245,6 +341,7 @@ class RabbitMQClient:
         queue_name: str,
         callback: Callable[[BaseMessage], None],
         auto_ack: bool = False,
+        prefetch_count: Optional[int] = None,
     ):
         """
         Start consuming messages from queue.
@@ -253,6 +350,9 @@ class RabbitMQClient:
             queue_name: Queue name
             callback: Async callback function to handle messages
             auto_ack: Automatically acknowledge messages
+            prefetch_count: Unacked messages in flight for this consumer;
+                defaults to RABBITMQ_PREFETCH[queue_name], else the
+                RABBITMQ_PREFETCH config value
         """
         if not self._is_connected:
             await self.connect()
@@ -286,6 +386,14 @@ class RabbitMQClient:
                         # Reject and requeue
                         await message.reject(requeue=False)
 
+            # Per-consumer QoS applies to consumers started after it is set,
+            # so it is set every time rather than inherited from the last one
+            if prefetch_count is None:
+                prefetch_count = RABBITMQ_PREFETCH.get(
+                    queue_name, self.config.get("RABBITMQ_PREFETCH", 10)
+                )
+            await self.channel.set_qos(prefetch_count=prefetch_count)
+
             # Start consuming
             await queue.consume(message_handler, no_ack=auto_ack)
 
@@ -0,0 +1,17 @@
+"""
+Test Configuration
+==================
+Make ``shared`` (backend/bots) and ``crypto_trading_shared``
+(backend/shared_libs/python) importable when running pytest from any
+directory.
+"""
+
+import sys
+from pathlib import Path
+
+BOTS_DIR = Path(__file__).resolve().parents[2]
+SHARED_LIBS_DIR = BOTS_DIR.parent / "shared_libs" / "python"
+
+for path in (str(SHARED_LIBS_DIR), str(BOTS_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,52 @@
+"""
+Test Constants
+==============
+Check that the shared constant tables are read-only at every level.
+"""
+
+from types import MappingProxyType
+
+import pytest
+
+from crypto_trading_shared import constants
+from crypto_trading_shared.constants import (
+    INDICATOR_SETTINGS,
+    NOTIFICATION_SETTINGS,
+    RISK_LIMITS,
+)
+
+
+def test_top_level_tables_are_read_only():
+    with pytest.raises(TypeError):
+        RISK_LIMITS["min_risk_reward"] = 1.0
+
+
+def test_nested_tables_are_read_only():
+    assert isinstance(INDICATOR_SETTINGS["rsi"], MappingProxyType)
+    with pytest.raises(TypeError):
+        INDICATOR_SETTINGS["rsi"]["period"] = 99
+
+
+def test_nested_lists_are_tuples():
+    channels = NOTIFICATION_SETTINGS["signal"]["channels"]
+
+    assert isinstance(channels, tuple)
+    with pytest.raises(AttributeError):
+        channels.append("email")
+
+
+def test_no_mutable_containers_left():
+    def walk(value):
+        if isinstance(value, MappingProxyType):
+            for item in value.values():
+                walk(item)
+        elif isinstance(value, tuple):
+            for item in value:
+                walk(item)
+        else:
+            assert not isinstance(value, (dict, list, set)), value
+
+    for name in dir(constants):
+        value = getattr(constants, name)
+        if name.isupper() and isinstance(value, MappingProxyType):
+            walk(value)
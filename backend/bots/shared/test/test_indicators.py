@@ -0,0 +1,183 @@
+"""
+Test Indicators
+===============
+Compare the JIT indicator kernels and the live IndicatorState with the
+pandas formulas they replace, including candles with missing (NaN) values.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared.utils import indicators
+from shared.utils.indicators import IndicatorState
+
+
+def make_candles(n=300, seed=7):
+    """Random-walk OHLCV columns."""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(n).cumsum()
+    open_ = close + rng.standard_normal(n) * 0.5
+    high = np.maximum(open_, close) + rng.random(n)
+    low = np.minimum(open_, close) - rng.random(n)
+    volume = rng.random(n) * 1000
+    return open_, high, low, close, volume
+
+
+def with_gaps(*columns):
+    """Copy columns with a few missing candles."""
+    gapped = tuple(col.copy() for col in columns)
+    for col in gapped:
+        col[[40, 41, 120]] = np.nan
+    gapped[-1][200] = np.nan  # lone missing close
+    return gapped
+
+
+# ==================== pandas references ====================
+def ref_ema(values, period):
+    return pd.Series(values).ewm(span=period, adjust=False).mean().values
+
+
+def ref_rsi(values, period):
+    delta = pd.Series(values).diff()
+    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    return (100 - 100 / (1 + gain / loss)).values
+
+
+def ref_atr(high, low, close, period):
+    high, low, close = pd.Series(high), pd.Series(low), pd.Series(close)
+    prev_close = close.shift()
+    tr = pd.concat(
+        [high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
+    ).max(axis=1)
+    return tr.rolling(window=period).mean().values
+
+
+# ==================== kernels ====================
+@pytest.mark.parametrize("period", [9, 12, 26])
+def test_ema_matches_pandas(period):
+    close = make_candles()[3]
+    np.testing.assert_allclose(indicators.ema(close, period), ref_ema(close, period))
+
+
+def test_ema_matches_pandas_across_gaps():
+    close = with_gaps(make_candles()[3])[0]
+    np.testing.assert_allclose(indicators.ema(close, 12), ref_ema(close, 12))
+
+
+@pytest.mark.parametrize("period", [7, 14])
+def test_rsi_matches_pandas(period):
+    close = make_candles()[3]
+    np.testing.assert_allclose(indicators.rsi(close, period), ref_rsi(close, period))
+
+
+def test_rsi_matches_pandas_across_gaps():
+    close = with_gaps(make_candles()[3])[0]
+    np.testing.assert_allclose(indicators.rsi(close, 14), ref_rsi(close, 14))
+
+
+@pytest.mark.parametrize("period", [5, 14])
+def test_atr_matches_pandas(period):
+    _, high, low, close, _ = make_candles()
+    np.testing.assert_allclose(
+        indicators.atr(high, low, close, period), ref_atr(high, low, close, period)
+    )
+
+
+def test_atr_recovers_after_missing_candles():
+    _, high, low, close, _ = make_candles()
+    high, low, close = with_gaps(high, low, close)
+
+    result = indicators.atr(high, low, close, 14)
+
+    np.testing.assert_allclose(result, ref_atr(high, low, close, 14))
+    # One window after the last gap the values are finite again
+    assert np.isfinite(result[200 + 14 :]).all()
+
+
+def test_keltner_and_volatility_index_recover_after_missing_candles():
+    _, high, low, close, _ = make_candles()
+    high, low, close = with_gaps(high, low, close)
+
+    upper, _, lower = indicators.keltner_channels(high, low, close)
+    volatility = indicators.volatility_index(high, low, close)
+
+    assert np.isfinite(upper[-50:]).all()
+    assert np.isfinite(lower[-50:]).all()
+    assert np.isfinite(volatility[-50:]).all()
+
+
+def test_calculate_all_indicators_returns_latest_values():
+    open_, high, low, close, volume = make_candles()
+
+    values = indicators.calculate_all_indicators(open_, high, low, close, volume)
+
+    assert values["atr"] == pytest.approx(ref_atr(high, low, close, 14)[-1])
+    assert values["rsi_14"] == pytest.approx(ref_rsi(close, 14)[-1])
+    assert values["ema_12"] == pytest.approx(ref_ema(close, 12)[-1])
+
+
+# ==================== live state ====================
+def test_indicator_state_matches_full_history():
+    open_, high, low, close, volume = make_candles(100)
+    state = IndicatorState()
+    expected_rsi = ref_rsi(close, 14)
+    expected_atr = ref_atr(high, low, close, 14)
+
+    for i in range(100):
+        latest = state.update(open_[i], high[i], low[i], close[i], volume[i])
+        # RSI waits for 14 real deltas (15 candles); the full-history RSI
+        # already reports at candle 14, counting the first bar as a zero delta
+        if i < 14:
+            assert latest["rsi_14"] is None
+        else:
+            assert latest["rsi_14"] == pytest.approx(expected_rsi[i])
+        if i < 13:
+            assert latest["atr"] is None
+        else:
+            assert latest["atr"] == pytest.approx(expected_atr[i])
+
+    macd_line, signal_line, _ = indicators.macd(close)
+    assert latest["ema_12"] == pytest.approx(ref_ema(close, 12)[-1])
+    assert latest["ema_26"] == pytest.approx(ref_ema(close, 26)[-1])
+    assert latest["macd_line"] == pytest.approx(macd_line[-1])
+    assert latest["macd_signal"] == pytest.approx(signal_line[-1])
+    assert latest["rsi_14"] == pytest.approx(ref_rsi(close, 14)[-1])
+    assert latest["atr"] == pytest.approx(ref_atr(high, low, close, 14)[-1])
+    assert latest["obv"] == pytest.approx(indicators.obv(close, volume)[-1])
+    assert latest["vwap"] == pytest.approx(
+        indicators.vwap(high, low, close, volume)[-1]
+    )
+
+
+def test_indicator_state_warms_up():
+    state = IndicatorState(rsi_period=3, atr_period=3)
+
+    first = state.update(10, 11, 9, 10.5, 100)
+    state.update(10.5, 12, 10, 11.5, 100)
+    third = state.update(11.5, 12, 11, 11.0, 100)
+    fourth = state.update(11.0, 11.5, 10, 10.0, 100)
+
+    assert first["rsi_14"] is None and first["atr"] is None
+    # Three true ranges, but only two price deltas so far
+    assert third["rsi_14"] is None and third["atr"] is not None
+    # Deltas +1, -0.5, -1
+    assert fourth["rsi_14"] == pytest.approx(100 - 100 / (1 + 1 / 1.5))
+
+
+def test_update_indicators_keeps_state_per_symbol():
+    indicators.reset_indicator_state()
+    try:
+        indicators.update_indicators("BTCUSDT", 10, 11, 9, 10, 1)
+        eth = indicators.update_indicators("ETHUSDT", 20, 21, 19, 20, 1)
+        btc = indicators.update_indicators("BTCUSDT", 10, 12, 10, 12, 1)
+
+        assert eth["ema_12"] == 20
+        assert btc["ema_12"] == pytest.approx(10 + 2 / 13 * 2)
+
+        indicators.reset_indicator_state("BTCUSDT")
+        restarted = indicators.update_indicators("BTCUSDT", 10, 11, 9, 10, 1)
+        assert restarted["ema_12"] == 10
+    finally:
+        indicators.reset_indicator_state()
@@ -0,0 +1,133 @@
+"""
+Test Keywords
+=============
+Run KeywordMatcher on each backend (Hyperscan, Aho-Corasick, plain search)
+and check they report the same hits, with and without whole_words.
+"""
+
+import re
+
+import pytest
+
+from crypto_trading_shared import keywords as kw
+from crypto_trading_shared.keywords import KeywordMatcher
+
+BACKENDS = ("hyperscan", "ahocorasick", "plain")
+
+KEYWORDS = ["SEC", "etf", "bitcoin", "hack", "btc", "bitcoin etf", "coin", "e"]
+
+TEXTS = [
+    "",
+    "The SEC approved a Bitcoin ETF today",
+    "Bitcoin/ETF: second hacker hacked; BTC-USD up",
+    "bitcoin etfs, ETF_flows and sec.gov",
+    "coincidence? Bitcoin's coin is a COIN.",
+    "nothing to see here",
+    "e",
+    "café sec façade",
+    "SECSECSEC sec_sec (sec)",
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    """Force KeywordMatcher onto one backend"""
+    if request.param == "hyperscan" and not kw.HYPERSCAN_AVAILABLE:
+        pytest.skip("hyperscan not installed")
+    if request.param == "ahocorasick" and not kw.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(kw, "HYPERSCAN_AVAILABLE", request.param == "hyperscan")
+    monkeypatch.setattr(kw, "AHOCORASICK_AVAILABLE", request.param == "ahocorasick")
+    return request.param
+
+
+def reference(keywords, text, whole_words=False):
+    """Keyword indices found by a plain regex scan"""
+    text = text.lower()
+    found = set()
+    for i, word in enumerate(k.lower() for k in keywords):
+        pattern = re.escape(word)
+        if whole_words:
+            pattern = rf"\b{pattern}\b"
+        if re.search(pattern, text, re.ASCII):
+            found.add(i)
+    return found
+
+
+def test_backend_is_selected(backend):
+    matcher = KeywordMatcher(KEYWORDS)
+
+    assert (matcher._database is not None) == (backend == "hyperscan")
+    assert (matcher._automaton is not None) == (backend == "ahocorasick")
+
+
+@pytest.mark.parametrize("whole_words", [False, True])
+@pytest.mark.parametrize("text", TEXTS)
+def test_matches_reference(backend, text, whole_words):
+    matcher = KeywordMatcher(KEYWORDS, whole_words=whole_words)
+    expected = reference(KEYWORDS, text, whole_words)
+
+    assert matcher.indices(text) == expected
+    assert matcher.count(text) == len(expected)
+    assert matcher.any(text) == bool(expected)
+
+
+def test_case_folding(backend):
+    matcher = KeywordMatcher(["Bitcoin", "ETF"])
+
+    assert matcher.keywords == ("bitcoin", "etf")
+    assert matcher.find("BITCOIN etf") == ["bitcoin", "etf"]
+    assert matcher.find("bItCoIn EtF") == ["bitcoin", "etf"]
+
+
+def test_substring_by_default(backend):
+    matcher = KeywordMatcher(["sec", "hack"])
+
+    assert matcher.find("second hacker") == ["sec", "hack"]
+
+
+def test_whole_words_boundaries(backend):
+    matcher = KeywordMatcher(["sec", "hack"], whole_words=True)
+
+    assert matcher.find("second hacker") == []
+    assert not matcher.any("second hacker")
+    assert matcher.find("sec") == ["sec"]
+    assert matcher.find("(sec), hack!") == ["sec", "hack"]
+    # Underscore and digits are word characters; punctuation is not
+    assert matcher.find("sec_filing hack2") == []
+    assert matcher.find("sec-filing hack.") == ["sec", "hack"]
+    # A later delimited occurrence still counts
+    assert matcher.find("secsec sec") == ["sec"]
+
+
+def test_whole_words_multiword_keyword(backend):
+    matcher = KeywordMatcher(["bitcoin etf"], whole_words=True)
+
+    assert matcher.any("new bitcoin etf filed")
+    assert not matcher.any("new bitcoin etfs filed")
+
+
+def test_find_order_dedup_and_values(backend):
+    matcher = KeywordMatcher(
+        ["etf", "bitcoin", "btc", "Bitcoin"],
+        values=["ETF", "BTC", "BTC", "BTC_UPPER"],
+    )
+
+    # Keyword order, not text order; a value reported once
+    assert matcher.find("btc and bitcoin and etf") == ["ETF", "BTC", "BTC_UPPER"]
+    assert matcher.indices("bitcoin") == {1, 3}
+
+
+def test_empty_keywords(backend):
+    matcher = KeywordMatcher([])
+
+    assert matcher.find("bitcoin") == []
+    assert matcher.count("bitcoin") == 0
+    assert not matcher.any("bitcoin")
+
+
+def test_empty_text(backend):
+    matcher = KeywordMatcher(KEYWORDS, whole_words=True)
+
+    assert matcher.find("") == []
+    assert not matcher.any("")
@@ -0,0 +1,107 @@
+"""
+Test Log Config
+===============
+Check that configure_logging renders structlog and stdlib records through
+one handler on the root logger, and that setup_logger routes bot loggers
+there.
+"""
+
+import io
+import json
+import logging
+
+import pytest
+import structlog
+
+from crypto_trading_shared.log_config import configure_logging
+
+
+@pytest.fixture
+def stream():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield io.StringIO()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    structlog.reset_defaults()
+
+
+def lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_json_renderer_for_structlog_and_stdlib(stream):
+    configure_logging("INFO", renderer="json", stream=stream)
+
+    structlog.get_logger("bots.signal").info("signal_created", symbol="BTCUSDT")
+    logging.getLogger("bots.stdlib").warning("plain %s", "record")
+
+    structured, plain = lines(stream)
+    assert structured["event"] == "signal_created"
+    assert structured["symbol"] == "BTCUSDT"
+    assert structured["level"] == "info"
+    assert structured["logger"] == "bots.signal"
+    assert "timestamp" in structured
+    assert plain["event"] == "plain record"
+    assert plain["level"] == "warning"
+    assert plain["logger"] == "bots.stdlib"
+
+
+def test_level_filters_records(stream):
+    configure_logging("warning", renderer="json", stream=stream)
+
+    structlog.get_logger("bots.signal").info("dropped")
+    logging.getLogger("bots.stdlib").info("dropped")
+    logging.getLogger("bots.stdlib").error("kept")
+
+    assert [line["event"] for line in lines(stream)] == ["kept"]
+    assert logging.getLogger().level == logging.WARNING
+
+
+def test_console_renderer(stream):
+    configure_logging("DEBUG", renderer="console", stream=stream)
+
+    structlog.get_logger("bots.signal").debug("hello", symbol="ETHUSDT")
+
+    output = stream.getvalue()
+    assert "hello" in output and "ETHUSDT" in output
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(output.splitlines()[0])
+
+
+def test_reconfiguring_replaces_root_handler(stream):
+    configure_logging("INFO", stream=stream)
+    configure_logging("INFO", stream=stream)
+
+    assert len(logging.getLogger().handlers) == 1
+
+
+def test_setup_logger_routes_bot_loggers_through_renderer(stream, capsys, monkeypatch):
+    from shared.core import logger as bot_logger
+
+    monkeypatch.setattr(bot_logger, "_structured", False)
+    log = bot_logger.setup_logger("bots.test", level="INFO", renderer="json")
+    client_log = bot_logger.get_logger("bots.test_client")
+    log.info("bot started")
+    client_log.warning("client connected")
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["event"] for r in records] == ["bot started", "client connected"]
+    assert [r["logger"] for r in records] == ["bots.test", "bots.test_client"]
+    assert log.propagate and not log.handlers
+
+
+def test_setup_logger_keeps_colored_handler_without_structlog(stream, monkeypatch):
+    from shared.core import logger as bot_logger
+
+    monkeypatch.setattr(bot_logger, "_structured", False)
+    monkeypatch.setattr(bot_logger, "STRUCTLOG_AVAILABLE", False)
+    root_handlers = logging.getLogger().handlers[:]
+
+    log = bot_logger.setup_logger("bots.plain", level="INFO", renderer="json")
+
+    assert not log.propagate
+    assert [type(h) for h in log.handlers] == [logging.StreamHandler]
+    assert isinstance(log.handlers[0].formatter, bot_logger.ColoredFormatter)
+    assert logging.getLogger().handlers == root_handlers
+    assert not bot_logger._structured
@@ -0,0 +1,158 @@
+"""
+Test Patterns
+=============
+Compare the JIT pattern scanners with vectorised NumPy references. A
+missing candle (NaN) must never produce a signal.
+"""
+
+import numpy as np
+import pytest
+
+from shared.core.exceptions import BotIndicatorError
+from shared.utils import patterns
+
+
+def make_candles(n=500, seed=11, gaps=False):
+    """Random OHLC columns with plenty of small/large bodies and shadows."""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(n).cumsum()
+    open_ = close + rng.standard_normal(n)
+    high = np.maximum(open_, close) + rng.random(n) * 2
+    low = np.minimum(open_, close) - rng.random(n) * 2
+    if gaps:
+        for col in (open_, high, low, close):
+            col[[30, 31, 250]] = np.nan
+        close[400] = np.nan
+    return open_, high, low, close
+
+
+def shift(values, k):
+    """values[i - k] at position i, NaN before the start."""
+    out = np.full_like(values, np.nan)
+    out[k:] = values[:-k]
+    return out
+
+
+# ==================== NumPy references ====================
+def ref_engulfing(o, h, l, c):
+    po, pc = shift(o, 1), shift(c, 1)
+    bullish = (pc < po) & (c > o) & (o <= pc) & (c >= po)
+    bearish = (pc > po) & (c < o) & (o >= pc) & (c <= po)
+    return np.where(bullish, 1, np.where(bearish, -1, 0))
+
+
+def ref_hammer(o, h, l, c):
+    body = np.abs(c - o)
+    lower = np.minimum(o, c) - l
+    upper = h - np.maximum(o, c)
+    real = body > 0
+    hammer = real & (lower >= 2 * body) & (upper <= body)
+    star = real & (upper >= 2 * body) & (lower <= body)
+    return np.where(hammer, 1, np.where(star, -1, 0))
+
+
+def ref_doji(o, h, l, c, ratio):
+    rng = h - l
+    return np.where((rng > 0) & (np.abs(c - o) <= ratio * rng), 1, 0)
+
+
+def ref_fair_value_gaps(h, l, c, min_gap):
+    threshold = min_gap * shift(c, 1)
+    h2, l2 = shift(h, 2), shift(l, 2)
+    bullish = (l - h2 >= threshold) & (l > h2)
+    bearish = (l2 - h >= threshold) & (h < l2)
+    return np.where(bullish, 1, np.where(bearish, -1, 0))
+
+
+def ref_order_blocks(o, h, l, c, min_candles, body_ratio):
+    n = len(c)
+    direction = np.sign(o - c)  # bearish block candle -> bullish block
+    out = np.zeros(n, dtype=int)
+    for i in range(n - min_candles):
+        d = direction[i]
+        if not d:
+            continue
+        j = slice(i + 1, i + min_candles + 1)
+        body = (c[j] - o[j]) * d
+        if not np.all((body > 0) & (body >= body_ratio * (h[j] - l[j]))):
+            continue
+        last = c[i + min_candles]
+        if (d == 1 and last > h[i]) or (d == -1 and last < l[i]):
+            out[i] = d
+    return out
+
+
+# ==================== scanners ====================
+@pytest.mark.parametrize("gaps", [False, True])
+def test_engulfing_matches_reference(gaps):
+    ohlc = make_candles(gaps=gaps)
+    result = patterns.detect_engulfing(*ohlc)
+
+    assert result.dtype == np.int8
+    np.testing.assert_array_equal(result, ref_engulfing(*ohlc))
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+def test_hammer_matches_reference(gaps):
+    ohlc = make_candles(gaps=gaps)
+    np.testing.assert_array_equal(patterns.detect_hammer(*ohlc), ref_hammer(*ohlc))
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+def test_doji_matches_reference(gaps):
+    ohlc = make_candles(gaps=gaps)
+    np.testing.assert_array_equal(
+        patterns.detect_doji(*ohlc, max_body_ratio=0.2), ref_doji(*ohlc, 0.2)
+    )
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+def test_fair_value_gaps_match_reference(gaps):
+    _, high, low, close = make_candles(gaps=gaps)
+    result = patterns.detect_fair_value_gaps(high, low, close, min_gap_percent=0.5)
+
+    np.testing.assert_array_equal(result, ref_fair_value_gaps(high, low, close, 0.005))
+    assert result.any()
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+def test_order_blocks_match_reference(gaps):
+    ohlc = make_candles(gaps=gaps)
+    result = patterns.detect_order_blocks(*ohlc, min_candles=2, body_percent=40)
+
+    np.testing.assert_array_equal(result, ref_order_blocks(*ohlc, 2, 0.4))
+    assert result.any()
+
+
+def test_missing_candles_never_signal():
+    ohlc = make_candles(gaps=True)
+    missing = np.isnan(np.column_stack(ohlc)).any(axis=1)
+
+    assert not patterns.detect_hammer(*ohlc)[missing].any()
+    assert not patterns.detect_doji(*ohlc)[missing].any()
+    assert not patterns.detect_engulfing(*ohlc)[missing].any()
+
+
+def test_candlestick_patterns_split_signs():
+    ohlc = make_candles()
+    found = patterns.detect_candlestick_patterns(*ohlc)
+    engulfing = ref_engulfing(*ohlc)
+    hammer = ref_hammer(*ohlc)
+
+    np.testing.assert_array_equal(found["engulfing_bullish"], engulfing == 1)
+    np.testing.assert_array_equal(found["engulfing_bearish"], engulfing == -1)
+    np.testing.assert_array_equal(found["hammer"], hammer == 1)
+    np.testing.assert_array_equal(found["shooting_star"], hammer == -1)
+    np.testing.assert_array_equal(found["doji"], ref_doji(*ohlc, 0.1) == 1)
+
+
+def test_strided_columns_are_accepted():
+    ohlc = np.column_stack(make_candles())
+    result = patterns.detect_engulfing(*(ohlc[:, k] for k in range(4)))
+
+    np.testing.assert_array_equal(result, ref_engulfing(*ohlc.T))
+
+
+def test_mismatched_columns_raise():
+    with pytest.raises(BotIndicatorError):
+        patterns.detect_engulfing([1.0, 2.0], [1.0], [1.0, 2.0], [1.0, 2.0])
@@ -0,0 +1,95 @@
+"""
+Test RabbitMQ Client
+====================
+Check publish_raw_batch against a mocked exchange: confirm batching and
+the delivery mode chosen from the persistent flag.
+"""
+
+import asyncio
+
+import pytest
+from aio_pika import DeliveryMode
+
+from shared.core.exceptions import BotError
+from shared.messaging.rabbitmq_client import RabbitMQClient
+
+EXCHANGE = "market_data_exchange"
+
+
+class FakeExchange:
+    """Records publishes and how many were in flight when each started."""
+
+    def __init__(self, fail_on=None):
+        self.messages = []
+        self.in_flight_at_start = []
+        self.fail_on = fail_on
+        self._in_flight = 0
+
+    async def publish(self, message, routing_key):
+        self._in_flight += 1
+        self.in_flight_at_start.append(self._in_flight)
+        try:
+            # Yield so the rest of the batch starts before this confirms
+            await asyncio.sleep(0)
+            if message.body == self.fail_on:
+                raise ConnectionError("channel closed")
+            self.messages.append((message, routing_key))
+        finally:
+            self._in_flight -= 1
+
+
+def make_client(exchange):
+    client = RabbitMQClient()
+    client._is_connected = True
+    client.exchanges = {EXCHANGE: exchange}
+    return client
+
+
+def publish(client, bodies, **kwargs):
+    asyncio.run(
+        client.publish_raw_batch(
+            bodies, exchange=EXCHANGE, routing_key="market.ohlcv.update", **kwargs
+        )
+    )
+
+
+def test_batch_awaits_confirms_per_batch():
+    exchange = FakeExchange()
+    bodies = [b"m%d" % i for i in range(7)]
+
+    publish(make_client(exchange), bodies, confirm_batch=3)
+
+    # 3 + 3 + 1 in flight, each batch confirmed before the next starts
+    assert exchange.in_flight_at_start == [1, 2, 3, 1, 2, 3, 1]
+    assert [m.body for m, _ in exchange.messages] == bodies
+    assert {key for _, key in exchange.messages} == {"market.ohlcv.update"}
+
+
+@pytest.mark.parametrize(
+    "persistent, mode",
+    [(True, DeliveryMode.PERSISTENT), (False, DeliveryMode.NOT_PERSISTENT)],
+)
+def test_batch_delivery_mode(persistent, mode):
+    exchange = FakeExchange()
+
+    publish(make_client(exchange), [b"a", b"b"], persistent=persistent)
+
+    assert [m.delivery_mode for m, _ in exchange.messages] == [mode, mode]
+
+
+def test_batch_unknown_exchange():
+    client = make_client(FakeExchange())
+    client.exchanges = {}
+
+    with pytest.raises(BotError, match="Exchange not found"):
+        publish(client, [b"a"])
+
+
+def test_batch_publish_failure_raises_bot_error():
+    exchange = FakeExchange(fail_on=b"m4")
+
+    with pytest.raises(BotError, match="publishing failed"):
+        publish(make_client(exchange), [b"m%d" % i for i in range(6)], confirm_batch=3)
+
+    # The first batch was confirmed; the failing batch stops the publish
+    assert [m.body for m, _ in exchange.messages][:3] == [b"m0", b"m1", b"m2"]
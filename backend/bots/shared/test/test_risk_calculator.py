@@ -0,0 +1,174 @@
+"""
+Test Risk Calculator
+====================
+Check the JIT risk kernels against NumPy references and the validation
+paths of RiskCalculator.
+"""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from shared.core.exceptions import BotValidationError
+from shared.utils import risk_calculator
+from shared.utils.risk_calculator import RiskCalculator
+
+
+def make_curves(n_curves=8, n_points=250, seed=3):
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.001, 0.02, size=(n_curves, n_points - 1))
+    start = np.full((n_curves, 1), 10000.0)
+    return np.hstack([start, 10000.0 * np.cumprod(1 + returns, axis=1)])
+
+
+def ref_max_drawdown(equity):
+    peak = np.maximum.accumulate(equity)
+    return abs(((equity - peak) / peak).min()) * 100
+
+
+def ref_profit_factor(equity):
+    pnl = np.diff(equity)
+    return pnl[pnl > 0].sum() / -pnl[pnl <= 0].sum()
+
+
+@pytest.fixture
+def calculator():
+    return RiskCalculator(10000, default_risk_percentage=1.0, min_rr_ratio=2.0)
+
+
+# ==================== scalar kernels ====================
+def test_position_size(calculator):
+    # 1% of 10k = 100 at risk over a 500 stop
+    assert calculator.calculate_position_size(45000, 44500) == pytest.approx(0.2)
+    assert calculator.calculate_position_size(
+        45000, 45500, risk_percentage=2
+    ) == pytest.approx(0.4)
+    assert risk_calculator.calculate_position_size(
+        10000, 45000, 44500
+    ) == pytest.approx(0.2)
+
+
+def test_position_size_rejects_zero_risk(calculator):
+    with pytest.raises(BotValidationError):
+        calculator.calculate_position_size(45000, 45000)
+
+
+def test_inputs_are_coerced_to_float():
+    calculator = RiskCalculator(Decimal("10000"), default_risk_percentage="1")
+
+    assert calculator.calculate_position_size(
+        Decimal("45000"), Decimal("44500")
+    ) == pytest.approx(0.2)
+    assert risk_calculator.calculate_rr_ratio(
+        Decimal("100"), Decimal("95"), Decimal("120")
+    ) == pytest.approx(4.0)
+
+    with pytest.raises(BotValidationError):
+        calculator.calculate_position_size("not a price", 44500)
+
+
+def test_rr_ratio_and_take_profit(calculator):
+    assert calculator.calculate_risk_reward_ratio(100, 95, 120) == pytest.approx(4.0)
+    assert calculator.calculate_take_profit_for_rr(100, 95, "BUY", 3) == 115
+    assert calculator.calculate_take_profit_for_rr(100, 105, "sell", 3) == 85
+    assert calculator.calculate_multiple_targets(100, 95, "BUY") == [110, 120, 130]
+
+    with pytest.raises(BotValidationError):
+        risk_calculator.calculate_rr_ratio(100, 100, 120)
+
+
+def test_breakeven_and_trailing_stop(calculator):
+    assert calculator.calculate_breakeven_point(100, 90, "BUY") == pytest.approx(100.5)
+    assert calculator.calculate_breakeven_point(100, 110, "SELL") == pytest.approx(
+        99.5
+    )
+    assert calculator.calculate_trailing_stop(100, 120, "BUY") == pytest.approx(117.6)
+    assert calculator.calculate_trailing_stop(100, 80, "SELL") == pytest.approx(81.6)
+
+
+def test_unknown_side_raises(calculator):
+    with pytest.raises(BotValidationError):
+        calculator.calculate_take_profit_for_rr(100, 95, "HOLD")
+
+
+def test_validate_signal_risk(calculator):
+    ok, _, metrics = calculator.validate_signal_risk(100, 95, 120, "BUY")
+    assert ok
+    assert metrics["rr_ratio"] == pytest.approx(4.0)
+    assert metrics["potential_loss"] == pytest.approx(100)
+    assert metrics["potential_profit"] == pytest.approx(400)
+
+    ok, reason, _ = calculator.validate_signal_risk(100, 105, 120, "BUY")
+    assert not ok and "Invalid price levels" in reason
+
+    ok, reason, _ = calculator.validate_signal_risk(100, 95, 105, "BUY")
+    assert not ok and "below minimum" in reason
+
+    assert risk_calculator.validate_signal(100, 105, 80, "SELL")[0]
+    assert not risk_calculator.validate_signal(100, 95, 95, "SELL")[0]
+
+
+# ==================== series kernels ====================
+def test_sharpe_ratio_matches_numpy(calculator):
+    returns = np.random.default_rng(5).normal(0.01, 0.05, 500)
+
+    expected = returns.mean() / returns.std()
+    assert calculator.calculate_sharpe_ratio(returns) == pytest.approx(expected)
+    assert calculator.calculate_sharpe_ratio(
+        returns, risk_free_rate=0.002
+    ) == pytest.approx((returns.mean() - 0.002) / returns.std())
+
+
+def test_sharpe_ratio_of_constant_returns_is_zero(calculator):
+    # A large mean must not leave a rounding-error variance behind
+    assert calculator.calculate_sharpe_ratio([1e8 + 0.1] * 1000) == 0.0
+    assert calculator.calculate_sharpe_ratio([0.01]) == 0.0
+
+
+def test_max_drawdown_matches_numpy(calculator):
+    equity = make_curves(1)[0]
+
+    drawdown, start, end = calculator.calculate_max_drawdown(equity)
+
+    assert drawdown == pytest.approx(ref_max_drawdown(equity))
+    assert start <= end
+    assert equity[start] == equity[: end + 1].max()
+
+
+def test_max_drawdown_rejects_non_positive_start(calculator):
+    with pytest.raises(BotValidationError):
+        calculator.calculate_max_drawdown([0.0, 1.0])
+
+
+def test_profit_factor(calculator):
+    assert calculator.calculate_profit_factor([10, 20], [-5, -10]) == 2.0
+    assert calculator.calculate_profit_factor([10], []) == float("inf")
+    assert calculator.calculate_profit_factor([], []) == 0.0
+
+
+def test_batch_metrics_match_numpy():
+    curves = make_curves()
+
+    sharpes, drawdowns, profit_factors = risk_calculator.batch_metrics(curves)
+
+    for i, equity in enumerate(curves):
+        returns = np.diff(equity) / equity[:-1]
+        assert sharpes[i] == pytest.approx(returns.mean() / returns.std())
+        assert drawdowns[i] == pytest.approx(ref_max_drawdown(equity))
+        assert profit_factors[i] == pytest.approx(ref_profit_factor(equity))
+
+
+def test_batch_metrics_flat_curve():
+    sharpes, drawdowns, profit_factors = risk_calculator.batch_metrics(
+        np.full((1, 10), 100.0)
+    )
+
+    assert sharpes[0] == 0.0 and drawdowns[0] == 0.0 and profit_factors[0] == 0.0
+
+
+def test_batch_metrics_rejects_bad_shapes():
+    with pytest.raises(BotValidationError):
+        risk_calculator.batch_metrics(np.ones(10))
+    with pytest.raises(BotValidationError):
+        risk_calculator.batch_metrics(np.zeros((2, 10)))
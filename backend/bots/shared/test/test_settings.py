@@ -0,0 +1,61 @@
+"""
+Test Settings
+=============
+Check the typed settings built from the constants and TOML overrides.
+"""
+
+import dataclasses
+
+import pytest
+
+from crypto_trading_shared.constants import REDIS_TTL, RISK_LIMITS
+from crypto_trading_shared.settings import build_settings, load_settings
+
+
+def test_defaults_mirror_constants():
+    settings = load_settings()
+
+    assert dataclasses.asdict(settings.risk_limits) == dict(RISK_LIMITS)
+    assert dataclasses.asdict(settings.redis_ttl) == dict(REDIS_TTL)
+
+
+def test_settings_are_frozen():
+    settings = build_settings()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.risk_limits.min_risk_reward = 1.0
+
+
+def test_build_settings_overrides_single_keys():
+    settings = build_settings({"risk_limits": {"min_risk_reward": 3.0}})
+
+    assert settings.risk_limits.min_risk_reward == 3.0
+    assert settings.risk_limits.max_drawdown == RISK_LIMITS["max_drawdown"]
+    assert settings.redis_ttl.price_cache == REDIS_TTL["price_cache"]
+
+
+def test_load_settings_reads_toml(tmp_path):
+    path = tmp_path / "settings.toml"
+    path.write_text(
+        "[risk_limits]\n"
+        "max_risk_per_trade = 1.5\n"
+        "\n"
+        "[redis_ttl]\n"
+        "price_cache = 30\n"
+    )
+
+    settings = load_settings(str(path))
+
+    assert settings.risk_limits.max_risk_per_trade == 1.5
+    assert settings.redis_ttl.price_cache == 30
+    assert settings.redis_ttl.session == REDIS_TTL["session"]
+
+
+def test_unknown_section_raises():
+    with pytest.raises(ValueError, match="sections"):
+        build_settings({"risk": {"min_risk_reward": 3.0}})
+
+
+def test_unknown_key_raises():
+    with pytest.raises(ValueError, match=r"\[redis_ttl\]"):
+        build_settings({"redis_ttl": {"prices": 30}})
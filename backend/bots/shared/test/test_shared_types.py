@@ -0,0 +1,411 @@
+"""
+Test Shared Types
+=================
+Round-trip the msgspec wire structs and the batch JSON helpers of
+crypto_trading_shared.types, and check the transport JSON output, the
+computed fields and the TradeResultBatch analytics.
+"""
+
+import json
+import math
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import msgspec
+import pytest
+from pydantic import ValidationError
+
+from crypto_trading_shared.enums import TradeOutcome
+from crypto_trading_shared.types import (
+    APIResponse,
+    BotHealthMetrics,
+    MessagePayload,
+    MessagePayloadMsg,
+    NotificationMessage,
+    NotificationMsg,
+    PerformanceMetrics,
+    TradeLevels,
+    TradeResult,
+    TradeResultBatch,
+    decode_message_payload,
+    decode_notification,
+    dump_many,
+    encode_msgpack,
+    parse_many,
+)
+
+NOW = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+
+def make_payload(**overrides):
+    fields = {
+        "message_id": "msg-1",
+        "message_type": "signal.created",
+        "timestamp": NOW,
+        "data": {"symbol": "BTCUSDT", "price": 45000.5, "levels": [1, 2, 3]},
+        "source": "signal_bot",
+        "priority": 8,
+    }
+    fields.update(overrides)
+    return MessagePayload(**fields)
+
+
+def make_notification(**overrides):
+    fields = {
+        "notification_id": "n-1",
+        "channel": "telegram",
+        "recipient": "@trader",
+        "subject": "New signal",
+        "message": "BUY BTCUSDT",
+        "created_at": NOW,
+        "signal_id": "sig-1",
+    }
+    fields.update(overrides)
+    return NotificationMessage(**fields)
+
+
+def make_trade(i):
+    return TradeResult(
+        trade_id=f"t-{i}",
+        signal_id=f"sig-{i}",
+        symbol="BTCUSDT",
+        signal_type="buy",
+        entry_price=Decimal("45000.5"),
+        exit_price=Decimal("46000.25"),
+        entry_time=NOW,
+        exit_time=NOW + timedelta(minutes=90),
+        outcome="win",
+        profit_loss=Decimal("999.75"),
+        profit_loss_percent=2.22,
+        stop_loss=Decimal("44000"),
+        take_profit=Decimal("49000"),
+        actual_risk_reward=1.0,
+        position_size=Decimal("0.5"),
+        duration_minutes=90 + i,
+    )
+
+
+# ==================== msgspec wire structs ====================
+def test_message_payload_round_trip():
+    payload = make_payload()
+
+    decoded = decode_message_payload(
+        encode_msgpack(MessagePayloadMsg.from_model(payload))
+    )
+
+    assert decoded.message_id == "msg-1"
+    assert decoded.message_type == "signal.created"
+    assert decoded.timestamp == NOW
+    assert decoded.priority == 8
+    assert decoded.decode_data() == payload.data
+
+
+def test_message_payload_data_stays_raw():
+    body = encode_msgpack(MessagePayloadMsg.from_model(make_payload()))
+
+    decoded = decode_message_payload(body)
+
+    assert isinstance(decoded.data, msgspec.Raw)
+    # Forwarding re-encodes the untouched body byte for byte
+    assert encode_msgpack(decoded) == body
+
+
+def test_message_payload_decode_data_validates_type():
+    decoded = decode_message_payload(
+        encode_msgpack(MessagePayloadMsg.from_model(make_payload(data={"a": 1})))
+    )
+
+    assert decoded.decode_data(dict[str, int]) == {"a": 1}
+    with pytest.raises(msgspec.ValidationError):
+        decoded.decode_data(dict[str, str])
+
+
+def test_notification_round_trip():
+    attachments = [{"type": "chart", "url": "https://example.com/c.png"}]
+    notification = make_notification(attachments=attachments)
+
+    body = encode_msgpack(NotificationMsg.from_model(notification))
+    decoded = decode_notification(body)
+
+    assert decoded.channel == "telegram"
+    assert decoded.signal_id == "sig-1"
+    assert decoded.created_at == NOW
+    assert decoded.decode_attachments() == attachments
+    assert encode_msgpack(decoded) == body
+
+
+def test_notification_without_attachments():
+    decoded = decode_notification(
+        encode_msgpack(NotificationMsg.from_model(make_notification()))
+    )
+
+    assert decoded.decode_attachments() is None
+
+
+def test_notification_rejects_unknown_channel():
+    body = msgspec.msgpack.encode(
+        {
+            "notification_id": "n-1",
+            "channel": "pager",
+            "recipient": "x",
+            "subject": "s",
+            "message": "m",
+            "created_at": NOW,
+        }
+    )
+
+    with pytest.raises(msgspec.ValidationError):
+        decode_notification(body)
+
+
+# ==================== batch JSON ====================
+def test_dump_many_matches_per_item_dump():
+    trades = [make_trade(i) for i in range(5)]
+
+    raw = dump_many(TradeResult, trades)
+
+    assert json.loads(raw) == [json.loads(t.model_dump_json()) for t in trades]
+
+
+def test_parse_many_round_trip():
+    trades = [make_trade(i) for i in range(5)]
+
+    parsed = parse_many(TradeResult, dump_many(TradeResult, trades))
+
+    assert parsed == trades
+    assert parsed[0].entry_price == Decimal("45000.5")
+
+
+def test_parse_many_rejects_invalid_items():
+    raw = json.loads(dump_many(TradeResult, [make_trade(0)]))
+    raw[0]["outcome"] = "unknown"
+
+    with pytest.raises(ValidationError):
+        parse_many(TradeResult, json.dumps(raw))
+
+
+def test_parse_many_empty():
+    assert parse_many(TradeResult, b"[]") == []
+
+
+# ==================== transport datetimes ====================
+def make_bot_health():
+    return BotHealthMetrics(
+        bot_name="signal_bot",
+        bot_type="signal",
+        status="running",
+        started_at=NOW,
+        last_heartbeat=NOW + timedelta(minutes=5),
+        messages_processed=100,
+        messages_failed=4,
+        avg_processing_time_ms=1.5,
+        health_score=90,
+    )
+
+
+def test_bot_health_dumps_datetimes_as_epoch_seconds():
+    health = make_bot_health()
+
+    for raw in (health.to_json(), health.model_dump_json()):
+        dumped = json.loads(raw)
+        assert dumped["started_at"] == NOW.timestamp()
+        assert dumped["last_heartbeat"] == NOW.timestamp() + 300
+
+
+def test_api_response_dumps_datetimes_as_epoch_seconds():
+    response = APIResponse[BotHealthMetrics](
+        success=True, message="ok", data=make_bot_health(), timestamp=NOW
+    )
+
+    dumped = json.loads(response.to_json())
+
+    assert dumped["timestamp"] == NOW.timestamp()
+    assert dumped["data"]["started_at"] == NOW.timestamp()
+
+
+# ==================== computed fields ====================
+def make_metrics(**overrides):
+    fields = {
+        "total_trades": 20,
+        "winning_trades": 13,
+        "losing_trades": 6,
+        "break_even_trades": 1,
+        "total_profit": Decimal("1300"),
+        "total_loss": Decimal("520"),
+        "net_profit": Decimal("780"),
+        "avg_win": Decimal("100"),
+        "avg_loss": Decimal("86.67"),
+        "avg_rr_ratio": 2.5,
+        "max_drawdown": 300.0,
+        "max_drawdown_percent": 3.0,
+        "max_consecutive_wins": 5,
+        "max_consecutive_losses": 2,
+        "current_streak": 1,
+        "period_start": NOW,
+        "period_end": NOW + timedelta(days=30),
+    }
+    fields.update(overrides)
+    return PerformanceMetrics(**fields)
+
+
+def test_performance_rates_are_percent():
+    metrics = make_metrics()
+
+    assert metrics.win_rate == pytest.approx(65.0)
+    assert metrics.loss_rate == pytest.approx(30.0)
+    assert metrics.profit_factor == pytest.approx(2.5)
+    assert json.loads(metrics.to_json())["win_rate"] == pytest.approx(65.0)
+
+
+def test_performance_rates_without_trades_or_losses():
+    empty = make_metrics(
+        total_trades=0, winning_trades=0, losing_trades=0, break_even_trades=0
+    )
+    assert empty.win_rate == 0.0 and empty.loss_rate == 0.0
+
+    assert make_metrics(total_loss=Decimal("0")).profit_factor == float("inf")
+    assert (
+        make_metrics(total_profit=Decimal("0"), total_loss=Decimal("0")).profit_factor
+        == 0.0
+    )
+
+
+def test_computed_fields_are_not_parsed():
+    dumped = json.loads(make_metrics().to_json())
+    dumped["win_rate"] = 1.0
+
+    assert PerformanceMetrics.model_validate(dumped).win_rate == pytest.approx(65.0)
+
+
+def test_bot_health_uptime_and_success_rate():
+    health = make_bot_health()
+
+    assert health.uptime_seconds == 300
+    assert health.success_rate == pytest.approx(96.0)
+
+    idle = health.model_copy(update={"messages_processed": 0, "messages_failed": 0})
+    assert idle.success_rate == 100.0
+
+
+def test_model_copy_recomputes_cached_fields():
+    levels = TradeLevels(entry_price=100, stop_loss=95, take_profit=120)
+    assert levels.risk_reward_ratio == pytest.approx(4.0)
+
+    moved = levels.model_copy(update={"take_profit": 110})
+
+    assert moved.risk_reward_ratio == pytest.approx(2.0)
+    assert levels.risk_reward_ratio == pytest.approx(4.0)
+
+
+# ==================== trade batch ====================
+# (signal_type, entry, exit, P/L, P/L %, R:R, outcome), in exit order
+TRADES = [
+    ("buy", "100", "110", 100, 10.0, 2.0, "taken_profit"),
+    ("long", "100", "105", 50, 5.0, 1.0, "win"),
+    ("sell", "100", "104", -40, -4.0, -0.5, "loss"),
+    ("short", "100", "110", -100, -10.0, -1.0, "stopped_out"),
+    ("buy", "100", "100", 0, 0.0, 0.0, "break_even"),
+    ("sell", "100", "90", 60, 6.0, 1.5, "partial_win"),
+    ("buy", "0.00012345", "0.00012590", 20, 2.0, 0.5, "win"),
+]
+
+
+def make_closed_trade(i, signal_type, entry, exit, pl, pl_percent, rr, outcome):
+    return make_trade(i).model_copy(
+        update={
+            "signal_type": signal_type,
+            "entry_price": Decimal(entry),
+            "exit_price": Decimal(exit),
+            "profit_loss": Decimal(pl),
+            "profit_loss_percent": pl_percent,
+            "actual_risk_reward": rr,
+            "outcome": outcome,
+        }
+    )
+
+
+@pytest.fixture
+def batch():
+    return TradeResultBatch.from_trades(
+        [make_closed_trade(i, *trade) for i, trade in enumerate(TRADES)]
+    )
+
+
+def test_batch_columns(batch):
+    assert len(batch) == 7
+    assert batch.entry_price.dtype == "int64"
+    assert batch.entry_price[0] == 100 * 10**8
+    assert batch.exit_price[-1] == 12590
+    assert batch.direction.tolist() == [1, 1, -1, -1, 1, -1, 1]
+    assert batch.price_move.tolist() == [
+        10 * 10**8, 5 * 10**8, -4 * 10**8, -10 * 10**8, 0, 10 * 10**8, 245
+    ]
+
+
+def test_batch_pl_matches_price_moves(batch):
+    assert batch.pl_mismatches().tolist() == []
+
+    # Fees turned a small long gain into a loss
+    fees = make_closed_trade(7, "buy", "100", "100.5", -1, -0.01, -0.1, "loss")
+    mixed = TradeResultBatch.from_trades([fees, make_trade(8), fees])
+
+    assert mixed.pl_mismatches().tolist() == [0, 2]
+
+
+def test_batch_performance_metrics(batch):
+    metrics = batch.performance_metrics(NOW, NOW + timedelta(days=7))
+
+    # Equity 0, 100, 150, 110, 10, 10, 70, 90: deepest fall 150 -> 10;
+    # compounded 1.155 -> 0.99792 (x 0.96 x 0.90) is a 13.6% drawdown
+    expected = make_metrics(
+        total_trades=7,
+        winning_trades=4,
+        losing_trades=2,
+        break_even_trades=1,
+        total_profit=Decimal("230"),
+        total_loss=Decimal("140"),
+        net_profit=Decimal("90"),
+        avg_win=Decimal("57.5"),
+        avg_loss=Decimal("70"),
+        avg_rr_ratio=0.5,
+        max_drawdown=140.0,
+        max_drawdown_percent=13.6,
+        sharpe_ratio=(9 / 7) / math.sqrt(281 / 7 - (9 / 7) ** 2),
+        max_consecutive_wins=2,
+        max_consecutive_losses=2,
+        current_streak=2,
+        period_end=NOW + timedelta(days=7),
+    )
+    period = {"period_start", "period_end"}
+    assert metrics.model_dump(exclude=period) == pytest.approx(
+        expected.model_dump(exclude=period)
+    )
+    assert metrics.period_end == expected.period_end
+    assert metrics.win_rate == pytest.approx(batch.win_rate) == pytest.approx(
+        400 / 7
+    )
+
+
+def test_batch_streak_ends_on_losses_or_break_even():
+    losing = TradeResultBatch.from_trades(
+        [make_closed_trade(i, *trade) for i, trade in enumerate(TRADES[:4])]
+    )
+    flat = TradeResultBatch.from_trades(
+        [make_closed_trade(i, *trade) for i, trade in enumerate(TRADES[:5])]
+    )
+
+    assert losing.performance_metrics(NOW, NOW).current_streak == -2
+    assert flat.performance_metrics(NOW, NOW).current_streak == 0
+
+
+def test_batch_outcomes_round_trip(batch):
+    assert batch.outcomes() == [TradeOutcome(trade[-1]) for trade in TRADES]
+
+
+def test_empty_batch():
+    empty = TradeResultBatch.from_trades([])
+    metrics = empty.performance_metrics(NOW, NOW)
+
+    assert empty.win_rate == 0.0 and empty.sharpe_ratio is None
+    assert metrics.total_trades == 0 and metrics.max_drawdown == 0.0
+    assert empty.pl_mismatches().size == 0 and empty.outcomes() == []
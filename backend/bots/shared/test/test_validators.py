@@ -0,0 +1,124 @@
+"""
+Test Validators
+===============
+Check the batch OHLCV validator against the row-by-row validator and the
+signal price-order checks.
+"""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from shared.core.exceptions import BotValidationError
+from shared.utils.validators import DataValidator, validate_price_data, validate_signal
+
+
+def make_batch(n=200, seed=9):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.random(n) * 10
+    open_ = close + rng.standard_normal(n)
+    high = np.maximum(open_, close) + rng.random(n)
+    low = np.minimum(open_, close) - rng.random(n)
+    volume = rng.random(n) * 1000
+    return np.column_stack([open_, high, low, close, volume])
+
+
+def row_is_valid(row):
+    try:
+        return DataValidator.validate_ohlcv(*row)
+    except BotValidationError:
+        return False
+
+
+# ==================== OHLCV ====================
+def test_batch_accepts_clean_rows():
+    batch = make_batch()
+
+    assert DataValidator.validate_ohlcv_batch(batch).all()
+
+
+def test_batch_mask_matches_row_validator():
+    batch = make_batch()
+    batch[5, 1] = batch[5, 2] - 1  # high below low
+    batch[17, 2] = 0  # non-positive low
+    batch[42, 4] = -1  # negative volume
+    batch[80, 3] = batch[80, 1] + 1  # close above high
+    batch[99, 0] = np.nan  # missing open
+    batch[150, 1] = 2e10  # absurd high
+
+    mask = DataValidator.validate_ohlcv_batch(batch, raise_on_invalid=False)
+
+    expected = np.array([row_is_valid(row) for row in batch])
+    np.testing.assert_array_equal(mask, expected)
+    assert np.flatnonzero(~mask).tolist() == [5, 17, 42, 80, 99, 150]
+
+
+def test_batch_raises_on_first_invalid_row():
+    batch = make_batch()
+    batch[[12, 30], 4] = -1
+
+    with pytest.raises(BotValidationError, match="row 12"):
+        DataValidator.validate_ohlcv_batch(batch)
+
+
+def test_batch_rejects_wrong_shape():
+    with pytest.raises(BotValidationError):
+        DataValidator.validate_ohlcv_batch(np.ones((10, 4)))
+
+
+def test_validate_price_data():
+    assert validate_price_data(
+        {"open": 100, "high": 105, "low": 95, "close": 102, "volume": 10}
+    )
+    with pytest.raises(BotValidationError):
+        validate_price_data({"open": 100, "high": 105, "low": 95, "close": 102})
+
+
+# ==================== signals ====================
+def make_signal(**overrides):
+    signal = {
+        "symbol": "BTCUSDT",
+        "signal_type": "BUY",
+        "entry_price": 45000,
+        "stop_loss": 44000,
+        "take_profit": 49000,
+        "confidence": 0.8,
+        "timeframe": "1h",
+    }
+    signal.update(overrides)
+    return signal
+
+
+def test_validate_signal_price_order():
+    assert validate_signal(make_signal())
+    assert validate_signal(
+        make_signal(signal_type="sell", stop_loss=46000, take_profit=41000)
+    )
+
+    with pytest.raises(BotValidationError, match="For BUY"):
+        validate_signal(make_signal(stop_loss=46000))
+    with pytest.raises(BotValidationError, match="For SELL"):
+        validate_signal(make_signal(signal_type="SELL"))
+
+
+def test_validate_signal_accepts_decimal_prices():
+    assert validate_signal(
+        make_signal(
+            entry_price=Decimal("45000.10"),
+            stop_loss=Decimal("44000"),
+            take_profit=Decimal("49000.5"),
+        )
+    )
+    with pytest.raises(BotValidationError):
+        validate_signal(make_signal(take_profit=Decimal("44999.99")))
+
+
+def test_validate_signal_accepts_mixed_price_types():
+    assert validate_signal(
+        make_signal(
+            entry_price=Decimal("45000.10"), stop_loss=44000.0, take_profit="49000.5"
+        )
+    )
+    with pytest.raises(BotValidationError, match="For BUY"):
+        validate_signal(make_signal(entry_price=Decimal("45000"), stop_loss=46000.0))
@@ -4,11 +4,19 @@ from .indicators import (
     bollinger_bands, atr, keltner_channels,
     obv, vwap, mfi,
     trend_strength, volatility_index, support_resistance_levels,
-    calculate_all_indicators
+    calculate_all_indicators,
+    IndicatorState, update_indicators, reset_indicator_state
+)
+
+from .patterns import (
+    detect_engulfing, detect_hammer, detect_doji,
+    detect_fair_value_gaps, detect_order_blocks,
+    detect_candlestick_patterns
 )
 
 from .risk_calculator import (
     RiskCalculator,
+    batch_metrics,
     calculate_position_size,
     calculate_rr_ratio,
     validate_signal
@@ -60,9 +68,21 @@ __all__ = [
     'obv', 'vwap', 'mfi',
     'trend_strength', 'volatility_index', 'support_resistance_levels',
     'calculate_all_indicators',
+    'IndicatorState',
+    'update_indicators',
+    'reset_indicator_state',
+    
+    # Patterns
+    'detect_engulfing',
+    'detect_hammer',
+    'detect_doji',
+    'detect_fair_value_gaps',
+    'detect_order_blocks',
+    'detect_candlestick_patterns',
     
     # Risk Calculator
     'RiskCalculator',
+    'batch_metrics',
     'calculate_position_size',
     'calculate_rr_ratio',
     'validate_signal',
@@ -298,4 +298,74 @@ Sharpe Ratio:     {metrics.get('sharpe_ratio', 0):.2f}
 """.strip()
         except Exception as e:
             logger.error(f"Performance summary formatting failed: {e}")
-            return "Performance summary formatting error"
\ No newline at end of file
+            return "Performance summary formatting error"
+
+
+# Convenience functions
+def format_signal_short(signal_data: dict) -> str:
+    """
+    Format signal as one line, e.g. "BUY BTCUSDT @ $45,000.00 (R/R 1:4.0)".
+
+    Args:
+        signal_data: Signal dictionary
+
+    Returns:
+        One-line signal summary
+    """
+    try:
+        rr_ratio = float(signal_data.get('risk_reward_ratio') or 0)
+        return (
+            f"{signal_data.get('signal_type')} {signal_data.get('symbol')} @ "
+            f"{DataFormatter.format_price(signal_data.get('entry_price'))} "
+            f"(R/R 1:{rr_ratio:.1f})"
+        )
+    except (ValueError, TypeError):
+        return "N/A"
+
+
+def format_pnl(
+    pnl: Union[float, Decimal],
+    pnl_percentage: Optional[Union[float, Decimal]] = None
+) -> str:
+    """
+    Format profit/loss with its sign, e.g. "+$120.50 (+2.41%)".
+
+    Args:
+        pnl: Profit/loss amount
+        pnl_percentage: Profit/loss percentage (omitted if None)
+
+    Returns:
+        Formatted P/L string
+    """
+    try:
+        value = float(pnl)
+        formatted = f"{'-' if value < 0 else '+'}{DataFormatter.format_price(abs(value))}"
+        if pnl_percentage is not None:
+            formatted += f" ({DataFormatter.format_percentage(pnl_percentage)})"
+        return formatted
+    except (ValueError, TypeError):
+        return "N/A"
+
+
+def format_timestamp_relative(
+    timestamp: datetime,
+    now: Optional[datetime] = None
+) -> str:
+    """
+    Format timestamp relative to now, e.g. "5m ago".
+
+    Args:
+        timestamp: Datetime object
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        Relative time string
+    """
+    try:
+        now = now or datetime.now(timestamp.tzinfo)
+        seconds = int((now - timestamp).total_seconds())
+        if seconds < 60:
+            return "just now"
+        return f"{DataFormatter.format_duration(seconds)} ago"
+    except (AttributeError, TypeError):
+        return "N/A"
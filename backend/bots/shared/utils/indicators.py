@@ -6,17 +6,442 @@
 # ============================================
 
 # ============================================ Standard Library
+from collections import deque
+
 import numpy as np
 import pandas as pd
 from typing import Dict, Tuple, List, Optional, Union
 from decimal import Decimal
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Leave kernels undecorated; the _impl functions use pandas instead."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # ============================================ Custom Library
 from ..core.logger import get_logger
 from ..core.exceptions import BotIndicatorError
 
 logger = get_logger("indicators")
 
+# ==================== JIT KERNELS ====================
+# One kernel per indicator with the period as an argument and an explicit
+# signature: compiled eagerly, and cache=True reuses the machine code across
+# bot restarts instead of recompiling per (indicator, period) in every
+# process. The smoothing constants are computed once per call, outside the
+# loops.
+_SERIES_SIG = "f8[::1](f8[:], i8)"
+
+
+@njit([_SERIES_SIG], error_model="numpy", cache=True)
+def _ema_kernel(values, period):
+    # pandas ewm(span=period, adjust=False)
+    alpha = 2.0 / (period + 1.0)
+    decay = 1.0 - alpha
+    n = values.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    weighted = values[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        cur = values[i]
+        if weighted == weighted:
+            old_wt *= decay
+            if cur == cur:
+                if old_wt == decay:
+                    weighted = decay * weighted + alpha * cur
+                else:
+                    # Bridging a NaN gap: older weight has decayed further
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+@njit([_SERIES_SIG], error_model="numpy", cache=True)
+def _rsi_kernel(values, period):
+    # SMA of gains/losses over the last period deltas
+    inv_period = 1.0 / period
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        delta = values[i] - values[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(n):
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        if i >= period:
+            gain_sum -= gains[i - period]
+            loss_sum -= losses[i - period]
+        if i >= period - 1:
+            rs = (gain_sum * inv_period) / (loss_sum * inv_period)
+            out[i] = 100.0 - 100.0 / (1.0 + rs)
+    return out
+
+
+@njit(["f8[::1](f8[:], f8[:], f8[:], i8)"], error_model="numpy", cache=True)
+def _atr_kernel(high, low, close, period):
+    # SMA of true range
+    inv_period = 1.0 / period
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    tr = np.empty(n)
+    for i in range(n):
+        tr[i] = high[i] - low[i]
+        if i > 0:
+            # fmax skips NaN like _true_range
+            tr[i] = np.fmax(
+                np.fmax(tr[i], abs(high[i] - close[i - 1])),
+                abs(low[i] - close[i - 1]),
+            )
+
+    # NaN bars are kept out of the running sum and counted instead,
+    # so a gap blanks `period` outputs like rolling().mean()
+    tr_sum = 0.0
+    nan_count = 0
+    for i in range(n):
+        if tr[i] == tr[i]:
+            tr_sum += tr[i]
+        else:
+            nan_count += 1
+        if i >= period:
+            if tr[i - period] == tr[i - period]:
+                tr_sum -= tr[i - period]
+            else:
+                nan_count -= 1
+        if i >= period - 1 and nan_count == 0:
+            out[i] = tr_sum * inv_period
+    return out
+
+# ==================== NUMPY HELPERS ====================
+def _as_prices(data: Union[List[float], pd.Series, np.ndarray]) -> np.ndarray:
+    """
+    Convert indicator input to a 1-D float64 array.
+
+    Args:
+        data: Price or volume data
+
+    Returns:
+        Float64 array (no copy if already float64)
+    """
+    values = np.asarray(data, dtype=np.float64)
+    if values.ndim != 1:
+        raise ValueError(f"expected 1-D data, got shape {values.shape}")
+    return values
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    True Range using slice arithmetic instead of shifted Series.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+
+    Returns:
+        True range values (first bar is high - low)
+    """
+    prev_close = close[:-1]
+    tr = np.empty_like(close)
+    tr[:1] = high[:1] - low[:1]
+
+    # fmax skips NaN like DataFrame.max(axis=1) without stacking the operands
+    tr1 = tr[1:]
+    np.subtract(high[1:], low[1:], out=tr1)
+    np.fmax(tr1, np.abs(high[1:] - prev_close), out=tr1)
+    np.fmax(tr1, np.abs(low[1:] - prev_close), out=tr1)
+    return tr
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Rolling mean matching pandas rolling(window=period).mean()."""
+    return pd.Series(values).rolling(window=period).mean().values
+
+# ==================== INDICATOR IMPLEMENTATIONS ====================
+# The _impl functions take validated float64 arrays and contain no
+# exception handling, so they can be called back to back from
+# calculate_all_indicators without re-validating or re-wrapping errors.
+def _sma_impl(values: np.ndarray, period: int) -> np.ndarray:
+    """SMA on a float64 array."""
+    return _rolling_mean(values, period)
+
+
+def _ema_impl(values: np.ndarray, period: int) -> np.ndarray:
+    """EMA on a float64 array."""
+    if NUMBA_AVAILABLE:
+        return _ema_kernel(values, period)
+    return pd.Series(values).ewm(span=period, adjust=False).mean().values
+
+
+def _macd_impl(
+    values: np.ndarray, fast_period: int, slow_period: int, signal_period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD on a float64 array."""
+    macd_line = _ema_impl(values, fast_period) - _ema_impl(values, slow_period)
+    signal_line = _ema_impl(macd_line, signal_period)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def _adx_impl(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ADX on float64 arrays."""
+    # Calculate True Range
+    tr = _true_range(high, low, close)
+
+    # Calculate Directional Movement (first bar has no previous candle)
+    up_move = high[1:] - high[:-1]
+    down_move = low[:-1] - low[1:]
+
+    plus_dm = np.zeros_like(high)
+    minus_dm = np.zeros_like(high)
+    plus_dm[1:] = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm[1:] = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+    # Smooth TR and DM
+    atr_smooth = _rolling_mean(tr, period)
+    plus_dm_smooth = _rolling_mean(plus_dm, period)
+    minus_dm_smooth = _rolling_mean(minus_dm, period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Calculate DI
+        plus_di = 100 * plus_dm_smooth / atr_smooth
+        minus_di = 100 * minus_dm_smooth / atr_smooth
+
+        # Calculate DX and ADX
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+
+    return _rolling_mean(dx, period), plus_di, minus_di
+
+
+def _rsi_impl(values: np.ndarray, period: int) -> np.ndarray:
+    """RSI on a float64 array."""
+    if NUMBA_AVAILABLE:
+        return _rsi_kernel(values, period)
+
+    series = pd.Series(values)
+
+    # Calculate price changes
+    delta = series.diff()
+
+    # Separate gains and losses
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+
+    # Calculate average gain and loss
+    avg_gain = gain.rolling(window=period).mean()
+    avg_loss = loss.rolling(window=period).mean()
+
+    # Calculate RS and RSI
+    rs = avg_gain / avg_loss
+    return (100 - (100 / (1 + rs))).values
+
+
+def _stochastic_impl(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, k_period: int, d_period: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stochastic Oscillator on float64 arrays."""
+    # Calculate %K
+    lowest_low = pd.Series(low).rolling(window=k_period).min().values
+    highest_high = pd.Series(high).rolling(window=k_period).max().values
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = 100 * (close - lowest_low) / (highest_high - lowest_low)
+
+    # Calculate %D (SMA of %K)
+    return k, _rolling_mean(k, d_period)
+
+
+def _roc_impl(values: np.ndarray, period: int) -> np.ndarray:
+    """ROC on a float64 array."""
+    series = pd.Series(values)
+    shifted = series.shift(period)
+    return (((series - shifted) / shifted) * 100).values
+
+
+def _cci_impl(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> np.ndarray:
+    """CCI on float64 arrays."""
+    # Calculate Typical Price
+    tp = pd.Series((high + low + close) / 3)
+
+    # Calculate SMA of TP
+    sma_tp = tp.rolling(window=period).mean()
+
+    # Calculate Mean Deviation
+    mad = tp.rolling(window=period).apply(lambda x: np.abs(x - x.mean()).mean())
+
+    # Calculate CCI
+    return ((tp - sma_tp) / (0.015 * mad)).values
+
+
+def _bollinger_impl(
+    values: np.ndarray, period: int, std_dev: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger Bands on a float64 array."""
+    rolling = pd.Series(values).rolling(window=period)
+
+    # Calculate middle band (SMA) and standard deviation
+    middle = rolling.mean().values
+    std = rolling.std().values
+
+    # Calculate upper and lower bands
+    return middle + (std * std_dev), middle, middle - (std * std_dev)
+
+
+def _atr_impl(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> np.ndarray:
+    """ATR on float64 arrays."""
+    if NUMBA_AVAILABLE:
+        return _atr_kernel(high, low, close, period)
+    return _rolling_mean(_true_range(high, low, close), period)
+
+
+def _keltner_impl(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+    multiplier: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Keltner Channels on float64 arrays."""
+    middle = _ema_impl(close, period)
+    band = _atr_impl(high, low, close, period) * multiplier
+    return middle + band, middle, middle - band
+
+
+def _obv_impl(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """OBV on float64 arrays."""
+    # First bar compares against a missing close and counts as down volume
+    direction = np.full(close.shape, -1.0)
+    direction[1:] = np.sign(close[1:] - close[:-1])
+    direction[1:][np.isnan(direction[1:])] = -1.0
+    return np.cumsum(direction * volume)
+
+
+def _vwap_impl(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray
+) -> np.ndarray:
+    """VWAP on float64 arrays."""
+    tp_volume = (high + low + close) / 3 * volume
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.cumsum(tp_volume) / np.cumsum(volume)
+
+
+def _mfi_impl(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    period: int,
+) -> np.ndarray:
+    """MFI on float64 arrays."""
+    # Calculate typical price and raw money flow
+    tp = (high + low + close) / 3
+    mf = tp * volume
+
+    # Determine positive and negative money flow
+    mf_positive = np.zeros_like(mf)
+    mf_negative = np.zeros_like(mf)
+    mf_positive[1:] = np.where(tp[1:] > tp[:-1], mf[1:], 0.0)
+    mf_negative[1:] = np.where(tp[1:] < tp[:-1], mf[1:], 0.0)
+
+    # Calculate money flow ratio
+    positive_mf = pd.Series(mf_positive).rolling(window=period).sum().values
+    negative_mf = pd.Series(mf_negative).rolling(window=period).sum().values
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mfr = positive_mf / negative_mf
+        return 100 - (100 / (1 + mfr))
+
+
+def _trend_strength_impl(
+    close: np.ndarray, short_period: int, long_period: int
+) -> np.ndarray:
+    """Trend strength on a float64 array."""
+    short_ma = _rolling_mean(close, short_period)
+    long_ma = _rolling_mean(close, long_period)
+
+    # Calculate difference percentage
+    with np.errstate(divide="ignore", invalid="ignore"):
+        diff_pct = ((short_ma - long_ma) / long_ma) * 100
+
+    # Normalize to 0-100 scale
+    return np.clip(np.abs(diff_pct) * 10, 0, 100)  # Scale factor
+
+
+def _volatility_index_impl(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> np.ndarray:
+    """Volatility index on float64 arrays."""
+    # Calculate ATR as percentage of price
+    with np.errstate(divide="ignore", invalid="ignore"):
+        volatility = (_atr_impl(high, low, close, period) / close) * 100
+
+    # Normalize to 0-100
+    return np.clip(volatility * 10, 0, 100)
+
+
+def _support_resistance_impl(
+    high: np.ndarray, low: np.ndarray, lookback: int, num_levels: int
+) -> Tuple[List[float], List[float]]:
+    """Support and resistance levels on float64 arrays."""
+    # Get recent data
+    start = max(len(high) - lookback, 0)
+    recent_high = high[start:]
+    recent_low = low[start:]
+
+    # Find local maxima (resistance)
+    resistance_candidates = [
+        recent_high[i]
+        for i in range(2, len(recent_high) - 2)
+        if (
+            recent_high[i] > recent_high[i - 1]
+            and recent_high[i] > recent_high[i - 2]
+            and recent_high[i] > recent_high[i + 1]
+            and recent_high[i] > recent_high[i + 2]
+        )
+    ]
+    # Find local minima (support)
+    support_candidates = [
+        recent_low[i]
+        for i in range(2, len(recent_low) - 2)
+        if (
+            recent_low[i] < recent_low[i - 1]
+            and recent_low[i] < recent_low[i - 2]
+            and recent_low[i] < recent_low[i + 1]
+            and recent_low[i] < recent_low[i + 2]
+        )
+    ]
+    # Sort and get top levels
+    resistance_levels = sorted(set(resistance_candidates), reverse=True)[:num_levels]
+    support_levels = sorted(set(support_candidates))[:num_levels]
+
+    return support_levels, resistance_levels
+
 # ==================== TREND INDICATORS ====================
 def sma(data: Union[List[float], pd.Series], period: int = 20) -> np.ndarray:
     """
@@ -30,8 +455,7 @@ def sma(data: Union[List[float], pd.Series], period: int = 20) -> np.ndarray:
         SMA values
     """
     try:
-        series = pd.Series(data)
-        return series.rolling(window=period).mean().values
+        return _sma_impl(_as_prices(data), period)
     except Exception as e:
         raise BotIndicatorError(f"SMA calculation failed: {e}", indicator="SMA") from e
 
@@ -47,8 +471,7 @@ def ema(data: Union[List[float], pd.Series], period: int = 20) -> np.ndarray:
         EMA values
     """
     try:
-        series = pd.Series(data)
-        return series.ewm(span=period, adjust=False).mean().values
+        return _ema_impl(_as_prices(data), period)
     except Exception as e:
         raise BotIndicatorError(f"EMA calculation failed: {e}", indicator="EMA")
 
@@ -71,21 +494,7 @@ def macd(
         Tuple of (macd_line, signal_line, histogram)
     """
     try:
-        series = pd.Series(data)
-
-        # Calculate MACD line
-        fast_ema = series.ewm(span=fast_period, adjust=False).mean()
-        slow_ema = series.ewm(span=slow_period, adjust=False).mean()
-        macd_line = fast_ema - slow_ema
-
-        # Calculate signal line
-        signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-
-        # Calculate histogram
-        histogram = macd_line - signal_line
-
-        return macd_line.values, signal_line.values, histogram.values
-
+        return _macd_impl(_as_prices(data), fast_period, slow_period, signal_period)
     except Exception as e:
         raise BotIndicatorError(f"MACD calculation failed: {e}", indicator="MACD")
 
@@ -108,44 +517,9 @@ def adx(
         Tuple of (adx, plus_di, minus_di)
     """
     try:
-        df = pd.DataFrame({"high": high, "low": low, "close": close})
-
-        # Calculate True Range
-        df["tr1"] = df["high"] - df["low"]
-        df["tr2"] = abs(df["high"] - df["close"].shift())
-        df["tr3"] = abs(df["low"] - df["close"].shift())
-        df["tr"] = df[["tr1", "tr2", "tr3"]].max(axis=1)
-
-        # Calculate Directional Movement
-        df["up_move"] = df["high"] - df["high"].shift()
-        df["down_move"] = df["low"].shift() - df["low"]
-
-        df["plus_dm"] = np.where(
-            (df["up_move"] > df["down_move"]) & (df["up_move"] > 0), df["up_move"], 0
-        )
-        df["minus_dm"] = np.where(
-            (df["down_move"] > df["up_move"]) & (df["down_move"] > 0),
-            df["down_move"],
-            0,
-        )
-
-        # Smooth TR and DM
-        df["atr"] = df["tr"].rolling(window=period).mean()
-        df["plus_dm_smooth"] = df["plus_dm"].rolling(window=period).mean()
-        df["minus_dm_smooth"] = df["minus_dm"].rolling(window=period).mean()
-
-        # Calculate DI
-        df["plus_di"] = 100 * df["plus_dm_smooth"] / df["atr"]
-        df["minus_di"] = 100 * df["minus_dm_smooth"] / df["atr"]
-
-        # Calculate DX and ADX
-        df["dx"] = (
-            100 * abs(df["plus_di"] - df["minus_di"]) / (df["plus_di"] + df["minus_di"])
+        return _adx_impl(
+            _as_prices(high), _as_prices(low), _as_prices(close), period
         )
-        df["adx"] = df["dx"].rolling(window=period).mean()
-
-        return df["adx"].values, df["plus_di"].values, df["minus_di"].values
-
     except Exception as e:
         raise BotIndicatorError(f"ADX calculation failed: {e}", indicator="ADX")
 
@@ -162,25 +536,7 @@ def rsi(data: Union[List[float], pd.Series], period: int = 14) -> np.ndarray:
         RSI values
     """
     try:
-        series = pd.Series(data)
-
-        # Calculate price changes
-        delta = series.diff()
-
-        # Separate gains and losses
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-
-        # Calculate average gain and loss
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
-
-        # Calculate RS and RSI
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return rsi.values
-
+        return _rsi_impl(_as_prices(data), period)
     except Exception as e:
         raise BotIndicatorError(f"RSI calculation failed: {e}", indicator="RSI") from e
 
@@ -205,19 +561,9 @@ def stochastic(
         Tuple of (%K, %D)
     """
     try:
-        df = pd.DataFrame({"high": high, "low": low, "close": close})
-
-        # Calculate %K
-        lowest_low = df["low"].rolling(window=k_period).min()
-        highest_high = df["high"].rolling(window=k_period).max()
-
-        df["k"] = 100 * (df["close"] - lowest_low) / (highest_high - lowest_low)
-
-        # Calculate %D (SMA of %K)
-        df["d"] = df["k"].rolling(window=d_period).mean()
-
-        return df["k"].values, df["d"].values
-
+        return _stochastic_impl(
+            _as_prices(high), _as_prices(low), _as_prices(close), k_period, d_period
+        )
     except Exception as e:
         raise BotIndicatorError(
             f"Stochastic calculation failed: {e}", indicator="Stochastic"
@@ -235,9 +581,7 @@ def roc(data: Union[List[float], pd.Series], period: int = 12) -> np.ndarray:
         ROC values
     """
     try:
-        series = pd.Series(data)
-        roc = ((series - series.shift(period)) / series.shift(period)) * 100
-        return roc.values
+        return _roc_impl(_as_prices(data), period)
     except Exception as e:
         raise BotIndicatorError(f"ROC calculation failed: {e}", indicator="ROC")
 
@@ -260,24 +604,7 @@ def cci(
         CCI values
     """
     try:
-        df = pd.DataFrame({"high": high, "low": low, "close": close})
-
-        # Calculate Typical Price
-        df["tp"] = (df["high"] + df["low"] + df["close"]) / 3
-
-        # Calculate SMA of TP
-        df["sma_tp"] = df["tp"].rolling(window=period).mean()
-
-        # Calculate Mean Deviation
-        df["mad"] = (
-            df["tp"].rolling(window=period).apply(lambda x: np.abs(x - x.mean()).mean())
-        )
-
-        # Calculate CCI
-        df["cci"] = (df["tp"] - df["sma_tp"]) / (0.015 * df["mad"])
-
-        return df["cci"].values
-
+        return _cci_impl(_as_prices(high), _as_prices(low), _as_prices(close), period)
     except Exception as e:
         raise BotIndicatorError(f"CCI calculation failed: {e}", indicator="CCI")
 
@@ -297,20 +624,7 @@ def bollinger_bands(
         Tuple of (upper_band, middle_band, lower_band)
     """
     try:
-        series = pd.Series(data)
-
-        # Calculate middle band (SMA)
-        middle = series.rolling(window=period).mean()
-
-        # Calculate standard deviation
-        std = series.rolling(window=period).std()
-
-        # Calculate upper and lower bands
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
-
-        return upper.values, middle.values, lower.values
-
+        return _bollinger_impl(_as_prices(data), period, std_dev)
     except Exception as e:
         raise BotIndicatorError(
             f"Bollinger Bands calculation failed: {e}", indicator="BB"
@@ -335,19 +649,7 @@ def atr(
         ATR values
     """
     try:
-        df = pd.DataFrame({"high": high, "low": low, "close": close})
-
-        # Calculate True Range
-        df["tr1"] = df["high"] - df["low"]
-        df["tr2"] = abs(df["high"] - df["close"].shift())
-        df["tr3"] = abs(df["low"] - df["close"].shift())
-        df["tr"] = df[["tr1", "tr2", "tr3"]].max(axis=1)
-
-        # Calculate ATR
-        atr = df["tr"].rolling(window=period).mean()
-
-        return atr.values
-
+        return _atr_impl(_as_prices(high), _as_prices(low), _as_prices(close), period)
     except Exception as e:
         raise BotIndicatorError(f"ATR calculation failed: {e}", indicator="ATR")
 
@@ -372,18 +674,9 @@ def keltner_channels(
         Tuple of (upper_channel, middle_line, lower_channel)
     """
     try:
-        # Calculate middle line (EMA of close)
-        middle = ema(close, period)
-
-        # Calculate ATR
-        atr_values = atr(high, low, close, period)
-
-        # Calculate channels
-        upper = middle + (atr_values * multiplier)
-        lower = middle - (atr_values * multiplier)
-
-        return upper, middle, lower
-
+        return _keltner_impl(
+            _as_prices(high), _as_prices(low), _as_prices(close), period, multiplier
+        )
     except Exception as e:
         raise BotIndicatorError(
             f"Keltner Channels calculation failed: {e}", indicator="Keltner"
@@ -404,19 +697,7 @@ def obv(
         OBV values
     """
     try:
-        df = pd.DataFrame({"close": close, "volume": volume})
-
-        # Calculate price change direction
-        df["direction"] = np.where(df["close"] > df["close"].shift(), 1, -1)
-        df["direction"] = np.where(
-            df["close"] == df["close"].shift(), 0, df["direction"]
-        )
-
-        # Calculate OBV
-        df["obv"] = (df["direction"] * df["volume"]).cumsum()
-
-        return df["obv"].values
-
+        return _obv_impl(_as_prices(close), _as_prices(volume))
     except Exception as e:
         raise BotIndicatorError(f"OBV calculation failed: {e}", indicator="OBV")
 
@@ -439,17 +720,9 @@ def vwap(
         VWAP values
     """
     try:
-        df = pd.DataFrame({"high": high, "low": low, "close": close, "volume": volume})
-
-        # Calculate typical price
-        df["tp"] = (df["high"] + df["low"] + df["close"]) / 3
-
-        # Calculate VWAP
-        df["tp_volume"] = df["tp"] * df["volume"]
-        df["vwap"] = df["tp_volume"].cumsum() / df["volume"].cumsum()
-
-        return df["vwap"].values
-
+        return _vwap_impl(
+            _as_prices(high), _as_prices(low), _as_prices(close), _as_prices(volume)
+        )
     except Exception as e:
         raise BotIndicatorError(f"VWAP calculation failed: {e}", indicator="VWAP")
 
@@ -474,29 +747,13 @@ def mfi(
         MFI values
     """
     try:
-        df = pd.DataFrame({"high": high, "low": low, "close": close, "volume": volume})
-
-        # Calculate typical price
-        df["tp"] = (df["high"] + df["low"] + df["close"]) / 3
-
-        # Calculate raw money flow
-        df["mf"] = df["tp"] * df["volume"]
-
-        # Determine positive and negative money flow
-        df["mf_positive"] = np.where(df["tp"] > df["tp"].shift(), df["mf"], 0)
-        df["mf_negative"] = np.where(df["tp"] < df["tp"].shift(), df["mf"], 0)
-
-        # Calculate money flow ratio
-        positive_mf = df["mf_positive"].rolling(window=period).sum()
-        negative_mf = df["mf_negative"].rolling(window=period).sum()
-
-        mfr = positive_mf / negative_mf
-
-        # Calculate MFI
-        mfi = 100 - (100 / (1 + mfr))
-
-        return mfi.values
-
+        return _mfi_impl(
+            _as_prices(high),
+            _as_prices(low),
+            _as_prices(close),
+            _as_prices(volume),
+            period,
+        )
     except Exception as e:
         raise BotIndicatorError(f"MFI calculation failed: {e}", indicator="MFI")
 
@@ -516,20 +773,7 @@ def trend_strength(
         Trend strength values
     """
     try:
-        series = pd.Series(close)
-
-        short_ma = series.rolling(window=short_period).mean()
-        long_ma = series.rolling(window=long_period).mean()
-
-        # Calculate difference percentage
-        diff_pct = ((short_ma - long_ma) / long_ma) * 100
-
-        # Normalize to 0-100 scale
-        strength = np.abs(diff_pct)
-        strength = np.clip(strength * 10, 0, 100)  # Scale factor
-
-        return strength.values
-
+        return _trend_strength_impl(_as_prices(close), short_period, long_period)
     except Exception as e:
         raise BotIndicatorError(
             f"Trend strength calculation failed: {e}", indicator="TrendStrength"
@@ -554,18 +798,9 @@ def volatility_index(
         Volatility index values
     """
     try:
-        # Calculate ATR
-        atr_values = atr(high, low, close, period)
-
-        # Calculate as percentage of price
-        close_series = pd.Series(close)
-        volatility = (atr_values / close_series) * 100
-
-        # Normalize to 0-100
-        volatility = np.clip(volatility * 10, 0, 100)
-
-        return volatility
-
+        return _volatility_index_impl(
+            _as_prices(high), _as_prices(low), _as_prices(close), period
+        )
     except Exception as e:
         raise BotIndicatorError(
             f"Volatility index calculation failed: {e}", indicator="VolatilityIndex"
@@ -592,51 +827,213 @@ def support_resistance_levels(
         Tuple of (support_levels, resistance_levels)
     """
     try:
-        df = pd.DataFrame({"high": high, "low": low, "close": close})
-
-        # Get recent data
-        recent_data = df.tail(lookback)
-
-        # Find local maxima (resistance)
-        resistance_candidates = []
-        resistance_candidates.extend(
-            recent_data["high"].iloc[i]
-            for i in range(2, len(recent_data) - 2)
-            if (
-                recent_data["high"].iloc[i] > recent_data["high"].iloc[i - 1]
-                and recent_data["high"].iloc[i]
-                > recent_data["high"].iloc[i - 2]
-                and recent_data["high"].iloc[i]
-                > recent_data["high"].iloc[i + 1]
-                and recent_data["high"].iloc[i]
-                > recent_data["high"].iloc[i + 2]
-            )
+        return _support_resistance_impl(
+            _as_prices(high), _as_prices(low), lookback, num_levels
         )
-        # Find local minima (support)
-        support_candidates = []
-        support_candidates.extend(
-            recent_data["low"].iloc[i]
-            for i in range(2, len(recent_data) - 2)
-            if (
-                recent_data["low"].iloc[i] < recent_data["low"].iloc[i - 1]
-                and recent_data["low"].iloc[i] < recent_data["low"].iloc[i - 2]
-                and recent_data["low"].iloc[i] < recent_data["low"].iloc[i + 1]
-                and recent_data["low"].iloc[i] < recent_data["low"].iloc[i + 2]
-            )
-        )
-        # Sort and get top levels
-        resistance_levels = sorted(set(resistance_candidates), reverse=True)[
-            :num_levels
-        ]
-        support_levels = sorted(set(support_candidates))[:num_levels]
-
-        return support_levels, resistance_levels
-
     except Exception as e:
         raise BotIndicatorError(
             f"Support/Resistance calculation failed: {e}", indicator="SupportResistance"
         )
 
+# ==================== INCREMENTAL UPDATES ====================
+class IndicatorState:
+    """
+    Running indicator state for one symbol.
+
+    Applies one step of each recurrence per closed candle, and keeps running
+    window totals for RSI and ATR, so live updates cost O(1) instead of
+    recomputing the full history. Values match the full-history functions
+    (ema, macd, rsi, atr, obv, vwap) on the same candles; RSI only counts
+    real price deltas, so it starts one candle after rsi().
+    """
+
+    __slots__ = (
+        "ema12",
+        "ema26",
+        "ema9_macd",
+        "prev_close",
+        "rsi_gains",
+        "rsi_losses",
+        "atr_window",
+        "gain_sum",
+        "loss_sum",
+        "tr_sum",
+        "obv",
+        "vwap_num",
+        "vwap_den",
+    )
+
+    _ALPHA_12 = 2.0 / 13.0
+    _ALPHA_26 = 2.0 / 27.0
+    _ALPHA_9 = 2.0 / 10.0
+
+    def __init__(self, rsi_period: int = 14, atr_period: int = 14):
+        """
+        Initialize empty state.
+
+        Args:
+            rsi_period: Period for RSI
+            atr_period: Period for ATR
+        """
+        self.ema12: Optional[float] = None
+        self.ema26: Optional[float] = None
+        self.ema9_macd: Optional[float] = None
+        self.prev_close: Optional[float] = None
+        self.rsi_gains: deque = deque(maxlen=rsi_period)
+        self.rsi_losses: deque = deque(maxlen=rsi_period)
+        self.atr_window: deque = deque(maxlen=atr_period)
+        # Window totals, kept in step with the deques
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.tr_sum = 0.0
+        self.obv = 0.0
+        self.vwap_num = 0.0
+        self.vwap_den = 0.0
+
+    def update(
+        self,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> Dict[str, Optional[float]]:
+        """
+        Apply one closed candle.
+
+        Args:
+            open_price: Open price
+            high: High price
+            low: Low price
+            close: Close price
+            volume: Volume
+
+        Returns:
+            Dictionary of indicator values (None while warming up)
+        """
+        prev_close = self.prev_close
+
+        # EMA / MACD
+        if prev_close is None:
+            self.ema12 = self.ema26 = close
+        else:
+            self.ema12 += self._ALPHA_12 * (close - self.ema12)
+            self.ema26 += self._ALPHA_26 * (close - self.ema26)
+        macd_line = self.ema12 - self.ema26
+        if self.ema9_macd is None:
+            self.ema9_macd = macd_line
+        else:
+            self.ema9_macd += self._ALPHA_9 * (macd_line - self.ema9_macd)
+
+        # RSI / ATR / OBV (first candle has no previous close, so no delta)
+        if prev_close is None:
+            true_range = high - low
+            direction = -1.0
+        else:
+            delta = close - prev_close
+            true_range = max(
+                high - low, abs(high - prev_close), abs(low - prev_close)
+            )
+            direction = 1.0 if delta > 0 else (0.0 if delta == 0 else -1.0)
+            self.gain_sum += self._push(self.rsi_gains, delta if delta > 0 else 0.0)
+            self.loss_sum += self._push(
+                self.rsi_losses, -delta if delta < 0 else 0.0
+            )
+
+        self.tr_sum += self._push(self.atr_window, true_range)
+        self.obv += direction * volume
+
+        # VWAP
+        self.vwap_num += (high + low + close) / 3 * volume
+        self.vwap_den += volume
+
+        self.prev_close = close
+
+        return {
+            "ema_12": self.ema12,
+            "ema_26": self.ema26,
+            "macd_line": macd_line,
+            "macd_signal": self.ema9_macd,
+            "macd_histogram": macd_line - self.ema9_macd,
+            "rsi_14": self._rsi(),
+            "atr": self._atr(),
+            "obv": self.obv,
+            "vwap": self.vwap_num / self.vwap_den if self.vwap_den else None,
+        }
+
+    @staticmethod
+    def _push(window: deque, value: float) -> float:
+        """Append to a full-size window; return the change in its total."""
+        evicted = window[0] if len(window) == window.maxlen else 0.0
+        window.append(value)
+        return value - evicted
+
+    def _rsi(self) -> Optional[float]:
+        """Current RSI from the gain/loss totals."""
+        gains = self.rsi_gains
+        if len(gains) < gains.maxlen:
+            return None
+
+        # Running totals can drift a hair below zero after evictions
+        gain_sum = max(self.gain_sum, 0.0)
+        loss_sum = max(self.loss_sum, 0.0)
+        if loss_sum == 0:
+            return 100.0 if gain_sum > 0 else None
+        return 100 - 100 / (1 + gain_sum / loss_sum)
+
+    def _atr(self) -> Optional[float]:
+        """Current ATR from the true range total."""
+        window = self.atr_window
+        if len(window) < window.maxlen:
+            return None
+        return self.tr_sum / window.maxlen
+
+
+# Per-symbol live state. Each symbol is only advanced by the task that owns
+# its candle stream, so updates need no locking.
+_indicator_states: Dict[str, IndicatorState] = {}
+
+
+def update_indicators(
+    symbol: str,
+    open_price: float,
+    high: float,
+    low: float,
+    close: float,
+    volume: float,
+) -> Dict[str, Optional[float]]:
+    """
+    Advance a symbol's live indicators by one closed candle.
+
+    Args:
+        symbol: Trading symbol
+        open_price: Open price
+        high: High price
+        low: Low price
+        close: Close price
+        volume: Volume
+
+    Returns:
+        Dictionary of indicator values (None while warming up)
+    """
+    state = _indicator_states.get(symbol)
+    if state is None:
+        state = _indicator_states[symbol] = IndicatorState()
+    return state.update(open_price, high, low, close, volume)
+
+
+def reset_indicator_state(symbol: Optional[str] = None) -> None:
+    """
+    Drop live indicator state.
+
+    Args:
+        symbol: Symbol to reset (all symbols if None)
+    """
+    if symbol is None:
+        _indicator_states.clear()
+    else:
+        _indicator_states.pop(symbol, None)
+
 # ==================== HELPER FUNCTIONS ====================
 def calculate_all_indicators(
     open_prices: List[float],
@@ -644,7 +1041,7 @@ def calculate_all_indicators(
     low: List[float],
     close: List[float],
     volume: List[float],
-) -> Dict[str, float]:  # sourcery skip: merge-dict-assign
+) -> Dict[str, float]:
     """
     Calculate all indicators for latest candle.
 
@@ -659,54 +1056,49 @@ def calculate_all_indicators(
         Dictionary of indicator values
     """
     try:
-        indicators = {}
-
-        # Trend indicators
-        indicators["sma_20"] = sma(close, 20)[-1]
-        indicators["sma_50"] = sma(close, 50)[-1]
-        indicators["sma_200"] = sma(close, 200)[-1]
-        indicators["ema_12"] = ema(close, 12)[-1]
-        indicators["ema_26"] = ema(close, 26)[-1]
-
-        macd_line, signal_line, histogram = macd(close)
-        indicators["macd_line"] = macd_line[-1]
-        indicators["macd_signal"] = signal_line[-1]
-        indicators["macd_histogram"] = histogram[-1]
-
-        # Momentum indicators
-        indicators["rsi_14"] = rsi(close, 14)[-1]
-
-        k, d = stochastic(high, low, close)
-        indicators["stoch_k"] = k[-1]
-        indicators["stoch_d"] = d[-1]
+        # Validate and convert inputs once for every indicator below
+        high = _as_prices(high)
+        low = _as_prices(low)
+        close = _as_prices(close)
+        volume = _as_prices(volume)
 
-        indicators["roc_12"] = roc(close, 12)[-1]
-        indicators["cci_20"] = cci(high, low, close, 20)[-1]
+        macd_line, signal_line, histogram = _macd_impl(close, 12, 26, 9)
+        k, d = _stochastic_impl(high, low, close, 14, 3)
+        upper_bb, middle_bb, lower_bb = _bollinger_impl(close, 20, 2.0)
 
-        # Volatility indicators
-        upper_bb, middle_bb, lower_bb = bollinger_bands(close)
-        indicators["bb_upper"] = upper_bb[-1]
-        indicators["bb_middle"] = middle_bb[-1]
-        indicators["bb_lower"] = lower_bb[-1]
-        indicators["bb_width"] = (upper_bb[-1] - lower_bb[-1]) / middle_bb[-1] * 100
-
-        indicators["atr"] = atr(high, low, close, 14)[-1]
-
-        # Volume indicators
-        indicators["obv"] = obv(close, volume)[-1]
-        indicators["vwap"] = vwap(high, low, close, volume)[-1]
-        indicators["mfi"] = mfi(high, low, close, volume, 14)[-1]
-
-        # Custom indicators
-        indicators["trend_strength"] = trend_strength(close)[-1]
-        indicators["volatility_index"] = volatility_index(high, low, close)[-1]
-
-        # Clean NaN values
         indicators = {
-            k: (None if np.isnan(v) else v) for k, v in indicators.items()
+            # Trend indicators
+            "sma_20": _sma_impl(close, 20)[-1],
+            "sma_50": _sma_impl(close, 50)[-1],
+            "sma_200": _sma_impl(close, 200)[-1],
+            "ema_12": _ema_impl(close, 12)[-1],
+            "ema_26": _ema_impl(close, 26)[-1],
+            "macd_line": macd_line[-1],
+            "macd_signal": signal_line[-1],
+            "macd_histogram": histogram[-1],
+            # Momentum indicators
+            "rsi_14": _rsi_impl(close, 14)[-1],
+            "stoch_k": k[-1],
+            "stoch_d": d[-1],
+            "roc_12": _roc_impl(close, 12)[-1],
+            "cci_20": _cci_impl(high, low, close, 20)[-1],
+            # Volatility indicators
+            "bb_upper": upper_bb[-1],
+            "bb_middle": middle_bb[-1],
+            "bb_lower": lower_bb[-1],
+            "bb_width": (upper_bb[-1] - lower_bb[-1]) / middle_bb[-1] * 100,
+            "atr": _atr_impl(high, low, close, 14)[-1],
+            # Volume indicators
+            "obv": _obv_impl(close, volume)[-1],
+            "vwap": _vwap_impl(high, low, close, volume)[-1],
+            "mfi": _mfi_impl(high, low, close, volume, 14)[-1],
+            # Custom indicators
+            "trend_strength": _trend_strength_impl(close, 20, 50)[-1],
+            "volatility_index": _volatility_index_impl(high, low, close, 14)[-1],
         }
 
-        return indicators
+        # Clean NaN values
+        return {k: (None if np.isnan(v) else v) for k, v in indicators.items()}
 
     except Exception as e:
         logger.error(f"Failed to calculate indicators: {e}")
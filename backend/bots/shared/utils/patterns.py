@@ -0,0 +1,320 @@
+# ============================================
+# Crypto Trading Signal System
+# backed/bots/shared/utils/patterns.py
+# Deception: Pattern Scanners = Candlestick and ICT pattern detection over OHLC arrays.
+# ============================================
+
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Run kernels as plain Python when numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+from ..core.logger import get_logger
+from ..core.exceptions import BotIndicatorError
+
+logger = get_logger("patterns")
+
+# Every scanner returns an int8 array with one entry per bar:
+# +1 bullish, -1 bearish, 0 no pattern
+BULLISH = 1
+BEARISH = -1
+
+# ==================== JIT KERNELS ====================
+# Each bar only reads a fixed window of neighbours, so bars are scanned in
+# parallel with prange. Inputs are contiguous float64 columns (see _as_ohlc).
+_OHLC_SIG = "i1[::1](f8[::1], f8[::1], f8[::1], f8[::1])"
+
+# fastmath without nnan/ninf: a missing candle (NaN) must make every
+# comparison false rather than leave it undefined
+_FASTMATH = {"contract", "reassoc"}
+
+
+@njit([_OHLC_SIG], parallel=True, fastmath=_FASTMATH, cache=True)
+def _engulfing(o, h, l, c):
+    n = c.shape[0]
+    out = np.zeros(n, np.int8)
+    for i in prange(1, n):
+        if (
+            c[i - 1] < o[i - 1]
+            and c[i] > o[i]
+            and o[i] <= c[i - 1]
+            and c[i] >= o[i - 1]
+        ):
+            out[i] = 1
+        elif (
+            c[i - 1] > o[i - 1]
+            and c[i] < o[i]
+            and o[i] >= c[i - 1]
+            and c[i] <= o[i - 1]
+        ):
+            out[i] = -1
+    return out
+
+
+@njit([_OHLC_SIG], parallel=True, fastmath=_FASTMATH, cache=True)
+def _hammer(o, h, l, c):
+    # Hammer: long lower shadow (bullish); shooting star: long upper (bearish)
+    n = c.shape[0]
+    out = np.zeros(n, np.int8)
+    for i in prange(n):
+        body = abs(c[i] - o[i])
+        if body <= 0.0:
+            continue
+        lower = min(o[i], c[i]) - l[i]
+        upper = h[i] - max(o[i], c[i])
+        if lower >= 2.0 * body and upper <= body:
+            out[i] = 1
+        elif upper >= 2.0 * body and lower <= body:
+            out[i] = -1
+    return out
+
+
+@njit(
+    ["i1[::1](f8[::1], f8[::1], f8[::1], f8[::1], f8)"],
+    parallel=True,
+    fastmath=_FASTMATH,
+    cache=True,
+)
+def _doji(o, h, l, c, max_body_ratio):
+    n = c.shape[0]
+    out = np.zeros(n, np.int8)
+    for i in prange(n):
+        rng = h[i] - l[i]
+        if rng > 0.0 and abs(c[i] - o[i]) <= max_body_ratio * rng:
+            out[i] = 1
+    return out
+
+
+@njit(
+    ["i1[::1](f8[::1], f8[::1], f8[::1], f8)"],
+    parallel=True,
+    fastmath=_FASTMATH,
+    cache=True,
+)
+def _fair_value_gaps(h, l, c, min_gap):
+    # Gap between candle i-2 and candle i, sized relative to the middle close
+    n = c.shape[0]
+    out = np.zeros(n, np.int8)
+    for i in prange(2, n):
+        threshold = min_gap * c[i - 1]
+        if l[i] - h[i - 2] >= threshold and l[i] > h[i - 2]:
+            out[i] = 1
+        elif l[i - 2] - h[i] >= threshold and h[i] < l[i - 2]:
+            out[i] = -1
+    return out
+
+
+@njit(
+    ["i1[::1](f8[::1], f8[::1], f8[::1], f8[::1], i8, f8)"],
+    parallel=True,
+    fastmath=_FASTMATH,
+    cache=True,
+)
+def _order_blocks(o, h, l, c, min_candles, body_ratio):
+    # Last opposite candle before min_candles strong candles that close
+    # beyond it; marked on the order block candle itself
+    n = c.shape[0]
+    out = np.zeros(n, np.int8)
+    for i in prange(n - min_candles):
+        direction = 1 if c[i] < o[i] else -1 if c[i] > o[i] else 0
+        if direction == 0:
+            continue
+        strong = True
+        for k in range(1, min_candles + 1):
+            j = i + k
+            body = (c[j] - o[j]) * direction
+            # Written so a NaN body fails the test
+            if not (body > 0.0 and body >= body_ratio * (h[j] - l[j])):
+                strong = False
+                break
+        if not strong:
+            continue
+        last = c[i + min_candles]
+        if (direction == 1 and last > h[i]) or (direction == -1 and last < l[i]):
+            out[i] = direction
+    return out
+
+
+# ==================== NUMPY HELPERS ====================
+def _as_ohlc(
+    *columns: Union[List[float], pd.Series, np.ndarray]
+) -> Tuple[np.ndarray, ...]:
+    """
+    Convert OHLC columns to contiguous 1-D float64 arrays of equal length.
+
+    Columns of an OHLCV_DTYPE batch (batch["c"]) are strided views and are
+    copied once here; plain float64 arrays pass through.
+
+    Args:
+        columns: Price columns
+
+    Returns:
+        Tuple of contiguous float64 arrays
+    """
+    arrays = tuple(np.ascontiguousarray(col, dtype=np.float64) for col in columns)
+    n = arrays[0].shape[0]
+    for values in arrays:
+        if values.ndim != 1 or values.shape[0] != n:
+            raise ValueError("expected 1-D columns of equal length")
+    return arrays
+
+
+# ==================== PUBLIC API ====================
+def detect_engulfing(open_, high, low, close) -> np.ndarray:
+    """
+    Bullish/bearish engulfing candles.
+
+    Args:
+        open_: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+
+    Returns:
+        int8 array: +1 bullish engulfing, -1 bearish engulfing, 0 none
+    """
+    try:
+        return _engulfing(*_as_ohlc(open_, high, low, close))
+    except Exception as e:
+        raise BotIndicatorError(
+            f"Engulfing detection failed: {e}", indicator="engulfing"
+        ) from e
+
+
+def detect_hammer(open_, high, low, close) -> np.ndarray:
+    """
+    Hammer and shooting star candles.
+
+    Args:
+        open_: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+
+    Returns:
+        int8 array: +1 hammer, -1 shooting star, 0 none
+    """
+    try:
+        return _hammer(*_as_ohlc(open_, high, low, close))
+    except Exception as e:
+        raise BotIndicatorError(
+            f"Hammer detection failed: {e}", indicator="hammer"
+        ) from e
+
+
+def detect_doji(open_, high, low, close, max_body_ratio: float = 0.1) -> np.ndarray:
+    """
+    Doji candles (body at most max_body_ratio of the range).
+
+    Args:
+        open_: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+        max_body_ratio: Largest body/range ratio counted as doji
+
+    Returns:
+        int8 array: 1 doji, 0 none
+    """
+    try:
+        return _doji(*_as_ohlc(open_, high, low, close), float(max_body_ratio))
+    except Exception as e:
+        raise BotIndicatorError(f"Doji detection failed: {e}", indicator="doji") from e
+
+
+def detect_fair_value_gaps(
+    high, low, close, min_gap_percent: float = 0.5
+) -> np.ndarray:
+    """
+    ICT fair value gaps (three-candle imbalance).
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        min_gap_percent: Minimum gap as % of price
+            (ICT_SETTINGS["fair_value_gap"]["min_gap_percent"])
+
+    Returns:
+        int8 array marked on the third candle: +1 bullish, -1 bearish, 0 none
+    """
+    try:
+        return _fair_value_gaps(*_as_ohlc(high, low, close), min_gap_percent * 0.01)
+    except Exception as e:
+        raise BotIndicatorError(
+            f"Fair value gap detection failed: {e}", indicator="fair_value_gap"
+        ) from e
+
+
+def detect_order_blocks(
+    open_, high, low, close, min_candles: int = 3, body_percent: float = 60
+) -> np.ndarray:
+    """
+    ICT order blocks.
+
+    Args:
+        open_: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+        min_candles: Impulse candles required after the block
+            (ICT_SETTINGS["order_block"]["min_candles"])
+        body_percent: Minimum body size of impulse candles as % of range
+            (ICT_SETTINGS["order_block"]["body_percent"])
+
+    Returns:
+        int8 array marked on the block candle: +1 bullish, -1 bearish, 0 none
+    """
+    try:
+        return _order_blocks(
+            *_as_ohlc(open_, high, low, close), int(min_candles), body_percent * 0.01
+        )
+    except Exception as e:
+        raise BotIndicatorError(
+            f"Order block detection failed: {e}", indicator="order_block"
+        ) from e
+
+
+def detect_candlestick_patterns(open_, high, low, close) -> Dict[str, np.ndarray]:
+    """
+    Run all candlestick scanners on one set of OHLC columns.
+
+    Args:
+        open_: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+
+    Returns:
+        Boolean arrays keyed by PatternType value
+    """
+    try:
+        ohlc = _as_ohlc(open_, high, low, close)
+        engulfing = _engulfing(*ohlc)
+        hammer = _hammer(*ohlc)
+        return {
+            "doji": _doji(*ohlc, 0.1) == 1,
+            "hammer": hammer == BULLISH,
+            "shooting_star": hammer == BEARISH,
+            "engulfing_bullish": engulfing == BULLISH,
+            "engulfing_bearish": engulfing == BEARISH,
+        }
+    except Exception as e:
+        raise BotIndicatorError(
+            f"Candlestick pattern detection failed: {e}", indicator="candlestick"
+        ) from e
@@ -4,21 +4,145 @@
 # Deception: Risk Calculator = Position sizing and risk/reward calculations.
 # ============================================
 
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, Union
 from decimal import Decimal
 import math
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Run kernels as plain Python when numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
 from ..core.logger import get_logger
 from ..core.exceptions import BotValidationError
+from . import risk_kernels
 
 logger = get_logger("risk_calculator")
 
+_INF = math.inf
+_PCT = 0.01  # percent -> fraction
+
+# Signal side as an int, resolved once at the API boundary
+_SIDE = risk_kernels.SIDE
+_SIDE_NAMES = ("BUY", "SELL")
+
+
+def _resolve_side(signal_type: str) -> int:
+    """Map 'BUY'/'SELL' to the int side used by the kernels."""
+    try:
+        return _SIDE[signal_type]
+    except KeyError:
+        raise BotValidationError(
+            f"Invalid signal type: {signal_type}",
+            field="signal_type",
+            value=signal_type,
+        ) from None
+
+
+def _as_float(value: Union[float, int, Decimal], field: str) -> float:
+    """Coerce a price/amount to float for the f8 kernels."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise BotValidationError(
+            f"{field} must be a number", field=field, value=value
+        ) from None
+
+
+# ==================== KERNELS ====================
+# Compile the kernels at import: explicit signatures mean the first signal
+# pays no JIT cost, and cache=True reuses the machine code across restarts.
+# An optional ahead-of-time build (python shared/utils/risk_kernels.py, via
+# the deprecated numba.pycc) is used instead when present.
+try:
+    from . import risk_kernels_aot as _aot
+except ImportError:
+    _aot = None
+
+
+def _kernel(name: str, **options):
+    if _aot is not None:
+        return getattr(_aot, name)
+    return njit([risk_kernels.SIGNATURES[name]], cache=True, **options)(
+        getattr(risk_kernels, name)
+    )
+
+
+_position_size = _kernel("position_size", fastmath=True)
+_risk_reward = _kernel("risk_reward", fastmath=True)
+_take_profit_for_rr = _kernel("take_profit_for_rr", fastmath=True)
+_breakeven = _kernel("breakeven", fastmath=True)
+_trailing_stop = _kernel("trailing_stop", fastmath=True)
+_max_drawdown = _kernel("max_drawdown")
+_sharpe_ratio = _kernel("sharpe_ratio")
+
+
+@njit(["Tuple((f8[::1], f8[::1], f8[::1]))(f8[:, ::1], f8)"], parallel=True, cache=True)
+def _batch_metrics(curves, risk_free_rate):
+    # One fused pass per curve (row); rows are independent, so prange spreads
+    # them across cores while each row streams through cache contiguously
+    n, m = curves.shape
+    sharpes = np.empty(n)
+    drawdowns = np.empty(n)
+    profit_factors = np.empty(n)
+    for i in prange(n):
+        peak = curves[i, 0]
+        worst = 0.0
+        mean = 0.0
+        sq_dev = 0.0
+        gains = 0.0
+        losses = 0.0
+        for j in range(1, m):
+            prev = curves[i, j - 1]
+            value = curves[i, j]
+            pnl = value - prev
+            ret = pnl / prev
+            # Welford update keeps the variance stable in the single pass
+            delta = ret - mean
+            mean += delta / j
+            sq_dev += delta * (ret - mean)
+            if pnl > 0:
+                gains += pnl
+            else:
+                losses -= pnl
+            if value > peak:
+                peak = value
+            drawdown = (value - peak) / peak
+            if drawdown < worst:
+                worst = drawdown
+
+        variance = sq_dev / (m - 1)
+        if variance <= 0.0:
+            sharpes[i] = 0.0
+        else:
+            sharpes[i] = (mean - risk_free_rate) / math.sqrt(variance)
+        drawdowns[i] = abs(worst) * 100.0
+        if losses == 0.0:
+            profit_factors[i] = math.inf if gains > 0.0 else 0.0
+        else:
+            profit_factors[i] = gains / losses
+    return sharpes, drawdowns, profit_factors
+
 
 class RiskCalculator:
     """
     Calculate position sizes, risk/reward ratios, and risk metrics.
     """
 
+    __slots__ = ("account_balance", "default_risk_percentage", "min_rr_ratio")
+
     def __init__(
         self,
         account_balance: float,
@@ -33,9 +157,11 @@ class RiskCalculator:
             default_risk_percentage: Default risk per trade (%)
             min_rr_ratio: Minimum acceptable risk/reward ratio
         """
-        self.account_balance = account_balance
-        self.default_risk_percentage = default_risk_percentage
-        self.min_rr_ratio = min_rr_ratio
+        self.account_balance = _as_float(account_balance, "account_balance")
+        self.default_risk_percentage = _as_float(
+            default_risk_percentage, "default_risk_percentage"
+        )
+        self.min_rr_ratio = _as_float(min_rr_ratio, "min_rr_ratio")
 
     def calculate_position_size(
         self,
@@ -54,26 +180,17 @@ class RiskCalculator:
         Returns:
             Position size in base currency
         """
-        try:
-            risk_pct = risk_percentage or self.default_risk_percentage
-
-            # Calculate risk amount in currency
-            risk_amount = self.account_balance * (risk_pct / 100)
-
-            # Calculate risk per unit
-            risk_per_unit = abs(entry_price - stop_loss)
-
-            if risk_per_unit == 0:
-                raise BotValidationError("Stop loss cannot equal entry price")
-
-            # Calculate position size
-            position_size = risk_amount / risk_per_unit
-
-            return position_size
+        entry_price = _as_float(entry_price, "entry_price")
+        stop_loss = _as_float(stop_loss, "stop_loss")
+        if entry_price == stop_loss:
+            raise BotValidationError(
+                "Stop loss cannot equal entry price", field="stop_loss", value=stop_loss
+            )
 
-        except Exception as e:
-            logger.error(f"Position size calculation failed: {e}")
-            raise BotValidationError(f"Position size calculation failed: {str(e)}")
+        risk_pct = _as_float(
+            risk_percentage or self.default_risk_percentage, "risk_percentage"
+        )
+        return _position_size(self.account_balance, risk_pct, entry_price, stop_loss)
 
     def calculate_risk_reward_ratio(
         self, entry_price: float, stop_loss: float, take_profit: float
@@ -89,18 +206,7 @@ class RiskCalculator:
         Returns:
             Risk/reward ratio
         """
-        try:
-            risk = abs(entry_price - stop_loss)
-            if risk == 0:
-                raise BotValidationError("Risk cannot be zero")
-
-            reward = abs(take_profit - entry_price)
-
-            return reward / risk
-
-        except Exception as e:
-            logger.error(f"R/R ratio calculation failed: {e}")
-            raise BotValidationError(f"R/R ratio calculation failed: {str(e)}") from e
+        return calculate_rr_ratio(entry_price, stop_loss, take_profit)
 
     def calculate_take_profit_for_rr(
         self,
@@ -121,23 +227,17 @@ class RiskCalculator:
         Returns:
             Take profit price
         """
-        try:
-            risk = abs(entry_price - stop_loss)
-            reward = risk * target_rr
-
-            if signal_type.upper() == "BUY":
-                return entry_price + reward
-            else:  # SELL
-                return entry_price - reward
-
-        except Exception as e:
-            logger.error(f"Take profit calculation failed: {e}")
-            raise BotValidationError(f"Take profit calculation failed: {str(e)}") from e
+        side = _resolve_side(signal_type)
+        return _take_profit_for_rr(
+            _as_float(entry_price, "entry_price"),
+            _as_float(stop_loss, "stop_loss"),
+            side,
+            _as_float(target_rr, "target_rr"),
+        )
 
     def validate_signal_risk(
         self, entry_price: float, stop_loss: float, take_profit: float, signal_type: str
     ) -> Tuple[bool, str, Dict[str, Any]]:
-        # sourcery skip: merge-dict-assign, move-assign-in-block
         """
         Validate if signal meets risk requirements.
 
@@ -151,40 +251,53 @@ class RiskCalculator:
             Tuple of (is_valid, reason, metrics)
         """
         try:
-            metrics = {}
+            entry_price = _as_float(entry_price, "entry_price")
+            stop_loss = _as_float(stop_loss, "stop_loss")
+            take_profit = _as_float(take_profit, "take_profit")
 
-            # Calculate R/R ratio
-            rr_ratio = self.calculate_risk_reward_ratio(
-                entry_price, stop_loss, take_profit
-            )
-            metrics["rr_ratio"] = rr_ratio
-
-            # Validate price logic
-            if signal_type.upper() == "BUY":
-                if not (stop_loss < entry_price < take_profit):
-                    return False, "Invalid price levels for BUY signal", metrics
-            elif not (take_profit < entry_price < stop_loss):
-                return False, "Invalid price levels for SELL signal", metrics
+            # Risk and reward per unit are computed once and shared by the
+            # R/R check and the metrics below
+            risk_per_unit = abs(entry_price - stop_loss)
+            if risk_per_unit == 0:
+                raise BotValidationError(
+                    "Risk cannot be zero", field="stop_loss", value=stop_loss
+                )
+            reward_per_unit = abs(take_profit - entry_price)
+            rr_ratio = reward_per_unit / risk_per_unit
+
+            # Validate price logic: +1 for BUY, -1 for SELL folds both
+            # orderings into one check
+            side = _resolve_side(signal_type)
+            sign = 1.0 - 2.0 * side
+            if not (
+                sign * (entry_price - stop_loss) > 0
+                and sign * (take_profit - entry_price) > 0
+            ):
+                return (
+                    False,
+                    f"Invalid price levels for {_SIDE_NAMES[side]} signal",
+                    {"rr_ratio": rr_ratio},
+                )
 
             # Check minimum R/R ratio
             if rr_ratio < self.min_rr_ratio:
                 return (
                     False,
                     f"R/R ratio {rr_ratio:.2f} below minimum {self.min_rr_ratio}",
-                    metrics,
+                    {"rr_ratio": rr_ratio},
                 )
 
             # Calculate potential profit/loss
-            risk_amount = self.account_balance * (self.default_risk_percentage / 100)
-            risk_per_unit = abs(entry_price - stop_loss)
+            risk_amount = self.account_balance * (self.default_risk_percentage * _PCT)
             position_size = risk_amount / risk_per_unit
 
-            potential_loss = risk_amount
-            potential_profit = position_size * abs
-            metrics["potential_loss"] = potential_loss
-            metrics["potential_profit"] = potential_profit
-            metrics["position_size"] = position_size
-            metrics["risk_percentage"] = self.default_risk_percentage
+            metrics = {
+                "rr_ratio": rr_ratio,
+                "potential_loss": risk_amount,
+                "potential_profit": position_size * reward_per_unit,
+                "position_size": position_size,
+                "risk_percentage": self.default_risk_percentage,
+            }
 
             return True, "Signal meets risk requirements", metrics
 
@@ -214,14 +327,12 @@ class RiskCalculator:
         if target_ratios is None:
             target_ratios = [2.0, 4.0, 6.0]  # Default targets
 
-        targets = []
-        for ratio in target_ratios:
-            tp = self.calculate_take_profit_for_rr(
-                entry_price, stop_loss, signal_type, ratio
-            )
-            targets.append(tp)
+        ratios = np.asarray(target_ratios, dtype=np.float64)
+        entry_price = _as_float(entry_price, "entry_price")
+        risk = abs(entry_price - _as_float(stop_loss, "stop_loss"))
+        sign = 1.0 - 2.0 * _resolve_side(signal_type)
 
-        return targets
+        return (entry_price + sign * risk * ratios).tolist()
 
     def calculate_breakeven_point(
         self, entry_price: float, stop_loss: float, signal_type: str
@@ -237,13 +348,12 @@ class RiskCalculator:
         Returns:
             Breakeven price (typically entry + small profit)
         """
-        risk = abs(entry_price - stop_loss)
-        buffer = risk * 0.05  # 5% of risk as buffer
-
-        if signal_type.upper() == "BUY":
-            return entry_price + buffer
-        else:
-            return entry_price - buffer
+        side = _resolve_side(signal_type)
+        return _breakeven(
+            _as_float(entry_price, "entry_price"),
+            _as_float(stop_loss, "stop_loss"),
+            side,
+        )
 
     def calculate_trailing_stop(
         self,
@@ -264,17 +374,13 @@ class RiskCalculator:
         Returns:
             Trailing stop price
         """
-        if signal_type.upper() == "BUY":
-            # For long position
-            return (
-                current_price * (1 - trailing_percentage / 100)
-                if current_price > entry_price
-                else entry_price * (1 - trailing_percentage / 100)
-            )
-        elif current_price < entry_price:
-            return current_price * (1 + trailing_percentage / 100)
-        else:
-            return entry_price * (1 + trailing_percentage / 100)
+        side = _resolve_side(signal_type)
+        return _trailing_stop(
+            _as_float(entry_price, "entry_price"),
+            _as_float(current_price, "current_price"),
+            side,
+            _as_float(trailing_percentage, "trailing_percentage"),
+        )
 
     def calculate_kelly_criterion(
         self, win_rate: float, avg_win: float, avg_loss: float
@@ -290,23 +396,14 @@ class RiskCalculator:
         Returns:
             Optimal position size percentage (0-1)
         """
-        try:
-            if avg_loss == 0:
-                return 0.0
-
-            win_loss_ratio = avg_win / avg_loss
-            kelly_percentage = (
-                win_rate * win_loss_ratio - (1 - win_rate)
-            ) / win_loss_ratio
-
-            # Cap at 25% for safety (fractional Kelly)
-            kelly_percentage = max(0, min(kelly_percentage * 0.5, 0.25))
+        if avg_loss == 0 or avg_win == 0:
+            return 0.0
 
-            return kelly_percentage
+        win_loss_ratio = avg_win / avg_loss
+        kelly_percentage = (win_rate * win_loss_ratio - (1 - win_rate)) / win_loss_ratio
 
-        except Exception as e:
-            logger.error(f"Kelly Criterion calculation failed: {e}")
-            return 0.01  # Default to 1% if calculation fails
+        # Cap at 25% for safety (fractional Kelly)
+        return max(0, min(kelly_percentage * 0.5, 0.25))
 
     def calculate_sharpe_ratio(
         self, returns: list, risk_free_rate: float = 0.0
@@ -321,27 +418,13 @@ class RiskCalculator:
         Returns:
             Sharpe ratio
         """
-        try:
-            if not returns or len(returns) < 2:
-                return 0.0
-
-            import numpy as np
-
-            returns_array = np.array(returns)
-
-            mean_return = np.mean(returns_array)
-            std_return = np.std(returns_array)
-
-            if std_return == 0:
-                return 0.0
+        if returns is None or len(returns) < 2:
+            return 0.0
 
-            sharpe = (mean_return - risk_free_rate) / std_return
+        returns_array = np.ascontiguousarray(returns, dtype=np.float64)
 
-            return sharpe
-
-        except Exception as e:
-            logger.error(f"Sharpe ratio calculation failed: {e}")
-            return 0.0
+        risk_free_rate = _as_float(risk_free_rate, "risk_free_rate")
+        return _sharpe_ratio(returns_array, risk_free_rate)
 
     def calculate_max_drawdown(self, equity_curve: list) -> Tuple[float, int, int]:
         """
@@ -353,55 +436,45 @@ class RiskCalculator:
         Returns:
             Tuple of (max_drawdown_pct, start_idx, end_idx)
         """
-        try:
-            import numpy as np
-
-            equity = np.array(equity_curve)
-
-            # Calculate running maximum
-            running_max = np.maximum.accumulate(equity)
-
-            # Calculate drawdown
-            drawdown = (equity - running_max) / running_max * 100
-
-            # Find maximum drawdown
-            max_dd = np.min(drawdown)
-            max_dd_idx = np.argmin(drawdown)
-
-            # Find start of drawdown period
-            start_idx = np.argmax(running_max[: max_dd_idx + 1])
+        equity = np.ascontiguousarray(equity_curve, dtype=np.float64)
+        if equity.size == 0:
+            return 0.0, 0, 0
 
-            return abs(max_dd), start_idx, max_dd_idx
+        # The running peak never drops below the first value, so a positive
+        # start is enough to keep the drawdown division well defined
+        if equity[0] <= 0:
+            raise BotValidationError(
+                "Equity curve must start positive",
+                field="equity_curve",
+                value=equity[0],
+            )
 
-        except Exception as e:
-            logger.error(f"Max drawdown calculation failed: {e}")
-            return 0.0, 0, 0
+        return _max_drawdown(equity)
 
     def calculate_profit_factor(
-        self, winning_trades: list, losing_trades: list
+        self,
+        winning_trades: Union[list, np.ndarray],
+        losing_trades: Union[list, np.ndarray],
     ) -> float:
         """
         Calculate profit factor.
 
         Args:
-            winning_trades: List of winning trade amounts
-            losing_trades: List of losing trade amounts
+            winning_trades: Winning trade amounts (list or float64 array)
+            losing_trades: Losing trade amounts (list or float64 array)
 
         Returns:
             Profit factor
         """
-        try:
-            total_wins = sum(winning_trades) if winning_trades else 0
-            total_losses = abs(sum(losing_trades)) if losing_trades else 0
-
-            if total_losses == 0:
-                return float("inf") if total_wins > 0 else 0.0
+        # np.asarray passes float64 arrays from the backtest path through
+        # without a copy; the sums are vectorised reductions
+        total_wins = float(np.asarray(winning_trades, dtype=np.float64).sum())
+        total_losses = abs(float(np.asarray(losing_trades, dtype=np.float64).sum()))
 
-            return total_wins / total_losses
+        if total_losses == 0:
+            return _INF if total_wins > 0 else 0.0
 
-        except Exception as e:
-            logger.error(f"Profit factor calculation failed: {e}")
-            return 0.0
+        return total_wins / total_losses
 
     def calculate_win_rate(self, winning_trades: int, total_trades: int) -> float:
         """
@@ -433,64 +506,125 @@ class RiskCalculator:
         Returns:
             Expectancy value
         """
-        win_rate_decimal = win_rate / 100
+        win_rate_decimal = win_rate * _PCT
         loss_rate = 1 - win_rate_decimal
 
         expectancy = (win_rate_decimal * avg_win) - (loss_rate * avg_loss)
 
         return expectancy
 
-    def calculate_position_size(
-        self, entry_price: float, stop_loss: float, risk_percentage: float = 1.0
-    ) -> float:
-        """
-        Args:
+
+# ==================== CONVENIENCE FUNCTIONS ====================
+def calculate_position_size(
+    account_balance: float,
+    entry_price: float,
+    stop_loss: float,
+    risk_percentage: float = 1.0,
+) -> float:
+    """
+    Calculate position size without constructing a RiskCalculator.
+
+    Args:
         account_balance: Account balance
         entry_price: Entry price
         stop_loss: Stop loss price
         risk_percentage: Risk percentage
 
-        Returns:
-            Position size
-        """
-        calculator = RiskCalculator(self, risk_percentage)
-        return calculator.calculate_position_size(entry_price, stop_loss)
+    Returns:
+        Position size
+    """
+    entry_price = _as_float(entry_price, "entry_price")
+    stop_loss = _as_float(stop_loss, "stop_loss")
+    if entry_price == stop_loss:
+        raise BotValidationError(
+            "Stop loss cannot equal entry price", field="stop_loss", value=stop_loss
+        )
 
-    def calculate_rr_ratio(self, stop_loss: float, take_profit: float) -> float:
-        """
-        Args:
+    return _position_size(
+        _as_float(account_balance, "account_balance"),
+        _as_float(risk_percentage, "risk_percentage"),
+        entry_price,
+        stop_loss,
+    )
+
+
+def calculate_rr_ratio(
+    entry_price: float, stop_loss: float, take_profit: float
+) -> float:
+    """
+    Calculate risk/reward ratio without constructing a RiskCalculator.
+
+    Args:
         entry_price: Entry price
         stop_loss: Stop loss price
         take_profit: Take profit price
 
-        Returns:
-            Risk/reward ratio
-        """
-        calculator = RiskCalculator(10000)  # Dummy balance
-        return calculator.calculate_risk_reward_ratio(self, stop_loss, take_profit)
+    Returns:
+        Risk/reward ratio
+    """
+    entry_price = _as_float(entry_price, "entry_price")
+    stop_loss = _as_float(stop_loss, "stop_loss")
+    if entry_price == stop_loss:
+        raise BotValidationError(
+            "Risk cannot be zero", field="stop_loss", value=stop_loss
+        )
 
-    def validate_signal(
-        entry_price: float,
-        stop_loss: float,
-        take_profit: float,
-        signal_type: str,
-        min_rr: float = 4.0,
-    ) -> Tuple[bool, str]:
-        """
-        Validate a signal quickly using RiskCalculator.
+    return _risk_reward(entry_price, stop_loss, _as_float(take_profit, "take_profit"))
 
-        Args:
-            entry_price: Entry price
-            stop_loss: Stop loss price
-            take_profit: Take profit price
-            signal_type: 'BUY' or 'SELL'
-            min_rr: Minimum R/R ratio
 
-        Returns:
-            Tuple of (is_valid, reason)
-        """
-        calculator = RiskCalculator(10000, min_rr_ratio=min_rr)
-        is_valid, reason, _ = calculator.validate_signal_risk(
-            entry_price, stop_loss, take_profit, signal_type
+def validate_signal(
+    entry_price: float,
+    stop_loss: float,
+    take_profit: float,
+    signal_type: str,
+    min_rr: float = 4.0,
+) -> Tuple[bool, str]:
+    """
+    Validate a signal quickly using RiskCalculator.
+
+    Args:
+        entry_price: Entry price
+        stop_loss: Stop loss price
+        take_profit: Take profit price
+        signal_type: 'BUY' or 'SELL'
+        min_rr: Minimum R/R ratio
+
+    Returns:
+        Tuple of (is_valid, reason)
+    """
+    calculator = RiskCalculator(10000, min_rr_ratio=min_rr)
+    is_valid, reason, _ = calculator.validate_signal_risk(
+        entry_price, stop_loss, take_profit, signal_type
+    )
+    return is_valid, reason
+
+
+def batch_metrics(
+    equity_curves: np.ndarray, risk_free_rate: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate Sharpe ratio, max drawdown and profit factor for many curves.
+
+    Each row is one equity curve (e.g. one symbol or parameter set of a
+    backtest sweep); rows are processed in parallel.
+
+    Args:
+        equity_curves: 2-D array of shape (n_curves, n_points), n_points >= 2
+        risk_free_rate: Risk-free rate per step for the Sharpe ratio
+
+    Returns:
+        Tuple of (sharpe_ratios, max_drawdown_pcts, profit_factors) arrays
+    """
+    curves = np.ascontiguousarray(equity_curves, dtype=np.float64)
+    if curves.ndim != 2 or curves.shape[1] < 2:
+        raise BotValidationError(
+            "Equity curves must be a 2-D array with at least 2 points per curve",
+            field="equity_curves",
+            value=curves.shape,
+        )
+    if (curves[:, 0] <= 0).any():
+        raise BotValidationError(
+            "Equity curves must start positive", field="equity_curves"
         )
-        return is_valid, reason
+
+    return _batch_metrics(curves, _as_float(risk_free_rate, "risk_free_rate"))
@@ -0,0 +1,146 @@
+# ============================================
+# Crypto Trading Signal System
+# backed/bots/shared/utils/risk_kernels.py
+# Deception: Risk Kernels = Scalar math behind RiskCalculator, JIT-compiled and cached.
+# ============================================
+"""
+Numeric kernels for RiskCalculator.
+
+The functions below are plain Python written in the numba subset.
+``risk_calculator._kernel()`` compiles them at import with ``@njit``, the
+signatures in ``SIGNATURES`` and ``cache=True``: the first signal pays no
+JIT cost, and after the first run the machine code is loaded from
+``__pycache__`` instead of being recompiled. This is the supported path.
+
+Optionally, ``build()`` compiles the same functions ahead of time into the
+``risk_kernels_aot`` extension, which ``_kernel()`` prefers when present::
+
+    python shared/utils/risk_kernels.py
+
+The AOT build uses ``numba.pycc``, which numba has deprecated since 0.57
+and will remove. It works with the ``numba==0.58.1`` pin in
+``requirements.txt``; once pycc is removed, delete ``build()`` instead of
+holding numba back, since the JIT path needs nothing else.
+
+Inputs are validated by the calling method; side is BUY (0) or SELL (1).
+"""
+
+import math
+import os
+
+BUY = 0
+SELL = 1
+
+# Signal type -> side, resolved once at the API boundary
+SIDE = {
+    "BUY": BUY,
+    "buy": BUY,
+    "Buy": BUY,
+    "SELL": SELL,
+    "sell": SELL,
+    "Sell": SELL,
+}
+
+# Exported name -> numba signature, shared by the AOT build and the JIT path
+SIGNATURES = {
+    "position_size": "f8(f8,f8,f8,f8)",
+    "risk_reward": "f8(f8,f8,f8)",
+    "take_profit_for_rr": "f8(f8,f8,i8,f8)",
+    "breakeven": "f8(f8,f8,i8)",
+    "trailing_stop": "f8(f8,f8,i8,f8)",
+    "max_drawdown": "Tuple((f8, i8, i8))(f8[::1])",
+    "sharpe_ratio": "f8(f8[::1],f8)",
+}
+
+
+def position_size(balance, risk_pct, entry, sl):
+    r = entry - sl
+    return balance * (risk_pct * 0.01) / (r if r >= 0 else -r)
+
+
+def risk_reward(entry, sl, tp):
+    risk = entry - sl
+    reward = tp - entry
+    return (reward if reward >= 0 else -reward) / (risk if risk >= 0 else -risk)
+
+
+def take_profit_for_rr(entry, sl, side, target_rr):
+    risk = entry - sl
+    reward = (risk if risk >= 0 else -risk) * target_rr
+    if side == BUY:
+        return entry + reward
+    return entry - reward
+
+
+def breakeven(entry, sl, side):
+    # +1 for BUY, -1 for SELL: 5% of risk as buffer in one multiply-add
+    sign = 1.0 - 2.0 * side
+    return entry + sign * 0.05 * abs(entry - sl)
+
+
+def trailing_stop(entry, current, side, pct):
+    factor = pct * 0.01
+    if side == BUY:
+        # Long: trail below the best price seen
+        return max(current, entry) * (1.0 - factor)
+    return min(current, entry) * (1.0 + factor)
+
+
+def max_drawdown(equity):
+    # One pass tracking the running peak and deepest drawdown in registers
+    peak = equity[0]
+    peak_idx = 0
+    start_idx = 0
+    end_idx = 0
+    worst = 0.0
+    for i in range(equity.shape[0]):
+        value = equity[i]
+        if value > peak:
+            peak = value
+            peak_idx = i
+        drawdown = (value - peak) / peak
+        if drawdown < worst:
+            worst = drawdown
+            end_idx = i
+            start_idx = peak_idx
+    return abs(worst) * 100.0, start_idx, end_idx
+
+
+def sharpe_ratio(returns, risk_free_rate):
+    # Welford's running mean and squared deviations (population std, like
+    # np.std); sum of squares minus mean squared cancels for a large mean
+    n = returns.shape[0]
+    mean = 0.0
+    sq_dev = 0.0
+    for i in range(n):
+        value = returns[i]
+        delta = value - mean
+        mean += delta / (i + 1)
+        sq_dev += delta * (value - mean)
+    variance = sq_dev / n
+    if variance <= 0.0:
+        return 0.0
+    return (mean - risk_free_rate) / math.sqrt(variance)
+
+
+def build(output_dir: str = None) -> None:
+    """
+    Compile the kernels into the ``risk_kernels_aot`` extension module.
+
+    Optional: needs the deprecated ``numba.pycc`` (numba <= 0.58.1 here);
+    without the extension the kernels are JIT-compiled and cached.
+
+    Args:
+        output_dir: Where to write the extension (defaults to this package)
+    """
+    from numba.pycc import CC
+
+    cc = CC("risk_kernels_aot")
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    for name, signature in SIGNATURES.items():
+        cc.export(name, signature)(globals()[name])
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
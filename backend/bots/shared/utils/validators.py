@@ -9,11 +9,46 @@ from typing import Any, List, Dict, Optional, Union
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 
+import numpy as np
+
 from ..core.logger import get_logger
 from ..core.exceptions import BotValidationError
+from .risk_kernels import SIDE
 
 logger = get_logger("validators")
 
+# Symbol format (e.g., BTCUSDT, BTC/USDT, BTC-USDT)
+_SYMBOL_RE = re.compile(r"^[A-Z]{2,10}[/\-]?[A-Z]{2,10}$")
+
+_VALID_TIMEFRAMES = frozenset(
+    {
+        "1m",
+        "3m",
+        "5m",
+        "15m",
+        "30m",
+        "1h",
+        "2h",
+        "4h",
+        "6h",
+        "8h",
+        "12h",
+        "1d",
+        "3d",
+        "1w",
+        "1M",
+    }
+)
+
+# Characters stripped by sanitize_string
+_STRIP_TABLE = str.maketrans("", "", "<>")
+
+# Price-order error per side, indexed by the int side from SIDE
+_PRICE_ORDER_ERRORS = (
+    "For BUY: stop_loss < entry_price < take_profit required",
+    "For SELL: take_profit < entry_price < stop_loss required",
+)
+
 
 class DataValidator:
     """Validate various data types and formats."""
@@ -35,8 +70,7 @@ class DataValidator:
             )
 
         # Check format (e.g., BTCUSDT, BTC/USDT, BTC-USDT)
-        pattern = r"^[A-Z]{2,10}[/\-]?[A-Z]{2,10}$"
-        if not re.match(pattern, symbol):
+        if not _SYMBOL_RE.match(symbol):
             raise BotValidationError(f"Invalid symbol format: {symbol}", field="symbol")
 
         return True
@@ -110,25 +144,7 @@ class DataValidator:
         Returns:
             True if valid
         """
-        valid_timeframes = [
-            "1m",
-            "3m",
-            "5m",
-            "15m",
-            "30m",
-            "1h",
-            "2h",
-            "4h",
-            "6h",
-            "8h",
-            "12h",
-            "1d",
-            "3d",
-            "1w",
-            "1M",
-        ]
-
-        if timeframe not in valid_timeframes:
+        if timeframe not in _VALID_TIMEFRAMES:
             raise BotValidationError(
                 f"Invalid timeframe: {timeframe}", field="timeframe", value=timeframe
             )
@@ -192,21 +208,69 @@ class DataValidator:
         Returns:
             True if valid
         """
-        # Validate individual values
-        DataValidator.validate_price(open_price, "open")
-        DataValidator.validate_price(high, "high")
-        DataValidator.validate_price(low, "low")
-        DataValidator.validate_price(close, "close")
-        DataValidator.validate_volume(volume)
+        try:
+            open_price = float(open_price)
+            high = float(high)
+            low = float(low)
+            close = float(close)
+            volume = float(volume)
+        except (ValueError, TypeError, InvalidOperation) as e:
+            raise BotValidationError("Invalid OHLCV values") from e
+
+        # Positive, sane, internally consistent prices and non-negative volume
+        if not (
+            0 < low <= min(open_price, close)
+            and max(open_price, close) <= high <= 1e10
+            and volume >= 0
+        ):
+            raise BotValidationError(
+                f"Invalid OHLCV: open={open_price}, high={high}, low={low}, "
+                f"close={close}, volume={volume}"
+            )
 
-        # Validate relationships
-        if not (low <= open_price <= high and low <= close <= high):
-            raise BotValidationError("OHLC values are inconsistent")
+        return True
 
-        if high < low:
-            raise BotValidationError("High cannot be less than Low")
+    @staticmethod
+    def validate_ohlcv_batch(
+        ohlcv: np.ndarray, raise_on_invalid: bool = True
+    ) -> np.ndarray:
+        """
+        Validate many OHLCV rows at once.
 
-        return True
+        Args:
+            ohlcv: (N, 5) array of open, high, low, close, volume
+            raise_on_invalid: Raise on the first invalid row instead of
+                returning the mask
+
+        Returns:
+            Boolean mask of valid rows
+        """
+        ohlcv = np.asarray(ohlcv, dtype=np.float64)
+        if ohlcv.ndim != 2 or ohlcv.shape[1] != 5:
+            raise BotValidationError(
+                f"OHLCV batch must have shape (N, 5), got {ohlcv.shape}"
+            )
+
+        open_price, high, low, close, volume = ohlcv.T
+        valid = (
+            (low > 0)
+            & (high <= 1e10)
+            & (volume >= 0)
+            & (low <= open_price)
+            & (open_price <= high)
+            & (low <= close)
+            & (close <= high)
+        )
+
+        if raise_on_invalid and not valid.all():
+            bad = int(np.argmin(valid))
+            raise BotValidationError(
+                f"Invalid OHLCV at row {bad}: {ohlcv[bad].tolist()}",
+                field="ohlcv",
+                value=bad,
+            )
+
+        return valid
 
     @staticmethod
     def validate_signal_data(
@@ -242,17 +306,22 @@ class DataValidator:
         DataValidator.validate_confidence(confidence)
         DataValidator.validate_timeframe(timeframe)
 
-        # Validate price logic
-        if signal_type.upper() == "BUY":
-            if not (stop_loss < entry_price < take_profit):
-                raise BotValidationError(
-                    "For BUY: stop_loss < entry_price < take_profit required"
-                )
-        else:  # SELL
-            if not (take_profit < entry_price < stop_loss):
-                raise BotValidationError(
-                    "For SELL: take_profit < entry_price < stop_loss required"
-                )
+        # Validate price logic: +1 for BUY, -1 for SELL folds both orderings
+        # into one check. Prices passed validate_price, so float() succeeds
+        # and mixed Decimal/float/str inputs compare like the old chained
+        # checks. Mixed case was accepted above, hence the fallback.
+        entry_price = float(entry_price)
+        stop_loss = float(stop_loss)
+        take_profit = float(take_profit)
+        side = SIDE.get(signal_type)
+        if side is None:
+            side = SIDE[signal_type.upper()]
+        sign = 1 - 2 * side
+        if not (
+            sign * (entry_price - stop_loss) > 0
+            and sign * (take_profit - entry_price) > 0
+        ):
+            raise BotValidationError(_PRICE_ORDER_ERRORS[side])
 
         return True
 
@@ -314,8 +383,7 @@ class DataValidator:
             value = str(value)
 
         # Remove potentially dangerous characters
-        value = value.strip()
-        value = re.sub(r"[<>]", "", value)
+        value = value.strip().translate(_STRIP_TABLE)
 
         # Limit length
         if len(value) > max_length:
@@ -374,57 +442,59 @@ class DataValidator:
 
         return True
 
-    # Convenience validation functions
-    def validate_signal(self) -> bool:
-        """
-        Validate signal dictionary.
-
-        Args:
-            signal_data: Signal data dictionary
-
-        Returns:
-            True if valid
-        """
-        required_keys = [
-            "symbol",
-            "signal_type",
-            "entry_price",
-            "stop_loss",
-            "take_profit",
-            "confidence",
-            "timeframe",
-        ]
-
-        DataValidator.validate_dict_keys(self, required_keys)
-
-        return DataValidator.validate_signal_data(
-            symbol=self["symbol"],
-            signal_type=self["signal_type"],
-            entry_price=self["entry_price"],
-            stop_loss=self["stop_loss"],
-            take_profit=self["take_profit"],
-            confidence=self["confidence"],
-            timeframe=self["timeframe"],
-        )
-
-    def validate_price_data(self) -> bool:
-        """
-        Validate price data dictionary.
-
-        Args:
-            price_data: Price data dictionary
 
-        Returns:
-            True if valid
-        """
-        required_keys = ["open", "high", "low", "close", "volume"]
-
-        DataValidator.validate_dict_keys(self, required_keys)
-
-        return DataValidator.validate_ohlcv(
-            open_price=self["open"],
-            high=self["high"],
-            low=self["low"],
-            close=self["close"],
-            volume=self["volume"],
-        )
+# Convenience validation functions
+def validate_signal(signal_data: Dict[str, Any]) -> bool:
+    """
+    Validate signal dictionary.
+
+    Args:
+        signal_data: Signal data dictionary
+
+    Returns:
+        True if valid
+    """
+    required_keys = [
+        "symbol",
+        "signal_type",
+        "entry_price",
+        "stop_loss",
+        "take_profit",
+        "confidence",
+        "timeframe",
+    ]
+
+    DataValidator.validate_dict_keys(signal_data, required_keys)
+
+    return DataValidator.validate_signal_data(
+        symbol=signal_data["symbol"],
+        signal_type=signal_data["signal_type"],
+        entry_price=signal_data["entry_price"],
+        stop_loss=signal_data["stop_loss"],
+        take_profit=signal_data["take_profit"],
+        confidence=signal_data["confidence"],
+        timeframe=signal_data["timeframe"],
+    )
+
+
+def validate_price_data(price_data: Dict[str, Any]) -> bool:
+    """
+    Validate price data dictionary.
+
+    Args:
+        price_data: Price data dictionary
+
+    Returns:
+        True if valid
+    """
+    required_keys = ["open", "high", "low", "close", "volume"]
+
+    DataValidator.validate_dict_keys(price_data, required_keys)
+
+    return DataValidator.validate_ohlcv(
+        open_price=price_data["open"],
+        high=price_data["high"],
+        low=price_data["low"],
+        close=price_data["close"],
+        volume=price_data["volume"],
+    )
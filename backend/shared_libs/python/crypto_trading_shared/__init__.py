@@ -12,6 +12,11 @@ Shared code used across all trading bots
 from .constants import *
 from .enums import *
 from .types import *
+from .constraints import (BipolarFloat, Percent, Rating1to5, Score100,
+                          UnitFloat)
+from .keywords import KeywordMatcher
+from .settings import SETTINGS, Settings, load_settings
+from .log_config import configure_logging
 
 __version__ = "1.0.0"
 __author__ = "Crypto Trading System"
@@ -26,14 +31,39 @@ __all__ = [
     "SUPPORTED_EXCHANGES",
     "SUPPORTED_SYMBOLS",
     "DEFAULT_TIMEFRAMES",
+    "SUPPORTED_EXCHANGES_SET",
+    "SUPPORTED_SYMBOLS_SET",
+    "DEFAULT_TIMEFRAMES_SET",
+    "MAJOR_PAIRS_SET",
     "API_ENDPOINTS",
     "DATABASE_NAMES",
+    "TIMESCALE_TABLES",
+    "TIMESCALE_WRITE_CONFIG",
+    "TIMESCALE_PARALLEL_WRITERS",
+    "symbol_shard",
+    "TIMESCALE_HYPERTABLE_CONFIG",
+    "TIMESCALE_INDEXES",
+    "OHLCV_DTYPE",
+    "PRICE_SCALE",
     "RABBITMQ_EXCHANGES",
     "RABBITMQ_QUEUES",
+    "RABBITMQ_PREFETCH",
+    "RABBITMQ_PERSISTENCE",
+    "RABBITMQ_CONFIRM_BATCH_SIZE",
     "REDIS_KEYS",
+    "REDIS_KEY_FORMATTERS",
+    "REDIS_KEY_BUILDERS",
     "RISK_LIMITS",
     "SIGNAL_THRESHOLDS",
+    "MIN_RISK_REWARD",
+    "MAX_RISK_PER_TRADE",
+    "MIN_CONFIDENCE",
+    "MIN_HISTORICAL_WIN_RATE",
+    "VALIDATION_CACHE_SIZE",
+    "INDICATOR_CFG",
     "ML_MODEL_PATHS",
+    "TOPIC_KEYWORDS",
+    "LOG_RENDERER",
     
     # Enums
     "SignalType",
@@ -52,8 +82,17 @@ __all__ = [
     "TradeOutcome",
     "NotificationChannel",
     "LogLevel",
+    "NewsImpactT",
+    "SentimentScoreT",
+    "TradeOutcomeT",
+    "BotStatusT",
+    "ValidationStatusT",
+    "NotificationChannelT",
     
     # Types
+    "BASE_CONFIG",
+    "TRANSPORT_CONFIG",
+    "FastModel",
     "PriceData",
     "OHLCVData",
     "IndicatorData",
@@ -61,11 +100,50 @@ __all__ = [
     "NewsData",
     "SentimentData",
     "PerformanceMetrics",
+    "TradeResultBatch",
     "RiskRewardRatio",
     "TradeLevels",
     "BotHealthMetrics",
     "MLModelMetrics",
     "FeedbackData",
     "ValidationResult",
+    "cached_validation_result",
     "MessagePayload",
+    "MessagePayloadMsg",
+    "NotificationMsg",
+    "MSGPACK_CONTENT_TYPE",
+    "encode_msgpack",
+    "decode_message_payload",
+    "decode_notification",
+    "OHLCVMsg",
+    "PriceMsg",
+    "IndicatorMsg",
+    "MarketDataUpdate",
+    "ohlcv_batch_from_msgs",
+    "ohlcv_batch_from_models",
+    "dump_many",
+    "parse_many",
+    "TradeResultList",
+    "SignalDataList",
+    "NewsDataList",
+    "BotHealthMetricsList",
+    "response_adapter",
+
+    # Constraints
+    "UnitFloat",
+    "BipolarFloat",
+    "Percent",
+    "Score100",
+    "Rating1to5",
+
+    # Settings
+    "SETTINGS",
+    "Settings",
+    "load_settings",
+
+    # Keyword matching
+    "KeywordMatcher",
+
+    # Logging
+    "configure_logging",
 ]
\ No newline at end of file
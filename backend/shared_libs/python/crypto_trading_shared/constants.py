@@ -3,7 +3,14 @@ Shared Constants
 All system-wide constants used across bots
 """
 
-from typing import Dict, List, Any
+import zlib
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, List, Any, Final, NamedTuple, Tuple
+
+import numpy as np
+
+from .enums import NewsTopic
 
 
 # ============================================================================
@@ -30,6 +37,10 @@ DEFAULT_TIMEFRAMES = [
     TimeFrame.D1,
 ]
 
+# Hot-path membership checks should use the *_SET variants (O(1) hash
+# lookup); the ordered lists above remain for iteration and display.
+DEFAULT_TIMEFRAMES_SET = frozenset(DEFAULT_TIMEFRAMES)
+
 # ============================================================================
 # EXCHANGES
 # ============================================================================
@@ -41,6 +52,8 @@ SUPPORTED_EXCHANGES = [
     "okx",
 ]
 
+SUPPORTED_EXCHANGES_SET = frozenset(SUPPORTED_EXCHANGES)
+
 DEFAULT_EXCHANGE = "binance"
 
 # ============================================================================
@@ -64,11 +77,15 @@ SUPPORTED_SYMBOLS = [
     "BCH/USDT",
 ]
 
+SUPPORTED_SYMBOLS_SET = frozenset(SUPPORTED_SYMBOLS)
+
 MAJOR_PAIRS = [
     "BTC/USDT",
     "ETH/USDT",
 ]
 
+MAJOR_PAIRS_SET = frozenset(MAJOR_PAIRS)
+
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
@@ -110,6 +127,79 @@ TIMESCALE_TABLES = {
     "trades": "recent_trades",
 }
 
+# A single COPY stream is single-threaded on the server; ingest is split by
+# symbol into this many concurrent COPY streams, one pooled connection each
+TIMESCALE_PARALLEL_WRITERS = 8
+
+
+def symbol_shard(symbol: str, n: int = TIMESCALE_PARALLEL_WRITERS) -> int:
+    """Stable symbol -> writer shard (same in every process, unlike hash())"""
+    return zlib.crc32(symbol.encode()) % n
+
+
+# Hypertable ingest: rows are written time-ordered (so inserts land in the
+# newest chunk) in batches of up to batch_size, via COPY when the driver
+# supports it instead of per-row INSERTs.
+TIMESCALE_WRITE_CONFIG = {
+    "batch_size": 10000,
+    "sort_by_time": True,
+    "use_copy": True,
+    "parallel_writers": TIMESCALE_PARALLEL_WRITERS,
+}
+
+# Chunk sizing and native compression per hypertable. Chunks are sized so
+# the active chunk (and its indexes) stays well inside memory; older chunks
+# are compressed, segmented by the columns queries filter on.
+TIMESCALE_HYPERTABLE_CONFIG = {
+    "ohlcv_data": {
+        "chunk_time_interval": "1 day",
+        "compress_after": "7 days",
+        "segment_by": "symbol, timeframe",
+        "order_by": "timestamp DESC",
+    },
+    "technical_indicators": {
+        "chunk_time_interval": "1 day",
+        "compress_after": "7 days",
+        "segment_by": "symbol, indicator_name",
+        "order_by": "timestamp DESC",
+    },
+    "orderbook_snapshots": {
+        "chunk_time_interval": "1 hour",
+        "compress_after": "1 day",
+        "segment_by": "symbol",
+        "order_by": "timestamp DESC",
+    },
+    "recent_trades": {
+        "chunk_time_interval": "1 hour",
+        "compress_after": "1 day",
+        "segment_by": "symbol",
+        "order_by": "timestamp DESC",
+    },
+}
+
+# Composite indexes for symbol-scoped time-range reads. The default
+# time-only hypertable index can't narrow by symbol; leading with symbol
+# lets each chunk seek straight to that symbol's newest rows.
+TIMESCALE_INDEXES = {
+    "ix_ohlcv_sym_ts": (
+        "CREATE INDEX IF NOT EXISTS ix_ohlcv_sym_ts "
+        "ON ohlcv_data (symbol, timestamp DESC)"
+    ),
+    "ix_ind_sym_ind_ts": (
+        "CREATE INDEX IF NOT EXISTS ix_ind_sym_ind_ts "
+        "ON technical_indicators (symbol, indicator_name, timestamp DESC) "
+        "INCLUDE (value)"
+    ),
+    "ix_orderbook_sym_ts": (
+        "CREATE INDEX IF NOT EXISTS ix_orderbook_sym_ts "
+        "ON orderbook_snapshots (symbol, timestamp DESC)"
+    ),
+    "ix_trades_sym_ts": (
+        "CREATE INDEX IF NOT EXISTS ix_trades_sym_ts "
+        "ON recent_trades (symbol, timestamp DESC)"
+    ),
+}
+
 # ============================================================================
 # RABBITMQ CONFIGURATION
 # ============================================================================
@@ -158,6 +248,67 @@ RABBITMQ_ROUTING_KEYS = {
     "system.health": "system.health",
 }
 
+# Consumer prefetch (unacked messages in flight) per queue. High-rate stream
+# workers take a batch-sized window; slow or long-running jobs take 1 so work
+# is spread across consumers instead of queuing behind one of them.
+RABBITMQ_PREFETCH = {
+    # Market Data
+    "market_data_queue": 250,
+    "ohlcv_queue": 250,
+    # News
+    "news_raw_queue": 50,
+    "news_processed_queue": 50,
+    # Analysis
+    "technical_analysis_queue": 100,
+    "sentiment_analysis_queue": 50,
+    "itc_analysis_queue": 100,
+    "pattern_recognition_queue": 100,
+    # Signals
+    "raw_signals_queue": 100,
+    "validated_signals_queue": 100,
+    "final_signals_queue": 20,
+    # Feedback
+    "feedback_queue": 50,
+    "ml_retraining_queue": 1,
+    # Notifications
+    "notifications_queue": 20,
+    # System
+    "health_checks_queue": 10,
+    "errors_queue": 50,
+}
+
+# Delivery mode per queue: persistent messages are fsynced by the broker.
+# Market data is replayable from the exchanges, so it is published transient;
+# signals, feedback and retraining jobs must survive a broker restart.
+RABBITMQ_PERSISTENCE = {
+    # Market Data
+    "market_data_queue": False,
+    "ohlcv_queue": False,
+    # News
+    "news_raw_queue": True,
+    "news_processed_queue": True,
+    # Analysis
+    "technical_analysis_queue": False,
+    "sentiment_analysis_queue": False,
+    "itc_analysis_queue": False,
+    "pattern_recognition_queue": False,
+    # Signals
+    "raw_signals_queue": True,
+    "validated_signals_queue": True,
+    "final_signals_queue": True,
+    # Feedback
+    "feedback_queue": True,
+    "ml_retraining_queue": True,
+    # Notifications
+    "notifications_queue": True,
+    # System
+    "health_checks_queue": False,
+    "errors_queue": True,
+}
+
+# Publisher confirms awaited together per batch on high-rate streams
+RABBITMQ_CONFIRM_BATCH_SIZE = 1000
+
 # ============================================================================
 # REDIS KEY PATTERNS
 # ============================================================================
@@ -225,6 +376,30 @@ SIGNAL_THRESHOLDS = {
     "high_volume_ratio": 3.0,  # 3x average volume
 }
 
+# Scalar thresholds for hot validation paths (module globals instead of
+# dict lookups); values come from the dicts above
+MIN_RISK_REWARD: Final[float] = RISK_LIMITS["min_risk_reward"]
+MAX_RISK_PER_TRADE: Final[float] = RISK_LIMITS["max_risk_per_trade"]
+MAX_DAILY_RISK: Final[float] = RISK_LIMITS["max_daily_risk"]
+MAX_DRAWDOWN: Final[float] = RISK_LIMITS["max_drawdown"]
+MIN_WIN_RATE: Final[float] = RISK_LIMITS["min_win_rate"]
+
+MIN_CONFIDENCE: Final[float] = SIGNAL_THRESHOLDS["min_confidence"]
+HIGH_CONFIDENCE: Final[float] = SIGNAL_THRESHOLDS["high_confidence"]
+VERY_HIGH_CONFIDENCE: Final[float] = SIGNAL_THRESHOLDS["very_high_confidence"]
+WEAK_STRENGTH: Final[float] = SIGNAL_THRESHOLDS["weak_strength"]
+MEDIUM_STRENGTH: Final[float] = SIGNAL_THRESHOLDS["medium_strength"]
+STRONG_STRENGTH: Final[float] = SIGNAL_THRESHOLDS["strong_strength"]
+MIN_HISTORICAL_WIN_RATE: Final[float] = SIGNAL_THRESHOLDS["min_historical_win_rate"]
+GOOD_WIN_RATE: Final[float] = SIGNAL_THRESHOLDS["good_win_rate"]
+EXCELLENT_WIN_RATE: Final[float] = SIGNAL_THRESHOLDS["excellent_win_rate"]
+MIN_VOLUME_RATIO: Final[float] = SIGNAL_THRESHOLDS["min_volume_ratio"]
+HIGH_VOLUME_RATIO: Final[float] = SIGNAL_THRESHOLDS["high_volume_ratio"]
+
+# ValidationResults kept for signals that repeat a rule set within the same
+# minute (types.cached_validation_result)
+VALIDATION_CACHE_SIZE: Final[int] = 512
+
 # ============================================================================
 # TECHNICAL INDICATORS
 # ============================================================================
@@ -246,6 +421,85 @@ INDICATOR_SETTINGS = {
     "volume_ma": {"period": 20},
 }
 
+
+# Typed, immutable views of INDICATOR_SETTINGS for hot paths: attribute
+# access on a tuple instead of nested dict lookups (INDICATOR_CFG.rsi.period)
+class RSIConfig(NamedTuple):
+    period: int
+    overbought: int
+    oversold: int
+
+
+class MACDConfig(NamedTuple):
+    fast: int
+    slow: int
+    signal: int
+
+
+class StochasticConfig(NamedTuple):
+    k: int
+    d: int
+    smooth: int
+
+
+class BollingerConfig(NamedTuple):
+    period: int
+    std_dev: float
+
+
+class ATRConfig(NamedTuple):
+    period: int
+
+
+class KeltnerConfig(NamedTuple):
+    period: int
+    atr_mult: float
+
+
+class VolumeMAConfig(NamedTuple):
+    period: int
+
+
+class IndicatorConfig(NamedTuple):
+    sma: Tuple[int, ...]
+    ema: Tuple[int, ...]
+    rsi: RSIConfig
+    macd: MACDConfig
+    stochastic: StochasticConfig
+    bollinger: BollingerConfig
+    atr: ATRConfig
+    keltner: KeltnerConfig
+    volume_ma: VolumeMAConfig
+
+
+INDICATOR_CFG = IndicatorConfig(
+    sma=tuple(INDICATOR_SETTINGS["sma"]),
+    ema=tuple(INDICATOR_SETTINGS["ema"]),
+    rsi=RSIConfig(**INDICATOR_SETTINGS["rsi"]),
+    macd=MACDConfig(**INDICATOR_SETTINGS["macd"]),
+    stochastic=StochasticConfig(**INDICATOR_SETTINGS["stochastic"]),
+    bollinger=BollingerConfig(**INDICATOR_SETTINGS["bollinger"]),
+    atr=ATRConfig(**INDICATOR_SETTINGS["atr"]),
+    keltner=KeltnerConfig(**INDICATOR_SETTINGS["keltner"]),
+    volume_ma=VolumeMAConfig(**INDICATOR_SETTINGS["volume_ma"]),
+)
+
+# Row layout for OHLCV batches fed to indicator code (ts in epoch ms);
+# columns such as batch["c"] are float64 views for numpy/numba/TA-Lib
+OHLCV_DTYPE = np.dtype(
+    [
+        ("ts", "i8"),
+        ("o", "f8"),
+        ("h", "f8"),
+        ("l", "f8"),
+        ("c", "f8"),
+        ("v", "f8"),
+    ]
+)
+
+# Fixed-point scale for prices in trade batches (1e-8, satoshi precision)
+PRICE_SCALE: Final[int] = 10**8
+
 # ============================================================================
 # ICT CONCEPTS
 # ============================================================================
@@ -320,6 +574,18 @@ NEWS_KEYWORDS = [
     "nft",
 ]
 
+# Keywords per news topic (case-insensitive whole words)
+TOPIC_KEYWORDS = {
+    NewsTopic.REGULATION: ("sec", "regulation", "cftc", "mica", "lawsuit", "ban"),
+    NewsTopic.ADOPTION: ("adoption", "etf", "institutional", "treasury"),
+    NewsTopic.TECHNOLOGY: ("upgrade", "mainnet", "testnet", "hard fork", "layer 2"),
+    NewsTopic.PARTNERSHIP: ("partnership", "partners with", "collaboration"),
+    NewsTopic.SECURITY: ("security", "vulnerability", "audit", "exploit"),
+    NewsTopic.MARKET: ("rally", "crash", "volatility", "liquidation", "all-time high"),
+    NewsTopic.HACK: ("hack", "stolen", "drained", "exploit"),
+    NewsTopic.LISTING: ("listing", "delist", "launchpool"),
+}
+
 # ============================================================================
 # NOTIFICATION SETTINGS
 # ============================================================================
@@ -357,8 +623,9 @@ LOG_LEVELS = {
     "CRITICAL": 50,
 }
 
-LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# "json" (structlog + orjson, one object per line) or "console";
+# see log_config.configure_logging
+LOG_RENDERER = "json"
 
 # ============================================================================
 # SYSTEM SETTINGS
@@ -415,3 +682,78 @@ SUCCESS_MESSAGES = {
     "model_trained": "Model trained successfully",
     "data_collected": "Data collected successfully",
 }
+
+# ============================================================================
+# READ-ONLY VIEWS
+# ============================================================================
+# Bound str.format per Redis key template: REDIS_KEY_FORMATTERS["price_cache"]
+# (symbol=s, timeframe=t) skips the dict lookup + attribute fetch per key.
+REDIS_KEY_FORMATTERS = MappingProxyType(
+    {name: template.format for name, template in REDIS_KEYS.items()}
+)
+
+
+def _compile_key_builder(name: str, template: str):
+    """Compile a key template into a function returning an f-string."""
+    fields = []
+    for _, field, _, _ in Formatter().parse(template):
+        if field and field not in fields:
+            fields.append(field)
+    source = f"def {name}({', '.join(fields)}):\n    return f{template!r}\n"
+    namespace = {}
+    exec(compile(source, f"<redis key {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+# Positional key builders for hot loops: REDIS_KEY_BUILDERS["price_cache"]
+# (symbol, timeframe). Each is a compiled f-string, so building a key is a
+# single BUILD_STRING instead of parsing the template on every call.
+REDIS_KEY_BUILDERS = MappingProxyType(
+    {
+        name: _compile_key_builder(name, template)
+        for name, template in REDIS_KEYS.items()
+    }
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only deep copy: dicts become MappingProxyType, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Tables are shared by every importer; expose them read-only all the way
+# down so a stray assignment (INDICATOR_SETTINGS["rsi"]["period"] = 99) or
+# append can't change settings for the whole process.
+API_ENDPOINTS = _freeze(API_ENDPOINTS)
+DATABASE_NAMES = _freeze(DATABASE_NAMES)
+MYSQL_TABLES = _freeze(MYSQL_TABLES)
+TIMESCALE_TABLES = _freeze(TIMESCALE_TABLES)
+TIMESCALE_WRITE_CONFIG = _freeze(TIMESCALE_WRITE_CONFIG)
+TIMESCALE_HYPERTABLE_CONFIG = _freeze(TIMESCALE_HYPERTABLE_CONFIG)
+TIMESCALE_INDEXES = _freeze(TIMESCALE_INDEXES)
+RABBITMQ_EXCHANGES = _freeze(RABBITMQ_EXCHANGES)
+RABBITMQ_QUEUES = _freeze(RABBITMQ_QUEUES)
+RABBITMQ_ROUTING_KEYS = _freeze(RABBITMQ_ROUTING_KEYS)
+RABBITMQ_PREFETCH = _freeze(RABBITMQ_PREFETCH)
+RABBITMQ_PERSISTENCE = _freeze(RABBITMQ_PERSISTENCE)
+REDIS_KEYS = _freeze(REDIS_KEYS)
+REDIS_TTL = _freeze(REDIS_TTL)
+RISK_LIMITS = _freeze(RISK_LIMITS)
+POSITION_SIZING = _freeze(POSITION_SIZING)
+SIGNAL_THRESHOLDS = _freeze(SIGNAL_THRESHOLDS)
+INDICATOR_SETTINGS = _freeze(INDICATOR_SETTINGS)
+ICT_SETTINGS = _freeze(ICT_SETTINGS)
+ML_MODEL_PATHS = _freeze(ML_MODEL_PATHS)
+ML_MODEL_SETTINGS = _freeze(ML_MODEL_SETTINGS)
+NEWS_SOURCES = _freeze(NEWS_SOURCES)
+TOPIC_KEYWORDS = _freeze(TOPIC_KEYWORDS)
+NOTIFICATION_SETTINGS = _freeze(NOTIFICATION_SETTINGS)
+LOG_LEVELS = _freeze(LOG_LEVELS)
+SYSTEM_SETTINGS = _freeze(SYSTEM_SETTINGS)
+VALIDATION_RULES = _freeze(VALIDATION_RULES)
+ERROR_MESSAGES = _freeze(ERROR_MESSAGES)
+SUCCESS_MESSAGES = _freeze(SUCCESS_MESSAGES)
@@ -0,0 +1,16 @@
+"""
+Shared Field Constraints
+Reusable constrained number types for model fields
+"""
+
+from typing import Annotated
+
+from pydantic import Field
+
+# One alias per bound pair, so every model field with the same bounds shares
+# a single annotation instead of building its own Field(ge=..., le=...)
+UnitFloat = Annotated[float, Field(ge=0, le=1)]
+BipolarFloat = Annotated[float, Field(ge=-1, le=1)]
+Percent = Annotated[float, Field(ge=0, le=100)]
+Score100 = Annotated[int, Field(ge=0, le=100)]
+Rating1to5 = Annotated[int, Field(ge=1, le=5)]
@@ -3,7 +3,10 @@ Shared Enumerations
 All system-wide enums used across bots
 """
 
+import sys
 from enum import Enum, IntEnum
+from functools import cache
+from typing import Literal, get_args
 
 # ============================================================================
 # SIGNAL ENUMS
@@ -503,15 +506,89 @@ class ErrorSeverity(str, Enum):
     CRITICAL = "critical"
 
 
+# ============================================================================
+# LITERAL ALIASES
+# ============================================================================
+# Model fields use these instead of the Enum classes: pydantic-core checks a
+# literal against its value set directly and stores the plain value, which
+# still compares equal to the member (BotStatus.RUNNING == "running").
+
+NewsImpactT = Literal[1, 3, 5, 7, 9, 10]
+SentimentScoreT = Literal[
+    "very_bearish", "bearish", "neutral", "bullish", "very_bullish"
+]
+TradeOutcomeT = Literal[
+    "win",
+    "loss",
+    "break_even",
+    "partial_win",
+    "partial_loss",
+    "stopped_out",
+    "taken_profit",
+]
+BotStatusT = Literal[
+    "starting", "running", "paused", "stopped", "error", "maintenance"
+]
+ValidationStatusT = Literal["passed", "failed", "warning", "pending"]
+NotificationChannelT = Literal[
+    "telegram", "discord", "email", "sms", "webhook", "push"
+]
+
+_LITERAL_ALIASES = (
+    (NewsImpactT, NewsImpact),
+    (SentimentScoreT, SentimentScore),
+    (TradeOutcomeT, TradeOutcome),
+    (BotStatusT, BotStatus),
+    (ValidationStatusT, ValidationStatus),
+    (NotificationChannelT, NotificationChannel),
+)
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Enum class -> frozenset of its values, filled on first use
+_ENUM_VALUES_CACHE = {}
+
+
+@cache
 def get_enum_values(enum_class):
-    """Get all values from an enum class"""
-    return [e.value for e in enum_class]
+    """Get all values from an enum class (cached, as a tuple)"""
+    return tuple(e.value for e in enum_class)
 
 
 def is_valid_enum(enum_class, value):
-    """Check if value is valid for enum class"""
-    return value in get_enum_values(enum_class)
\ No newline at end of file
+    """Check if value is valid for enum class (O(1) set lookup)"""
+    values = _ENUM_VALUES_CACHE.get(enum_class)
+    if values is None:
+        values = _ENUM_VALUES_CACHE.setdefault(
+            enum_class, frozenset(get_enum_values(enum_class))
+        )
+    return value in values
+
+
+def _intern_values(enum_class):
+    """Intern str values (and their lookup keys) so they compare by identity"""
+    for member in enum_class:
+        member._value_ = sys.intern(member._value_)
+    value_map = enum_class._value2member_map_
+    items = list(value_map.items())
+    value_map.clear()
+    value_map.update((sys.intern(key), member) for key, member in items)
+
+
+for _enum_class in list(globals().values()):
+    if (
+        isinstance(_enum_class, type)
+        and issubclass(_enum_class, str)
+        and issubclass(_enum_class, Enum)
+        and _enum_class is not Enum
+    ):
+        _intern_values(_enum_class)
+del _enum_class
+
+for _alias, _enum_class in _LITERAL_ALIASES:
+    if get_args(_alias) != get_enum_values(_enum_class):
+        raise TypeError(f"Literal alias out of sync with {_enum_class.__name__}")
+del _alias, _enum_class
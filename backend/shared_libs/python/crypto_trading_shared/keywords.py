@@ -0,0 +1,161 @@
+"""
+Shared Keyword Matching
+Case-insensitive multi-keyword search compiled once per keyword set
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _collect(keyword_id, start, end, flags, found):
+    """Hyperscan match callback: record the keyword id, keep scanning"""
+    found.add(keyword_id)
+
+
+def _is_word_char(char: str) -> bool:
+    """ASCII word character, as Hyperscan's \\b and re.ASCII define it"""
+    return char.isascii() and (char.isalnum() or char == "_")
+
+
+def _at_boundary(text: str, pos: int) -> bool:
+    """Whether a \\b word boundary lies before text[pos]"""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class KeywordMatcher:
+    """
+    Substring search for a fixed set of keywords
+
+    The keywords are compiled once into the fastest available backend:
+    a Hyperscan database (SIMD literal matching, one report per keyword),
+    else an Aho-Corasick automaton (pyahocorasick), else ``in`` per keyword.
+    Either way a text is scanned once regardless of the keyword count, and
+    matching is on lowercased text, like ``keyword in text.lower()``.
+
+    With ``whole_words`` a keyword only matches between word boundaries
+    (regex ``\\b``, ASCII word characters), so "sec" does not hit "second".
+
+    Hyperscan scans share one scratch space per matcher, so a matcher must
+    not be used from several threads at once (asyncio tasks are fine).
+    """
+
+    __slots__ = ("keywords", "values", "whole_words", "_database", "_automaton")
+
+    def __init__(
+        self,
+        keywords: Sequence[str],
+        values: Optional[Sequence] = None,
+        whole_words: bool = False,
+    ):
+        """
+        Args:
+            keywords: Keywords to search for
+            values: Value reported per keyword (defaults to the keyword)
+            whole_words: Only match keywords delimited by word boundaries
+        """
+        self.keywords: Tuple[str, ...] = tuple(k.lower() for k in keywords)
+        self.values: Tuple = tuple(values) if values is not None else self.keywords
+        self.whole_words = whole_words
+        self._database = None
+        self._automaton = None
+
+        if not self.keywords:
+            return
+
+        if HYPERSCAN_AVAILABLE:
+            flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+            database = hyperscan.Database()
+            boundary = r"\b" if whole_words else ""
+            database.compile(
+                expressions=[
+                    (boundary + re.escape(k) + boundary).encode()
+                    for k in self.keywords
+                ],
+                ids=list(range(len(self.keywords))),
+                elements=len(self.keywords),
+                flags=[flags] * len(self.keywords),
+            )
+            self._database = database
+            return
+
+        if AHOCORASICK_AVAILABLE:
+            # A word may be listed more than once (e.g. under two values)
+            positions: Dict[str, List[int]] = {}
+            for i, word in enumerate(self.keywords):
+                positions.setdefault(word, []).append(i)
+
+            automaton = ahocorasick.Automaton()
+            for word, indices in positions.items():
+                automaton.add_word(word, (len(word), tuple(indices)))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def _delimited(self, text: str, start: int, length: int) -> bool:
+        """Whether text[start:start + length] is bounded as whole_words needs"""
+        if not self.whole_words:
+            return True
+        return _at_boundary(text, start) and _at_boundary(text, start + length)
+
+    def _contains(self, text: str, word: str) -> bool:
+        """Plain search for one keyword"""
+        start = text.find(word)
+        while start != -1:
+            if self._delimited(text, start, len(word)):
+                return True
+            start = text.find(word, start + 1)
+        return False
+
+    def indices(self, text: str) -> Set[int]:
+        """Positions of the keywords found in text"""
+        text = text.lower()
+        if self._database is not None:
+            found: Set[int] = set()
+            self._database.scan(
+                text.encode(), match_event_handler=_collect, context=found
+            )
+            return found
+        if self._automaton is None:
+            return {
+                i for i, word in enumerate(self.keywords) if self._contains(text, word)
+            }
+        found = set()
+        for end, (length, indices) in self._automaton.iter(text):
+            if self._delimited(text, end - length + 1, length):
+                found.update(indices)
+        return found
+
+    def find(self, text: str) -> List:
+        """Values of the keywords found in text, deduplicated, in keyword order"""
+        return list(dict.fromkeys(self.values[i] for i in sorted(self.indices(text))))
+
+    def count(self, text: str) -> int:
+        """Number of distinct keywords found in text"""
+        return len(self.indices(text))
+
+    def any(self, text: str) -> bool:
+        """Whether any keyword occurs in text"""
+        if self._database is not None:
+            return bool(self.indices(text))
+        text = text.lower()
+        if self._automaton is None:
+            return any(self._contains(text, word) for word in self.keywords)
+        return any(
+            self._delimited(text, end - length + 1, length)
+            for end, (length, _) in self._automaton.iter(text)
+        )
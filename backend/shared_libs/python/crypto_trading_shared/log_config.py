@@ -0,0 +1,86 @@
+"""
+Shared Logging Configuration
+Structured (structlog) logging rendered to JSON by orjson
+"""
+
+import json
+import logging
+import sys
+
+from .constants import LOG_LEVELS, LOG_RENDERER
+
+try:
+    import structlog
+
+    STRUCTLOG_AVAILABLE = True
+except ImportError:
+    STRUCTLOG_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj, default=None, **kwargs):
+    """Serialize an event dict for JSONRenderer (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=default).decode()
+    return json.dumps(obj, default=default, **kwargs)
+
+
+def configure_logging(level="INFO", renderer=LOG_RENDERER, stream=None):
+    """
+    Configure structlog and route stdlib logging through the same renderer
+
+    Records are rendered as one JSON object per line ("json") or as
+    human-readable console output ("console"). Without structlog installed,
+    falls back to a plain stdlib handler.
+
+    Args:
+        level: Level name from LOG_LEVELS
+        renderer: "json" or "console"
+        stream: Output stream (defaults to stdout)
+    """
+    level_no = LOG_LEVELS.get(level.upper(), logging.INFO)
+    handler = logging.StreamHandler(stream or sys.stdout)
+
+    if STRUCTLOG_AVAILABLE:
+        # Shared by structlog loggers and foreign (stdlib) records
+        pre_chain = [
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+        ]
+        if renderer == "json":
+            final = structlog.processors.JSONRenderer(serializer=_dumps)
+        else:
+            final = structlog.dev.ConsoleRenderer()
+
+        structlog.configure(
+            processors=pre_chain
+            + [structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.make_filtering_bound_logger(level_no),
+            cache_logger_on_first_use=True,
+        )
+        handler.setFormatter(
+            structlog.stdlib.ProcessorFormatter(
+                foreign_pre_chain=pre_chain,
+                processors=[
+                    structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                    final,
+                ],
+            )
+        )
+    else:
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s")
+        )
+
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(level_no)
@@ -0,0 +1,171 @@
+"""
+Shared Settings
+Typed, immutable view of the tunable constants, optionally overridden from TOML
+"""
+
+import os
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Mapping, Optional
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+from .constants import (INDICATOR_CFG, POSITION_SIZING, REDIS_TTL, RISK_LIMITS,
+                        SIGNAL_THRESHOLDS, SYSTEM_SETTINGS, IndicatorConfig)
+
+# Environment variable naming a TOML file that overrides the defaults
+SETTINGS_ENV_VAR = "CRYPTO_SHARED_SETTINGS"
+
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# ============================================================================
+# SECTIONS
+# ============================================================================
+
+
+@dataclass(frozen=True, **_SLOTS)
+class RiskLimits:
+    """Risk management limits (RISK_LIMITS)"""
+
+    min_risk_reward: float
+    max_risk_per_trade: float
+    max_daily_risk: float
+    max_drawdown: float
+    min_win_rate: float
+
+
+@dataclass(frozen=True, **_SLOTS)
+class PositionSizing:
+    """Position sizing bounds (POSITION_SIZING)"""
+
+    default_risk_percent: float
+    min_position_size: float
+    max_position_size: float
+
+
+@dataclass(frozen=True, **_SLOTS)
+class SignalThresholds:
+    """Signal quality thresholds (SIGNAL_THRESHOLDS)"""
+
+    min_confidence: float
+    high_confidence: float
+    very_high_confidence: float
+    weak_strength: float
+    medium_strength: float
+    strong_strength: float
+    min_historical_win_rate: float
+    good_win_rate: float
+    excellent_win_rate: float
+    min_volume_ratio: float
+    high_volume_ratio: float
+
+
+@dataclass(frozen=True, **_SLOTS)
+class RedisTTL:
+    """Redis cache TTLs in seconds (REDIS_TTL)"""
+
+    price_cache: int
+    indicator_cache: int
+    signal_cache: int
+    news_cache: int
+    session: int
+
+
+@dataclass(frozen=True, **_SLOTS)
+class SystemSettings:
+    """System-wide runtime settings (SYSTEM_SETTINGS)"""
+
+    bot_health_check_interval: int
+    signal_expiry: int
+    max_concurrent_signals: int
+    api_timeout: int
+    websocket_reconnect_delay: int
+    max_retries: int
+
+
+@dataclass(frozen=True, **_SLOTS)
+class Settings:
+    """All typed settings sections"""
+
+    risk_limits: RiskLimits
+    position_sizing: PositionSizing
+    signal_thresholds: SignalThresholds
+    redis_ttl: RedisTTL
+    system: SystemSettings
+    indicators: IndicatorConfig
+
+
+# Overridable section -> (dataclass, default values)
+_SECTIONS = {
+    "risk_limits": (RiskLimits, RISK_LIMITS),
+    "position_sizing": (PositionSizing, POSITION_SIZING),
+    "signal_thresholds": (SignalThresholds, SIGNAL_THRESHOLDS),
+    "redis_ttl": (RedisTTL, REDIS_TTL),
+    "system": (SystemSettings, SYSTEM_SETTINGS),
+}
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+
+def build_settings(
+    overrides: Optional[Mapping[str, Mapping[str, Any]]] = None
+) -> Settings:
+    """
+    Build Settings from the constants, with per-section overrides
+
+    Args:
+        overrides: {section: {key: value}}, e.g. parsed TOML tables
+
+    Returns:
+        Settings instance
+
+    Raises:
+        ValueError: Unknown section or key in overrides
+    """
+    overrides = overrides or {}
+    unknown = set(overrides) - set(_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown settings sections: {sorted(unknown)}")
+
+    sections: Dict[str, Any] = {}
+    for name, (section_class, defaults) in _SECTIONS.items():
+        values = {**defaults, **overrides.get(name, {})}
+        unknown = set(values) - {f.name for f in fields(section_class)}
+        if unknown:
+            raise ValueError(f"Unknown keys in [{name}]: {sorted(unknown)}")
+        sections[name] = section_class(**values)
+
+    return Settings(indicators=INDICATOR_CFG, **sections)
+
+
+def load_settings(path: Optional[str] = None) -> Settings:
+    """
+    Load Settings, applying a TOML override file if given
+
+    Args:
+        path: TOML file with [risk_limits], [redis_ttl], ... tables
+
+    Returns:
+        Settings instance
+    """
+    if not path:
+        return build_settings()
+    if tomllib is None:
+        raise ImportError("Reading TOML settings requires tomli on Python < 3.11")
+    with open(path, "rb") as f:
+        return build_settings(tomllib.load(f))
+
+
+# Loaded once at import; SETTINGS.risk_limits.min_risk_reward
+SETTINGS = load_settings(os.environ.get(SETTINGS_ENV_VAR))
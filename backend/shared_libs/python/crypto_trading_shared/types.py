@@ -3,61 +3,168 @@ Shared Type Definitions
 All system-wide type definitions and data classes
 """
 
+import sys
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property, lru_cache
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
+from typing import (Any, Dict, Final, Generic, List, Optional, Sequence, Tuple,
+                    Type, TypeVar, Union)
+
+import msgspec
+import numpy as np
+from pydantic import (BaseModel, ConfigDict, Field, RootModel, TypeAdapter,
+                      computed_field, field_serializer, field_validator,
+                      model_validator)
+
+from .constants import OHLCV_DTYPE, PRICE_SCALE, VALIDATION_CACHE_SIZE
+from .constraints import (BipolarFloat, Percent, Rating1to5, Score100,
+                          UnitFloat)
+from .enums import (BotStatusT, MarketRegime, NewsImpactT, NotificationChannelT,
+                    PatternType, SentimentScoreT, SignalSource, SignalStatus,
+                    SignalStrength, SignalType, TimeFrameEnum, TradeOutcome,
+                    TradeOutcomeT, ValidationStatusT)
+from .settings import SETTINGS
 
-from pydantic import BaseModel, Field, validator
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson flags for FastModel.to_json, resolved once
+_ORJSON_OPTION: Final[int] = orjson.OPT_SERIALIZE_NUMPY if ORJSON_AVAILABLE else 0
+
+# Resolved once from SETTINGS (so TOML overrides apply); validators read a
+# plain module global instead of a literal or an attribute chain
+_MIN_RR: Final[float] = SETTINGS.risk_limits.min_risk_reward
 
-from .enums import (BotStatus, MarketRegime, NewsImpact, NotificationChannel,
-                    PatternType, SentimentScore, SignalSource, SignalStatus,
-                    SignalStrength, SignalType, TimeFrameEnum, TradeOutcome,
-                    ValidationStatus)
+
+# ============================================================================
+# BASE MODEL
+# ============================================================================
+
+
+def _decimal_to_float(value: Union[Decimal, Dict[str, Decimal]]):
+    """JSON field serializer: Decimal (or dict of Decimals) as float"""
+    if isinstance(value, dict):
+        return {k: float(v) for k, v in value.items()}
+    return float(value)
+
+
+# Shared by every model: immutable after validation (no assignment
+# bookkeeping), unknown keys dropped without collecting them, nested model
+# instances and field defaults taken as-is instead of revalidated
+BASE_CONFIG = ConfigDict(
+    frozen=True,
+    extra="ignore",
+    populate_by_name=True,
+    arbitrary_types_allowed=False,
+    validate_assignment=False,
+    revalidate_instances="never",
+    validate_default=False,
+    ser_json_timedelta="iso8601",
+)
+
+# Transport types (queue messages, API and health payloads): datetimes are
+# written by pydantic-core as epoch seconds instead of ISO 8601 strings.
+# ser_json_temporal needs pydantic >= 2.12; older versions ignore the key.
+TRANSPORT_CONFIG = ConfigDict(BASE_CONFIG, ser_json_temporal="seconds")
+
+
+def _intern_strings(value: Union[None, str, Tuple[str, ...]]):
+    """Field validator: intern strings drawn from a small vocabulary"""
+    if not value:
+        return value
+    if isinstance(value, str):
+        return sys.intern(value)
+    return tuple(sys.intern(item) for item in value)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode the types orjson does not handle natively (Decimal as float)"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastModel(BaseModel):
+    """Base model with a C-serialized JSON dump for publishers"""
+
+    model_config = BASE_CONFIG
+
+    def to_json(self, **kwargs: Any) -> bytes:
+        """
+        Serialize to JSON bytes (orjson; datetimes as ISO 8601)
+
+        Models on TRANSPORT_CONFIG are dumped by pydantic-core instead, so
+        their datetimes come out as epoch seconds.
+
+        Args:
+            kwargs: model_dump options (include, exclude, exclude_none, ...)
+        """
+        if not ORJSON_AVAILABLE or "ser_json_temporal" in self.model_config:
+            return self.model_dump_json(**kwargs).encode()
+        # Common case: no options, skip building a kwargs mapping
+        data = self.model_dump(**kwargs) if kwargs else self.model_dump()
+        return orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTION)
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "FastModel":
+        """
+        Copy the model, dropping cached_property values when fields change
+
+        pydantic copies the instance __dict__, which also holds the values
+        cached from the old fields; they are recomputed on first access.
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in copy.__dict__.keys() - type(self).model_fields.keys():
+                del copy.__dict__[name]
+        return copy
 
 # ============================================================================
 # PRICE DATA TYPES
 # ============================================================================
 
 
-class PriceData(BaseModel):
+class PriceData(FastModel):
     """Basic price data"""
 
     symbol: str
-    price: Decimal
+    price: float
     timestamp: datetime
-    volume: Optional[Decimal] = None
+    volume: Optional[float] = None
     exchange: Optional[str] = None
 
-    class Config:
-        json_encoders = {Decimal: lambda v: float(v), datetime: lambda v: v.isoformat()}
-
 
-class OHLCVData(BaseModel):
+class OHLCVData(FastModel):
     """OHLCV candlestick data"""
 
     symbol: str
     timeframe: TimeFrameEnum
     timestamp: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
-    volume: Decimal
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
     exchange: Optional[str] = None
 
-    @validator("high")
-    def high_must_be_highest(cls, v, values):
-        if "low" in values and v < values["low"]:
+    @model_validator(mode="after")
+    def high_must_be_highest(self):
+        if self.high < self.low:
             raise ValueError("High must be >= Low")
-        return v
-
-    class Config:
-        json_encoders = {Decimal: lambda v: float(v), datetime: lambda v: v.isoformat()}
+        return self
 
 
 class OrderBookData(BaseModel):
     """Order book snapshot"""
 
+    model_config = BASE_CONFIG
+
     symbol: str
     timestamp: datetime
     bids: List[tuple[Decimal, Decimal]]  # [(price, size), ...]
@@ -70,7 +177,7 @@ class OrderBookData(BaseModel):
 # ============================================================================
 
 
-class IndicatorData(BaseModel):
+class IndicatorData(FastModel):
     """Technical indicator data"""
 
     symbol: str
@@ -80,13 +187,16 @@ class IndicatorData(BaseModel):
     value: Union[Decimal, Dict[str, Decimal]]
     signal: Optional[str] = None
 
-    class Config:
-        json_encoders = {Decimal: lambda v: float(v), datetime: lambda v: v.isoformat()}
+    serialize_decimals = field_serializer("value", when_used="json-unless-none")(
+        _decimal_to_float
+    )
 
 
 class MultiTimeframeIndicators(BaseModel):
     """Indicators across multiple timeframes"""
 
+    model_config = BASE_CONFIG
+
     symbol: str
     timestamp: datetime
     indicators: Dict[TimeFrameEnum, Dict[str, Any]]
@@ -97,43 +207,50 @@ class MultiTimeframeIndicators(BaseModel):
 # ============================================================================
 
 
-class TradeLevels(BaseModel):
+class TradeLevels(FastModel):
     """Trade entry, stop loss, and take profit levels"""
 
-    entry_price: Decimal
-    stop_loss: Decimal
-    take_profit: Decimal
-    risk_amount: Optional[Decimal] = None
-    reward_amount: Optional[Decimal] = None
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    risk_amount: Optional[float] = None
+    reward_amount: Optional[float] = None
 
-    @property
+    @computed_field(repr=False)
+    @cached_property
     def risk_reward_ratio(self) -> float:
-        """Calculate risk/reward ratio"""
+        """Calculate risk/reward ratio (once per instance; levels are frozen)"""
         risk = abs(self.entry_price - self.stop_loss)
         reward = abs(self.take_profit - self.entry_price)
-        return float(reward / risk) if risk > 0 else 0
+        return reward / risk if risk else 0.0
 
-    class Config:
-        json_encoders = {Decimal: lambda v: float(v)}
+    @computed_field(repr=False)
+    @cached_property
+    def is_valid_rr(self) -> bool:
+        """Whether the ratio meets the minimum (SETTINGS.risk_limits)"""
+        return self.risk_reward_ratio >= _MIN_RR
 
 
 class RiskRewardRatio(BaseModel):
     """Risk/Reward ratio calculation"""
 
+    model_config = BASE_CONFIG
+
     risk: Decimal
     reward: Decimal
     ratio: float
-    is_valid: bool = True
-
-    @validator("is_valid", always=True)
-    def validate_ratio(cls, v, values):
-        """Ensure minimum 1:4 RR ratio"""
-        if "ratio" in values:
-            return values["ratio"] >= 4.0
+    is_valid: bool = Field(default=True, validate_default=True)
+
+    @field_validator("is_valid")
+    @classmethod
+    def validate_ratio(cls, v, info):
+        """Ensure minimum RR ratio (1:4 by default)"""
+        if "ratio" in info.data:
+            return info.data["ratio"] >= _MIN_RR
         return False
 
 
-class SignalData(BaseModel):
+class SignalData(FastModel):
     """Trading signal data"""
 
     signal_id: str
@@ -141,7 +258,7 @@ class SignalData(BaseModel):
     signal_type: SignalType
     signal_source: SignalSource
     strength: SignalStrength
-    confidence: float = Field(ge=0, le=100)
+    confidence: Percent
     timeframe: TimeFrameEnum
     timestamp: datetime
 
@@ -161,7 +278,7 @@ class SignalData(BaseModel):
     patterns: Optional[List[str]] = None
 
     # Validation
-    validation_status: ValidationStatus
+    validation_status: ValidationStatusT
     validation_reasons: Optional[List[str]] = None
 
     # Historical performance
@@ -178,20 +295,20 @@ class SignalData(BaseModel):
     description: Optional[str] = None
     tags: Optional[List[str]] = None
 
-    @validator("confidence")
-    def confidence_range(cls, v):
-        if not 0 <= v <= 100:
-            raise ValueError("Confidence must be between 0 and 100")
-        return v
-
-    @validator("risk_reward_ratio")
+    @field_validator("risk_reward_ratio")
+    @classmethod
     def validate_rr(cls, v):
-        if v < 4.0:
-            raise ValueError("Risk/Reward ratio must be at least 1:4")
+        if v < _MIN_RR:
+            raise ValueError(f"Risk/Reward ratio must be at least 1:{_MIN_RR:g}")
         return v
 
-    class Config:
-        json_encoders = {Decimal: lambda v: float(v), datetime: lambda v: v.isoformat()}
+    serialize_decimals = field_serializer(
+        "entry_price",
+        "stop_loss",
+        "take_profit",
+        "position_size",
+        when_used="json-unless-none",
+    )(_decimal_to_float)
 
 
 # ============================================================================
@@ -199,7 +316,7 @@ class SignalData(BaseModel):
 # ============================================================================
 
 
-class NewsData(BaseModel):
+class NewsData(FastModel):
     """News article data"""
 
     news_id: str
@@ -211,31 +328,35 @@ class NewsData(BaseModel):
     collected_at: datetime
 
     # Impact & Sentiment
-    impact: NewsImpact
-    sentiment: SentimentScore
-    sentiment_score: float = Field(ge=-1, le=1)
+    impact: NewsImpactT
+    sentiment: SentimentScoreT
+    sentiment_score: BipolarFloat
 
     # Related
-    symbols: List[str] = []
-    topics: List[str] = []
-    keywords: List[str] = []
+    symbols: Tuple[str, ...] = ()
+    topics: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
 
     # Metadata
     author: Optional[str] = None
     language: Optional[str] = "en"
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    # Symbols, topics and sources repeat across millions of articles
+    intern_strings = field_validator(
+        "source", "symbols", "topics", "keywords", "language"
+    )(_intern_strings)
 
 
 class SentimentData(BaseModel):
     """Sentiment analysis result"""
 
+    model_config = BASE_CONFIG
+
     symbol: str
     timestamp: datetime
-    sentiment: SentimentScore
-    sentiment_score: float = Field(ge=-1, le=1)
-    confidence: float = Field(ge=0, le=1)
+    sentiment: SentimentScoreT
+    sentiment_score: BipolarFloat
+    confidence: UnitFloat
 
     # Aggregated from multiple sources
     source_count: int
@@ -247,13 +368,15 @@ class SentimentData(BaseModel):
     recent_sentiment: Optional[float] = None
     trending: Optional[str] = None  # "improving", "declining", "stable"
 
+    intern_strings = field_validator("symbol", "trending")(_intern_strings)
+
 
 # ============================================================================
 # PERFORMANCE TYPES
 # ============================================================================
 
 
-class TradeResult(BaseModel):
+class TradeResult(FastModel):
     """Result of a completed trade"""
 
     trade_id: str
@@ -268,7 +391,7 @@ class TradeResult(BaseModel):
     exit_time: datetime
 
     # Outcome
-    outcome: TradeOutcome
+    outcome: TradeOutcomeT
     profit_loss: Decimal
     profit_loss_percent: float
 
@@ -282,11 +405,21 @@ class TradeResult(BaseModel):
     duration_minutes: int
     notes: Optional[str] = None
 
-    class Config:
-        json_encoders = {Decimal: lambda v: float(v), datetime: lambda v: v.isoformat()}
+    serialize_decimals = field_serializer(
+        "entry_price",
+        "exit_price",
+        "profit_loss",
+        "stop_loss",
+        "take_profit",
+        "position_size",
+        when_used="json-unless-none",
+    )(_decimal_to_float)
 
+    # Many trades reference one signal; share its id string
+    intern_strings = field_validator("signal_id", "symbol")(_intern_strings)
 
-class PerformanceMetrics(BaseModel):
+
+class PerformanceMetrics(FastModel):
     """Performance metrics"""
 
     total_trades: int
@@ -294,17 +427,12 @@ class PerformanceMetrics(BaseModel):
     losing_trades: int
     break_even_trades: int
 
-    # Win Rate
-    win_rate: float
-    loss_rate: float
-
     # Profit/Loss
     total_profit: Decimal
     total_loss: Decimal
     net_profit: Decimal
 
     # Ratios
-    profit_factor: float  # Total profit / Total loss
     avg_win: Decimal
     avg_loss: Decimal
     avg_rr_ratio: float
@@ -323,8 +451,215 @@ class PerformanceMetrics(BaseModel):
     period_start: datetime
     period_end: datetime
 
-    class Config:
-        json_encoders = {Decimal: lambda v: float(v), datetime: lambda v: v.isoformat()}
+    # Derived from the counts and totals above (serialized, never parsed;
+    # extra="ignore" drops them from inbound payloads)
+    @computed_field
+    @cached_property
+    def win_rate(self) -> float:
+        """Winning share of all trades, in %"""
+        if not self.total_trades:
+            return 0.0
+        return 100.0 * self.winning_trades / self.total_trades
+
+    @computed_field
+    @cached_property
+    def loss_rate(self) -> float:
+        """Losing share of all trades, in %"""
+        if not self.total_trades:
+            return 0.0
+        return 100.0 * self.losing_trades / self.total_trades
+
+    @computed_field
+    @cached_property
+    def profit_factor(self) -> float:
+        """Total profit / total loss (inf with profit and no loss)"""
+        if not self.total_loss:
+            return float("inf") if self.total_profit > 0 else 0.0
+        return float(self.total_profit / self.total_loss)
+
+    serialize_decimals = field_serializer(
+        "total_profit",
+        "total_loss",
+        "net_profit",
+        "avg_win",
+        "avg_loss",
+        when_used="json-unless-none",
+    )(_decimal_to_float)
+
+
+# TradeResultBatch.outcome codes: position in TradeOutcome
+_TRADE_OUTCOMES = tuple(TradeOutcome)
+_OUTCOME_CODES = {
+    outcome.value: code for code, outcome in enumerate(_TRADE_OUTCOMES)
+}
+
+# TradeResultBatch.direction: +1 long, -1 short
+_DIRECTIONS = {
+    SignalType.BUY: 1,
+    SignalType.LONG: 1,
+    SignalType.SELL: -1,
+    SignalType.SHORT: -1,
+}
+
+
+def _longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of True in a boolean array"""
+    if not mask.any():
+        return 0
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    return int((np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)).max())
+
+
+@dataclass(frozen=True, eq=False)
+class TradeResultBatch:
+    """
+    Column (SoA) view of a list of TradeResult for batch analytics
+
+    Prices are int64 fixed-point (price * PRICE_SCALE), P/L is float64,
+    direction is int8 (+1 long, -1 short) and outcomes are int8 codes into
+    TradeOutcome. Rows keep the order of the trades passed in, which should
+    be exit order for drawdown and streaks.
+    """
+
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    direction: np.ndarray
+    pl: np.ndarray
+    pl_percent: np.ndarray
+    risk_reward: np.ndarray
+    outcome: np.ndarray
+
+    @classmethod
+    def from_trades(cls, trades: Sequence[TradeResult]) -> "TradeResultBatch":
+        """Convert per-trade models to columns"""
+        n = len(trades)
+        return cls(
+            entry_price=np.fromiter(
+                (round(t.entry_price * PRICE_SCALE) for t in trades), np.int64, n
+            ),
+            exit_price=np.fromiter(
+                (round(t.exit_price * PRICE_SCALE) for t in trades), np.int64, n
+            ),
+            direction=np.fromiter(
+                (_DIRECTIONS[t.signal_type] for t in trades), np.int8, n
+            ),
+            pl=np.fromiter((t.profit_loss for t in trades), np.float64, n),
+            pl_percent=np.fromiter(
+                (t.profit_loss_percent for t in trades), np.float64, n
+            ),
+            risk_reward=np.fromiter(
+                (t.actual_risk_reward for t in trades), np.float64, n
+            ),
+            outcome=np.fromiter(
+                (_OUTCOME_CODES[t.outcome] for t in trades), np.int8, n
+            ),
+        )
+
+    def __len__(self) -> int:
+        return self.pl.shape[0]
+
+    @property
+    def price_move(self) -> np.ndarray:
+        """Exact favorable price move per trade, in 1 / PRICE_SCALE units"""
+        return self.direction * (self.exit_price - self.entry_price)
+
+    def pl_mismatches(self) -> np.ndarray:
+        """
+        Rows whose P/L sign disagrees with the direction of the price move
+
+        Catches trades recorded with the wrong side or prices, and trades
+        whose fees turned a favorable move into a loss.
+
+        Returns:
+            Row indices, ascending
+        """
+        return np.flatnonzero(np.sign(self.pl) != np.sign(self.price_move))
+
+    @property
+    def win_rate(self) -> float:
+        """Share of trades with positive P/L, in %"""
+        return float((self.pl > 0).mean() * 100.0) if len(self) else 0.0
+
+    @property
+    def max_drawdown(self) -> float:
+        """Deepest fall of cumulative P/L below its running peak"""
+        if not len(self):
+            return 0.0
+        equity = np.concatenate(([0.0], np.cumsum(self.pl)))
+        return float((np.maximum.accumulate(equity) - equity).max())
+
+    @property
+    def max_drawdown_percent(self) -> float:
+        """Deepest drawdown of the compounded per-trade returns, in %"""
+        if not len(self):
+            return 0.0
+        equity = np.concatenate(([1.0], np.cumprod(1.0 + self.pl_percent * 0.01)))
+        peak = np.maximum.accumulate(equity)
+        return float(((peak - equity) / peak).max() * 100.0)
+
+    @property
+    def sharpe_ratio(self) -> Optional[float]:
+        """Mean over (population) std of per-trade returns; None if undefined"""
+        if len(self) < 2:
+            return None
+        std = self.pl_percent.std()
+        return float(self.pl_percent.mean() / std) if std > 0 else None
+
+    def performance_metrics(
+        self, period_start: datetime, period_end: datetime
+    ) -> PerformanceMetrics:
+        """
+        Compute PerformanceMetrics with array reductions
+
+        Args:
+            period_start: Start of the reporting period
+            period_end: End of the reporting period
+
+        Returns:
+            PerformanceMetrics for the trades in this batch
+        """
+        pl = self.pl
+        total = len(self)
+        wins = pl > 0
+        losses = pl < 0
+        winning = int(wins.sum())
+        losing = int(losses.sum())
+        total_profit = float(pl[wins].sum())
+        total_loss = abs(float(pl[losses].sum()))
+
+        # Streak at the end: +N consecutive wins, -N consecutive losses
+        current_streak = 0
+        if total and pl[-1] != 0:
+            sign = np.sign(pl)
+            last = sign[-1]
+            breaks = np.flatnonzero(sign != last)
+            run = total - (breaks[-1] + 1 if breaks.size else 0)
+            current_streak = int(run * last)
+
+        return PerformanceMetrics(
+            total_trades=total,
+            winning_trades=winning,
+            losing_trades=losing,
+            break_even_trades=total - winning - losing,
+            total_profit=Decimal(str(total_profit)),
+            total_loss=Decimal(str(total_loss)),
+            net_profit=Decimal(str(float(pl.sum()))),
+            avg_win=Decimal(str(total_profit / winning if winning else 0.0)),
+            avg_loss=Decimal(str(total_loss / losing if losing else 0.0)),
+            avg_rr_ratio=float(self.risk_reward.mean()) if total else 0.0,
+            max_drawdown=self.max_drawdown,
+            max_drawdown_percent=self.max_drawdown_percent,
+            sharpe_ratio=self.sharpe_ratio,
+            max_consecutive_wins=_longest_run(wins),
+            max_consecutive_losses=_longest_run(losses),
+            current_streak=current_streak,
+            period_start=period_start,
+            period_end=period_end,
+        )
+
+    def outcomes(self) -> List[TradeOutcome]:
+        """Decode the outcome column back to TradeOutcome members"""
+        return [_TRADE_OUTCOMES[code] for code in self.outcome.tolist()]
 
 
 # ============================================================================
@@ -332,22 +667,22 @@ class PerformanceMetrics(BaseModel):
 # ============================================================================
 
 
-class BotHealthMetrics(BaseModel):
+class BotHealthMetrics(FastModel):
     """Bot health metrics"""
 
+    model_config = TRANSPORT_CONFIG
+
     bot_name: str
     bot_type: str
-    status: BotStatus
+    status: BotStatusT
 
     # Uptime
     started_at: datetime
     last_heartbeat: datetime
-    uptime_seconds: int
 
     # Performance
     messages_processed: int
     messages_failed: int
-    success_rate: float
     avg_processing_time_ms: float
 
     # Resources
@@ -356,14 +691,28 @@ class BotHealthMetrics(BaseModel):
     disk_usage_percent: Optional[float] = None
 
     # Errors
-    recent_errors: Optional[List[str]] = None
+    recent_errors: Optional[Tuple[str, ...]] = None
     error_count: int = 0
 
     # Health score (0-100)
-    health_score: int = Field(ge=0, le=100)
+    health_score: Score100
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    intern_strings = field_validator("bot_name", "bot_type")(_intern_strings)
+
+    # Derived (serialized, never parsed; extra="ignore" drops them inbound)
+    @computed_field
+    @cached_property
+    def uptime_seconds(self) -> int:
+        """Seconds from start to the last heartbeat"""
+        return int((self.last_heartbeat - self.started_at).total_seconds())
+
+    @computed_field
+    @cached_property
+    def success_rate(self) -> float:
+        """Processed messages that did not fail, in % (100 before any)"""
+        if not self.messages_processed:
+            return 100.0
+        return 100.0 * (1 - self.messages_failed / self.messages_processed)
 
 
 # ============================================================================
@@ -371,7 +720,7 @@ class BotHealthMetrics(BaseModel):
 # ============================================================================
 
 
-class MLModelMetrics(BaseModel):
+class MLModelMetrics(FastModel):
     """ML model performance metrics"""
 
     model_id: str
@@ -403,9 +752,6 @@ class MLModelMetrics(BaseModel):
     predictions_made: int = 0
     prediction_accuracy: Optional[float] = None
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 # ============================================================================
 # FEEDBACK TYPES
@@ -415,6 +761,8 @@ class MLModelMetrics(BaseModel):
 class FeedbackData(BaseModel):
     """User feedback on signal"""
 
+    model_config = BASE_CONFIG
+
     feedback_id: str
     signal_id: str
     user_id: Optional[str] = None
@@ -423,7 +771,7 @@ class FeedbackData(BaseModel):
     trade_result: TradeResult
 
     # Feedback
-    rating: int = Field(ge=1, le=5)
+    rating: Rating1to5
     was_accurate: bool
     comments: Optional[str] = None
 
@@ -434,6 +782,8 @@ class FeedbackData(BaseModel):
 
     submitted_at: datetime
 
+    intern_strings = field_validator("signal_id")(_intern_strings)
+
 
 # ============================================================================
 # VALIDATION TYPES
@@ -443,11 +793,13 @@ class FeedbackData(BaseModel):
 class ValidationResult(BaseModel):
     """Result of signal validation"""
 
+    model_config = BASE_CONFIG
+
     is_valid: bool
-    validation_status: ValidationStatus
-    passed_rules: List[str]
-    failed_rules: List[str]
-    warnings: Optional[List[str]] = None
+    validation_status: ValidationStatusT
+    passed_rules: Tuple[str, ...] = ()
+    failed_rules: Tuple[str, ...] = ()
+    warnings: Optional[Tuple[str, ...]] = None
 
     # Details
     risk_reward_check: bool
@@ -457,20 +809,191 @@ class ValidationResult(BaseModel):
     confluence_score: Optional[float] = None
 
     # Scores
-    overall_score: float = Field(ge=0, le=100)
+    overall_score: Percent
     confidence_adjustment: float = 0.0
 
     validated_at: datetime
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validation_result(
+    symbol: str,
+    minute: datetime,
+    passed_rules: Tuple[str, ...],
+    failed_rules: Tuple[str, ...],
+    fields: Tuple[Tuple[str, Any], ...],
+) -> ValidationResult:
+    """Build a ValidationResult once per key (symbol only scopes the entry)"""
+    return ValidationResult(
+        passed_rules=passed_rules,
+        failed_rules=failed_rules,
+        validated_at=minute,
+        **dict(fields),
+    )
+
+
+def cached_validation_result(
+    symbol: str,
+    timestamp: datetime,
+    passed_rules: Sequence[str],
+    failed_rules: Sequence[str],
+    **fields: Any,
+) -> ValidationResult:
+    """
+    Get a ValidationResult, reusing one built for the same inputs this minute
+
+    Signals generated from one market tick often repeat the same rule
+    outcome. The most recent VALIDATION_CACHE_SIZE results are kept, keyed by
+    symbol, the minute of timestamp, the rule sets (order-insensitive) and
+    the remaining field values. Results are frozen, so hits share one
+    instance, with validated_at set to the start of the minute.
+
+    Args:
+        symbol: Trading pair the signal is for
+        timestamp: Signal time
+        passed_rules: Names of the rules that passed
+        failed_rules: Names of the rules that failed
+        fields: Remaining ValidationResult fields (hashable values)
+
+    Returns:
+        ValidationResult
+    """
+    return _validation_result(
+        symbol,
+        timestamp.replace(second=0, microsecond=0),
+        tuple(sorted(passed_rules)),
+        tuple(sorted(failed_rules)),
+        tuple(sorted(fields.items())),
+    )
+
+
 # ============================================================================
 # MESSAGE TYPES
 # ============================================================================
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
 
 
-class MessagePayload(BaseModel):
+def _epoch_ms(ts: datetime) -> int:
+    return int(ts.timestamp() * 1000)
+
+
+class OHLCVMsg(msgspec.Struct, frozen=True, gc=False):
+    """Compact OHLCV candle for RabbitMQ (msgspec; timestamp in epoch ms)"""
+
+    symbol: str
+    timeframe: str
+    ts: int
+    o: float
+    h: float
+    l: float  # noqa: E741
+    c: float
+    v: float
+    exchange: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, ohlcv: OHLCVData) -> "OHLCVMsg":
+        return cls(
+            ohlcv.symbol,
+            ohlcv.timeframe.value,
+            _epoch_ms(ohlcv.timestamp),
+            ohlcv.open,
+            ohlcv.high,
+            ohlcv.low,
+            ohlcv.close,
+            ohlcv.volume,
+            ohlcv.exchange,
+        )
+
+
+class PriceMsg(msgspec.Struct, frozen=True, gc=False):
+    """Compact price tick for RabbitMQ (msgspec; timestamp in epoch ms)"""
+
+    symbol: str
+    price: float
+    ts: int
+    volume: Optional[float] = None
+    exchange: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, price: PriceData) -> "PriceMsg":
+        return cls(
+            price.symbol,
+            price.price,
+            _epoch_ms(price.timestamp),
+            price.volume,
+            price.exchange,
+        )
+
+
+class IndicatorMsg(msgspec.Struct, frozen=True, gc=False):
+    """Compact indicator value for RabbitMQ (msgspec; timestamp in epoch ms)"""
+
+    symbol: str
+    timeframe: str
+    ts: int
+    name: str
+    value: Union[float, Dict[str, float]]
+    signal: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, indicator: IndicatorData) -> "IndicatorMsg":
+        value = indicator.value
+        if isinstance(value, dict):
+            value = {k: float(v) for k, v in value.items()}
+        else:
+            value = float(value)
+        return cls(
+            indicator.symbol,
+            indicator.timeframe.value,
+            _epoch_ms(indicator.timestamp),
+            indicator.indicator_name,
+            value,
+            indicator.signal,
+        )
+
+
+class MarketDataUpdate(msgspec.Struct, Generic[T], frozen=True, gc=False):
+    """Envelope for market data published to RabbitMQ.
+
+    Consumers decode with ``msgspec.json.Decoder(MarketDataUpdate[OHLCVMsg])``.
+    """
+
+    type: str
+    data: T
+    timestamp: str
+
+
+def ohlcv_batch_from_msgs(
+    msgs: List[OHLCVMsg], out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Pack candles into an OHLCV_DTYPE array (into ``out`` if given)"""
+    n = len(msgs)
+    if out is None:
+        out = np.empty(n, dtype=OHLCV_DTYPE)
+    out[:n] = [(m.ts, m.o, m.h, m.l, m.c, m.v) for m in msgs]
+    return out[:n]
+
+
+def ohlcv_batch_from_models(
+    candles: List[OHLCVData], out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Pack OHLCVData candles into an OHLCV_DTYPE array (into ``out`` if given)"""
+    n = len(candles)
+    if out is None:
+        out = np.empty(n, dtype=OHLCV_DTYPE)
+    out[:n] = [
+        (_epoch_ms(c.timestamp), c.open, c.high, c.low, c.close, c.volume)
+        for c in candles
+    ]
+    return out[:n]
+
+
+class MessagePayload(FastModel):
     """Generic message payload for RabbitMQ"""
 
+    model_config = TRANSPORT_CONFIG
+
     message_id: str
     message_type: str
     timestamp: datetime
@@ -478,15 +1001,14 @@ class MessagePayload(BaseModel):
     source: str
     priority: Optional[int] = 5
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
-class NotificationMessage(BaseModel):
+class NotificationMessage(FastModel):
     """Notification message"""
 
+    model_config = TRANSPORT_CONFIG
+
     notification_id: str
-    channel: NotificationChannel
+    channel: NotificationChannelT
     recipient: str
     subject: str
     message: str
@@ -501,8 +1023,111 @@ class NotificationMessage(BaseModel):
     send_at: Optional[datetime] = None
     sent_at: Optional[datetime] = None
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    intern_strings = field_validator("signal_id")(_intern_strings)
+
+
+# Encoded msgpack nil, the body of an absent Raw field
+_MSGPACK_NIL = msgspec.Raw(b"\xc0")
+
+
+class MessagePayloadMsg(msgspec.Struct, frozen=True):
+    """
+    MessagePayload on the wire (msgpack via encode_msgpack)
+
+    data stays msgpack-encoded (msgspec.Raw) when the envelope is decoded, so
+    routers that only read message_type/priority never parse the body and
+    re-encoding forwards it byte for byte. Consumers call decode_data().
+    """
+
+    message_id: str
+    message_type: str
+    timestamp: datetime
+    data: msgspec.Raw
+    source: str
+    priority: Optional[int] = 5
+
+    def decode_data(self, data_type: Any = Dict[str, Any]) -> Any:
+        """Decode and validate the body as data_type"""
+        return msgspec.msgpack.decode(self.data, type=data_type)
+
+    @classmethod
+    def from_model(cls, payload: MessagePayload) -> "MessagePayloadMsg":
+        return cls(
+            payload.message_id,
+            payload.message_type,
+            payload.timestamp,
+            msgspec.Raw(_MSGPACK_ENCODER.encode(payload.data)),
+            payload.source,
+            payload.priority,
+        )
+
+
+class NotificationMsg(msgspec.Struct, frozen=True):
+    """
+    NotificationMessage on the wire (msgpack via encode_msgpack)
+
+    attachments stays msgpack-encoded like MessagePayloadMsg.data; only the
+    sender that delivers them calls decode_attachments().
+    """
+
+    notification_id: str
+    channel: NotificationChannelT
+    recipient: str
+    subject: str
+    message: str
+    created_at: datetime
+    priority: str = "medium"
+    attachments: msgspec.Raw = _MSGPACK_NIL
+    signal_id: Optional[str] = None
+    send_at: Optional[datetime] = None
+    sent_at: Optional[datetime] = None
+
+    def decode_attachments(self) -> Optional[List[Dict[str, Any]]]:
+        """Decode and validate the attachments"""
+        return msgspec.msgpack.decode(
+            self.attachments, type=Optional[List[Dict[str, Any]]]
+        )
+
+    @classmethod
+    def from_model(cls, notification: NotificationMessage) -> "NotificationMsg":
+        return cls(
+            notification_id=notification.notification_id,
+            channel=notification.channel,
+            recipient=notification.recipient,
+            subject=notification.subject,
+            message=notification.message,
+            created_at=notification.created_at,
+            priority=notification.priority,
+            attachments=msgspec.Raw(
+                _MSGPACK_ENCODER.encode(notification.attachments)
+            ),
+            signal_id=notification.signal_id,
+            send_at=notification.send_at,
+            sent_at=notification.sent_at,
+        )
+
+
+# msgpack codecs for the bus; datetimes use msgpack's native timestamp type.
+# AMQP frames every message, so bodies carry no length prefix.
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+_MESSAGE_PAYLOAD_DECODER = msgspec.msgpack.Decoder(MessagePayloadMsg)
+_NOTIFICATION_DECODER = msgspec.msgpack.Decoder(NotificationMsg)
+
+
+def encode_msgpack(message: Union[MessagePayloadMsg, NotificationMsg]) -> bytes:
+    """Encode a wire struct as a msgpack message body"""
+    return _MSGPACK_ENCODER.encode(message)
+
+
+def decode_message_payload(body: bytes) -> MessagePayloadMsg:
+    """Decode and validate a msgpack MessagePayload body"""
+    return _MESSAGE_PAYLOAD_DECODER.decode(body)
+
+
+def decode_notification(body: bytes) -> NotificationMsg:
+    """Decode and validate a msgpack NotificationMessage body"""
+    return _NOTIFICATION_DECODER.decode(body)
 
 
 # ============================================================================
@@ -510,37 +1135,105 @@ class NotificationMessage(BaseModel):
 # ============================================================================
 
 
-class SystemHealth(BaseModel):
+class SystemHealth(FastModel):
     """Overall system health"""
 
     timestamp: datetime
     is_healthy: bool
-    health_score: int = Field(ge=0, le=100)
+    health_score: Score100
 
-    # Components
-    bots_health: Dict[str, BotHealthMetrics]
+    # Components (one entry per bot; look up by name with health[bot_name])
+    bots_health: List[BotHealthMetrics]
     database_health: bool
     api_health: bool
     queue_health: bool
 
     # Issues
-    critical_issues: List[str] = []
-    warnings: List[str] = []
+    critical_issues: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
 
     # Performance
     total_signals_today: int
     total_trades_today: int
     system_uptime_hours: float
 
+    @cached_property
+    def bots_by_name(self) -> Dict[str, BotHealthMetrics]:
+        """bots_health keyed by bot_name, built on first lookup"""
+        return {bot.bot_name: bot for bot in self.bots_health}
+
+    def __getitem__(self, bot_name: str) -> BotHealthMetrics:
+        return self.bots_by_name[bot_name]
+
+
+class APIResponse(FastModel, Generic[T]):
+    """Standard API response (APIResponse[TradeResult] types the payload)"""
 
-class APIResponse(BaseModel):
-    """Standard API response"""
+    model_config = TRANSPORT_CONFIG
 
     success: bool
     message: str
-    data: Optional[Any] = None
+    data: Optional[T] = None
     error: Optional[str] = None
     timestamp: datetime
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+
+# ============================================================================
+# BATCH SERIALIZATION
+# ============================================================================
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter for List[model], built once per model class"""
+    return TypeAdapter(List[model])
+
+
+def dump_many(model: Type[BaseModel], items: Sequence[BaseModel]) -> bytes:
+    """
+    Serialize a list of models to one JSON array in a single pydantic-core call
+
+    Args:
+        model: Model class of the items (e.g. TradeResult)
+        items: Model instances
+
+    Returns:
+        JSON bytes, identical to joining each item's model_dump_json()
+    """
+    return _list_adapter(model).dump_json(items)
+
+
+def parse_many(model: Type[M], raw: Union[str, bytes]) -> List[M]:
+    """
+    Validate a JSON array of models straight from bytes in pydantic-core
+
+    Use instead of json.loads followed by constructing each model; no
+    intermediate dicts are built.
+
+    Args:
+        model: Model class of the items (e.g. TradeResult)
+        raw: JSON array, e.g. a queue message body
+
+    Returns:
+        Validated model instances
+    """
+    return _list_adapter(model).validate_json(raw)
+
+
+# Root list types for request bodies and endpoints that take a whole batch
+TradeResultList = RootModel[List[TradeResult]]
+SignalDataList = RootModel[List[SignalData]]
+NewsDataList = RootModel[List[NewsData]]
+BotHealthMetricsList = RootModel[List[BotHealthMetrics]]
+
+
+@lru_cache(maxsize=None)
+def response_adapter(data_type: Any) -> TypeAdapter:
+    """TypeAdapter for APIResponse[data_type], built once per payload type"""
+    return TypeAdapter(APIResponse[data_type])
+
+
+# Build the adapters for the bulk-dumped and bulk-parsed types at import
+for _model in (TradeResult, SignalData, NewsData, BotHealthMetrics):
+    _list_adapter(_model)
+del _model